@@ -0,0 +1,102 @@
+"""Compare the learned-format date parser against the original strptime cascade.
+
+Usage: python benchmarks/bench_date_parse.py [--count N] [--repeat N]
+"""
+import argparse
+import os, sys
+import random
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gamechecker.date_parser import DateParser, FALLBACK_DATE_FORMATS, LEAGUE_DATE_FORMATS
+
+YEAR = 2025
+
+# Output formats seen in the wild, weighted towards each league's own format
+SAMPLE_FORMATS = {
+    'nba': ['%a, %b %d, %Y'] * 6 + ['%Y-%m-%d', '%m/%d/%Y', '%B %d, %Y'],
+    'nfl': ['%a, %b %d, %Y'] * 6 + ['%Y-%m-%d', '%A, %b %d, %Y', '%B %d, %Y'],
+    'mlb': ['%A, %b %d'] * 6 + ['%Y-%m-%d', '%m/%d/%Y', '%a, %b %d, %Y'],
+}
+
+
+def legacy_parse_game_date(date_str, league):
+    """The strptime cascade parse_game_date used before the compiled parser."""
+    if not date_str:
+        return None
+
+    pattern = LEAGUE_DATE_FORMATS.get(league, '%Y-%m-%d')
+
+    try:
+        parsed_date = datetime.strptime(date_str, pattern).date()
+        if league == 'mlb' and parsed_date.year == 1900:
+            parsed_date = parsed_date.replace(year=YEAR)
+        return parsed_date
+    except (ValueError, AttributeError):
+        for fallback in FALLBACK_DATE_FORMATS:
+            try:
+                parsed_date = datetime.strptime(date_str, fallback).date()
+                if parsed_date.year == 1900:
+                    parsed_date = parsed_date.replace(year=YEAR)
+                return parsed_date
+            except (ValueError, AttributeError):
+                continue
+
+        return None
+
+
+def make_date_strings(league, count, seed=0):
+    """Build a season's worth of mixed-format date strings for a league."""
+    rng = random.Random(seed)
+    first_day = date(YEAR, 3, 27)
+    date_strs = []
+
+    for _ in range(count):
+        game_date = first_day + timedelta(days=rng.randrange(180))
+        date_strs.append(game_date.strftime(rng.choice(SAMPLE_FORMATS[league])))
+
+    return date_strs
+
+
+def best_time(func, repeat):
+    """Get the best wall time of repeated calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Game date parsing benchmark")
+    parser.add_argument("--count", type=int, default=5000, help="Date strings per league")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per parser (best is reported)")
+    args = parser.parse_args(argv)
+
+    print(f"{'League':<8} {'Parser':<26} {'Time':>10} {'Per string':>12}")
+    print("─" * 60)
+
+    for league in ('nba', 'nfl', 'mlb'):
+        date_strs = make_date_strings(league, args.count)
+        expected = [legacy_parse_game_date(date_str, league) for date_str in date_strs]
+
+        date_parser = DateParser()
+        parsers = [
+            ("strptime cascade", lambda: [legacy_parse_game_date(date_str, league) for date_str in date_strs]),
+            ("learned format", lambda: [date_parser.parse(date_str, league, YEAR) for date_str in date_strs]),
+            ("parse_game_dates (bulk)", lambda: date_parser.parse_many(date_strs, league, YEAR)),
+        ]
+
+        for name, run in parsers:
+            assert run() == expected, f"{name} disagrees with the strptime cascade"
+            best = best_time(run, args.repeat)
+            print(f"{league.upper():<8} {name:<26} {best * 1000:>8.2f}ms {best / len(date_strs) * 1e6:>10.2f}µs")
+        print()
+
+
+if __name__ == "__main__":
+    main()
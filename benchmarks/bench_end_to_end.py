@@ -0,0 +1,251 @@
+"""Time game_checker end to end against ESPN schedule payloads for 1, 5 and all teams.
+
+The payloads come from FixtureLibrary. No recordings are committed, so unless
+some were recorded locally with benchmarks/fixtures.py, every scenario runs
+against synthetic seasons; the output says which.
+
+Each scenario runs with an empty schedule cache and no season index, so every
+run goes through the full fetch path. Requests are answered by FixtureAdapter
+instead of the network and the rate limiter is lifted, so the timings measure
+the checker's own work rather than ESPN's. The run fails (exit status 1) if any
+scenario is slower, sends more requests or peaks higher in memory than
+benchmarks/thresholds.json allows.
+
+Usage: python benchmarks/bench_end_to_end.py [--league nba,nfl,mlb] [--repeat N] [--latency SECONDS]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os, sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import timedelta
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import FixtureAdapter, FixtureLibrary
+from constants import SUPPORTED_LEAGUES
+from gamechecker import game_checker as checker
+from gamechecker import datetime_format
+from gamechecker.http_client import create_session
+from gamechecker.models import EASTERN_TZ, parse_espn_datetime
+from gamechecker.rate_limiter import TokenBucket
+from gamechecker.schedule_cache import ScheduleCache
+from gamechecker.season_index import SeasonIndexStore
+
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "thresholds.json")
+TEAM_COUNTS = ("1", "5", "all")
+
+# The game_checker functions timed as each stage; fetch includes the request, decoding and the cache write
+STAGES = {
+    "fetch": ("fetch_schedule_payload",),
+    "parse": ("parse_schedule_events", "parse_scoreboard_events"),
+    "filter": ("bucket_schedule_by_date", "build_team_games"),
+    "format": ("format_game_datetimes",),
+    "render": ("display_games", "build_games_summary"),
+}
+
+
+class StageTimer:
+    """Accumulates the time spent in each stage, across every thread that enters it."""
+
+    def __init__(self):
+        self.totals = {stage: 0.0 for stage in STAGES}
+        self._lock = threading.Lock()
+
+
+    def wrap(self, stage, func):
+        """Wrap a function so its wall time is added to a stage."""
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.totals[stage] += time.perf_counter() - started
+
+        return timed
+
+
+def benchmark_dates(library, league):
+    """Pick a week of the season to search: the week of the first team's game a quarter of the way in."""
+    _, team_abbr = SUPPORTED_LEAGUES[league]["teams"][0]
+    events = json.loads(library.schedule_bytes(league, team_abbr)).get("events", [])
+    start_date = parse_espn_datetime(events[len(events) // 4]["date"]).astimezone(EASTERN_TZ).date()
+
+    return start_date, start_date + timedelta(days=6)
+
+
+def get_teams(league, team_count):
+    """Get the first team_count team abbreviations of a league ('all' for every team)."""
+    team_abbrs = [abbr.lower() for _, abbr in SUPPORTED_LEAGUES[league]["teams"]]
+
+    return team_abbrs if team_count == "all" else team_abbrs[:int(team_count)]
+
+
+@contextlib.contextmanager
+def isolated_checker(adapter, timer=None):
+    """
+    Point game_checker at the fixtures with a fresh cache, no season index and no rate limit.
+
+    Args:
+        adapter (FixtureAdapter): The adapter that answers every request
+        timer (StageTimer): If given, the stage functions are timed into it
+    """
+    session = create_session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.object(checker, "get_session", lambda: session))
+        stack.enter_context(mock.patch.object(checker, "schedule_cache", ScheduleCache(cache_dir=temp_dir)))
+        stack.enter_context(mock.patch.object(checker, "season_indexes", SeasonIndexStore(index_dir=os.path.join(temp_dir, "index"))))
+        stack.enter_context(mock.patch.object(checker, "espn_rate_limiter", TokenBucket(rate=1e9, capacity=1e9)))
+
+        if timer is not None:
+            for stage, names in STAGES.items():
+                for name in names:
+                    stack.enter_context(mock.patch.object(checker, name, timer.wrap(stage, getattr(checker, name))))
+
+        datetime_format._format_start.cache_clear()
+        datetime_format._parse_iso_datetime.cache_clear()
+
+        yield
+
+    session.close()
+
+
+def run_checker(preferences, start_date, end_date):
+    """Run game_checker with its console output discarded."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return checker.game_checker(preferences, start_date=start_date, end_date=end_date)
+
+
+def run_scenario(library, league, team_count, repeat=5, latency=0.0):
+    """
+    Benchmark game_checker for one league and number of teams.
+
+    Args:
+        library (FixtureLibrary): The recorded or synthetic schedules
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_count (str): '1', '5' or 'all'
+        repeat (int): Timed runs (best is reported)
+        latency (float): Seconds of simulated round trip per request
+
+    Returns:
+        dict: Best wall time (ms), requests per run, peak traced memory (KiB),
+              games found and the time spent in each stage (ms)
+    """
+    preferences = {f"{league}_team": get_teams(league, team_count)}
+    start_date, end_date = benchmark_dates(library, league)
+
+    # Untimed warm-up, so the fixtures are read before anything is measured
+    with isolated_checker(FixtureAdapter(library, latency)):
+        run_checker(preferences, start_date, end_date)
+
+    best = float("inf")
+    for _ in range(repeat):
+        adapter = FixtureAdapter(library, latency)
+        with isolated_checker(adapter):
+            started = time.perf_counter()
+            summary = run_checker(preferences, start_date, end_date)
+            best = min(best, time.perf_counter() - started)
+
+    with isolated_checker(FixtureAdapter(library, latency)):
+        tracemalloc.start()
+        run_checker(preferences, start_date, end_date)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    timer = StageTimer()
+    with isolated_checker(FixtureAdapter(library, latency), timer):
+        run_checker(preferences, start_date, end_date)
+
+    return {
+        "ms": best * 1000,
+        "requests": adapter.request_count,
+        "peak_kib": peak / 1024,
+        "games": 0 if summary.endswith("No games scheduled.") else len(summary.splitlines()) - 1,
+        "stages": {stage: total * 1000 for stage, total in timer.totals.items()},
+    }
+
+
+def load_thresholds(path=THRESHOLDS_PATH):
+    """Load the regression thresholds, keyed by league and then team count."""
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def check_thresholds(league, team_count, result, thresholds):
+    """
+    Compare a scenario's result against its thresholds.
+
+    Args:
+        league (str): The league of the scenario
+        team_count (str): '1', '5' or 'all'
+        result (dict): Output of run_scenario
+        thresholds (dict): Output of load_thresholds
+
+    Returns:
+        list: A message for every threshold the result exceeds
+    """
+    limits = thresholds.get(league, {}).get(team_count, {})
+    failures = []
+
+    for measure, limit_key in (("ms", "max_ms"), ("requests", "max_requests"), ("peak_kib", "max_peak_kib")):
+        limit = limits.get(limit_key)
+        if limit is not None and result[measure] > limit:
+            failures.append(f"{league.upper()} {team_count} team(s): {measure} {result[measure]:.1f} > {limit}")
+
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end game checker benchmark")
+    parser.add_argument("--league", default="nba,nfl,mlb", help="Comma-separated leagues to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per scenario (best is reported)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per ESPN request")
+    parser.add_argument("--thresholds", default=THRESHOLDS_PATH, help="Regression thresholds JSON file")
+    args = parser.parse_args(argv)
+
+    library = FixtureLibrary()
+    thresholds = load_thresholds(args.thresholds)
+    leagues = [league.strip().lower() for league in args.league.split(",") if league.strip() in SUPPORTED_LEAGUES]
+    failures = []
+
+    for league in leagues:
+        recorded = sum(library.is_recorded(league, abbr) for abbr in get_teams(league, "all"))
+        source = f"{recorded} recorded, the rest synthetic" if recorded else "synthetic only (no recordings)"
+        print(f"{league.upper()} schedules: {source}")
+
+    stage_header = " ".join(f"{stage:>8}" for stage in STAGES)
+    print(f"{'League':<7} {'Teams':>5} {'Wall':>10} {'Reqs':>5} {'Peak':>10} {'Games':>6}  {stage_header}")
+    print("─" * (48 + 9 * len(STAGES)))
+
+    for league in leagues:
+        for team_count in TEAM_COUNTS:
+            result = run_scenario(library, league, team_count, args.repeat, args.latency)
+            stages = " ".join(f"{result['stages'][stage]:>6.2f}ms" for stage in STAGES)
+            print(f"{league.upper():<7} {team_count:>5} {result['ms']:>8.2f}ms {result['requests']:>5} "
+                  f"{result['peak_kib']:>7.0f}KiB {result['games']:>6}  {stages}")
+            failures.extend(check_thresholds(league, team_count, result, thresholds))
+
+    if failures:
+        print("\n❌ Benchmark regressions:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+
+    print("\n✅ All scenarios within thresholds")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
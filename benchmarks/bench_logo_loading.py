@@ -0,0 +1,95 @@
+"""Compare loading a league's team grid logos file by file against cropping them from its atlas.
+
+Counts image file opens and filesystem lookups as well as time, since those
+are what dominate on slow disks and network home directories. PhotoImage
+creation is left out so the benchmark runs without a display.
+
+Usage: python benchmarks/bench_logo_loading.py [--size 80] [--repeat N]
+"""
+import argparse
+import os, sys
+import tempfile
+import time
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from constants import SUPPORTED_LEAGUES
+from gui.logo_atlas import ATLAS_DIR, LogoAtlas, TEAM_LOGO_DIR, atlas_paths
+from gui.logo_cache import load_thumbnail
+
+
+def load_original(league, size, cache_dir):
+    """The per-team path create_team_button used before the logo cache: look up, open and resize."""
+    for team_name, team_abbr in SUPPORTED_LEAGUES[league]["teams"]:
+        base_path = os.path.join(TEAM_LOGO_DIR, league)
+        for filename in (f"{team_abbr.lower()}.png", f"{team_name.lower().replace(' ', '_')}.png"):
+            logo_path = os.path.join(base_path, filename)
+            if os.path.exists(logo_path):
+                break
+        with Image.open(logo_path) as logo_img:
+            logo_img.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def load_thumbnails(league, size, cache_dir):
+    """One saved thumbnail per team."""
+    for team_name, team_abbr in SUPPORTED_LEAGUES[league]["teams"]:
+        load_thumbnail(league, team_abbr, team_name, size, cache_dir)
+
+
+def load_atlas(league, size, cache_dir):
+    """One atlas per league, cropped into tiles."""
+    atlas = LogoAtlas.load(league, size, ATLAS_DIR)
+    for _, team_abbr in SUPPORTED_LEAGUES[league]["teams"]:
+        atlas.tile(team_abbr)
+
+
+def measure(load, league, size, cache_dir, repeat):
+    """Get the best wall time of a loader and the image opens and stat calls it makes."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load(league, size, cache_dir)
+        best = min(best, time.perf_counter() - started)
+
+    with mock.patch.object(Image, "open", wraps=Image.open) as image_open, \
+         mock.patch("os.stat", wraps=os.stat) as stat:
+        load(league, size, cache_dir)
+
+    return best, image_open.call_count, stat.call_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Team logo loading benchmark")
+    parser.add_argument("--size", type=int, default=80, help="Logo size in pixels")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per loader (best is reported)")
+    args = parser.parse_args(argv)
+
+    loaders = [
+        ("open + resize per team", load_original),
+        ("saved thumbnails", load_thumbnails),
+        ("league atlas", load_atlas),
+    ]
+
+    print(f"{'League':<8} {'Loader':<24} {'Time':>10} {'Opens':>6} {'Stats':>6}")
+    print("─" * 58)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for league in SUPPORTED_LEAGUES:
+            if not os.path.exists(atlas_paths(league, args.size)[0]):
+                print(f"{league.upper():<8} no atlas for size {args.size}; run python gui/logo_atlas.py --size {args.size}")
+                continue
+
+            # Save the thumbnails once so the thumbnail loader is measured warm, as on a second run
+            load_thumbnails(league, args.size, cache_dir)
+
+            for name, load in loaders:
+                best, opens, stats = measure(load, league, args.size, cache_dir, args.repeat)
+                print(f"{league.upper():<8} {name:<24} {best * 1000:>8.2f}ms {opens:>6} {stats:>6}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare decoding a full ESPN schedule document against field-selective streaming decoding.
+
+"json.loads (full tree)" is what response.json() did before. The streaming
+rows run ScheduleStreamDecoder, on the whole body at once and on the body
+split into SCHEDULE_CHUNK_SIZE chunks as it arrives from the network.
+Streaming trades time for memory: every byte still goes through the json C
+scanner, so it takes about as long as json.loads (slightly longer in chunks,
+since each chunk's last partial event is scanned twice), for a peak 3-5x lower.
+
+Usage: python benchmarks/bench_schedule_decode.py [--repeat N]
+"""
+import argparse
+import json
+import os, sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.espn_payloads import make_schedule_payload
+from gamechecker.schedule_decoder import SCHEDULE_CHUNK_SIZE, decode_schedule_payload, decode_schedule_stream
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def measure(decode, raw, repeat):
+    """Get the best wall time and the peak traced memory of one decode."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(raw)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    result = decode(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return best, peak
+
+
+def iter_chunks(raw):
+    """Split a body into the chunks it would be read from the network in."""
+    for start in range(0, len(raw), SCHEDULE_CHUNK_SIZE):
+        yield raw[start:start + SCHEDULE_CHUNK_SIZE]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Schedule decoding benchmark")
+    parser.add_argument("--repeat", type=int, default=100, help="Timed runs per decoder (best is reported)")
+    args = parser.parse_args(argv)
+
+    decoders = [("json.loads (full tree)", json.loads)]
+    if orjson is not None:
+        decoders.append(("orjson (full tree)", orjson.loads))
+    decoders.append(("streaming, whole body", decode_schedule_payload))
+    decoders.append(("streaming, 64KiB chunks", lambda raw: decode_schedule_stream(iter_chunks(raw))))
+
+    print(f"{'League':<8} {'Size':>9}  {'Decoder':<24} {'Time':>9} {'Peak memory':>12}")
+    print("─" * 68)
+
+    for league, team in (("nba", "lal"), ("nfl", "kc"), ("mlb", "lad")):
+        raw = json.dumps(make_schedule_payload(league, team)).encode()
+
+        for name, decode in decoders:
+            best, peak = measure(decode, raw, args.repeat)
+            print(f"{league.upper():<8} {len(raw) / 1024:>7.0f}KB  {name:<24} {best * 1000:>7.2f}ms {peak / 1024:>10.0f}KB")
+        print()
+
+
+if __name__ == "__main__":
+    main()
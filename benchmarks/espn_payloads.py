@@ -0,0 +1,159 @@
+"""Synthetic ESPN payloads shaped like the real schedule and scoreboard documents.
+
+Only the nesting and the rough size of each event matter for benchmarking; the
+extra fields mirror what site.api.espn.com returns alongside the handful we use.
+"""
+from datetime import datetime, timedelta, timezone
+import functools
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import SUPPORTED_LEAGUES
+
+SEASON_GAMES = {"nba": 82, "nfl": 17, "mlb": 162}
+SEASON_START = {
+    "nba": datetime(2025, 10, 21, 23, 30, tzinfo=timezone.utc),
+    "nfl": datetime(2025, 9, 4, 0, 20, tzinfo=timezone.utc),
+    "mlb": datetime(2025, 3, 27, 17, 5, tzinfo=timezone.utc),
+}
+GAME_INTERVAL_DAYS = {"nba": 2, "nfl": 7, "mlb": 1}
+
+
+def make_team(league, abbr, name):
+    """Build a competitor team object with ESPN's usual extra fields."""
+    slug = name.lower().replace(" ", "-")
+    return {
+        "id": str(sum(map(ord, league + abbr))),
+        "location": name.rsplit(" ", 1)[0],
+        "name": name.rsplit(" ", 1)[-1],
+        "abbreviation": abbr,
+        "displayName": name,
+        "shortDisplayName": name.rsplit(" ", 1)[-1],
+        "logos": [
+            {"href": f"https://a.espncdn.com/i/teamlogos/{league}/500/{abbr.lower()}.png",
+             "width": 500, "height": 500, "alt": "", "rel": ["full", "default"]},
+            {"href": f"https://a.espncdn.com/i/teamlogos/{league}/500-dark/{abbr.lower()}.png",
+             "width": 500, "height": 500, "alt": "", "rel": ["full", "dark"]},
+        ],
+        "links": [
+            {"rel": ["clubhouse", "desktop", "team"], "href": f"https://www.espn.com/{league}/team/_/name/{abbr.lower()}/{slug}"},
+            {"rel": ["schedule", "desktop", "team"], "href": f"https://www.espn.com/{league}/team/schedule/_/name/{abbr.lower()}"},
+        ],
+    }
+
+
+def make_event(league, event_id, start, home, away):
+    """Build one ESPN event between two (abbr, name) teams."""
+    return {
+        "id": str(event_id),
+        "date": start.strftime("%Y-%m-%dT%H:%MZ"),
+        "name": f"{away[1]} at {home[1]}",
+        "shortName": f"{away[0]} @ {home[0]}",
+        "season": {"year": start.year, "displayName": str(start.year), "type": 2},
+        "seasonType": {"id": "2", "type": 2, "name": "Regular Season", "abbreviation": "reg"},
+        "timeValid": True,
+        "competitions": [{
+            "id": str(event_id),
+            "date": start.strftime("%Y-%m-%dT%H:%MZ"),
+            "attendance": 0,
+            "type": {"id": "1", "text": "Standard", "abbreviation": "STD", "slug": "standard", "type": "standard"},
+            "timeValid": True,
+            "neutralSite": False,
+            "boxscoreAvailable": False,
+            "ticketsAvailable": True,
+            "venue": {"fullName": f"{home[1]} Arena", "address": {"city": "City", "state": "ST", "zipCode": "00000"}},
+            "competitors": [
+                {"id": "1", "type": "team", "order": 0, "homeAway": "home", "winner": False,
+                 "team": make_team(league, home[0], home[1]), "leaders": [], "record": []},
+                {"id": "2", "type": "team", "order": 1, "homeAway": "away", "winner": False,
+                 "team": make_team(league, away[0], away[1]), "leaders": [], "record": []},
+            ],
+            "notes": [],
+            "broadcasts": [{"type": {"id": "1", "shortName": "TV"}, "market": {"id": "1", "type": "National"},
+                            "media": {"shortName": "ESPN"}, "lang": "en", "region": "us"}],
+            "tickets": [{"summary": "Tickets as low as $25", "numberAvailable": 1200,
+                         "links": [{"href": "https://www.vividseats.com/"}]}],
+            "status": {"clock": 0.0, "displayClock": "0:00", "period": 0,
+                       "type": {"id": "1", "name": "STATUS_SCHEDULED", "state": "pre", "completed": False,
+                                "description": "Scheduled", "detail": "Scheduled", "shortDetail": "Scheduled"}},
+        }],
+        "links": [{"language": "en-US", "rel": ["summary", "desktop", "event"],
+                   "href": f"https://www.espn.com/{league}/game/_/gameId/{event_id}", "text": "Gamecast"}],
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def make_league_season(league, start=None):
+    """
+    Build one consistent season for a whole league, as (event_id, start, home, away) rows.
+
+    Teams are paired round by round with the circle method, so every team
+    plays at most once per game day and both teams of a game share its
+    event id, like ESPN's schedule and scoreboard documents do.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        start (datetime): First game time, defaults to the league's season opener
+
+    Returns:
+        tuple: The season's games, in date order
+    """
+    teams = [(abbr, name) for name, abbr in SUPPORTED_LEAGUES[league]["teams"]]
+    if len(teams) % 2:
+        teams.append(None)
+    start = start or SEASON_START[league]
+    id_base = 401000000 + list(SUPPORTED_LEAGUES).index(league) * 100000
+
+    games = []
+    rotation = teams[1:]
+    for round_index in range(SEASON_GAMES[league]):
+        lineup = [teams[0]] + rotation
+        game_start = start + timedelta(days=round_index * GAME_INTERVAL_DAYS[league])
+        for pair_index in range(len(lineup) // 2):
+            home, away = lineup[pair_index], lineup[-1 - pair_index]
+            if home is None or away is None:
+                continue
+            # Swap sides every other round so home and away games are spread evenly
+            if round_index % 2:
+                home, away = away, home
+            games.append((id_base + len(games), game_start, home, away))
+        rotation = rotation[-1:] + rotation[:-1]
+
+    return tuple(games)
+
+
+def make_schedule_payload(league, team_abbr, games=None, start=None):
+    """
+    Build a full-season team schedule document.
+
+    The team's games are taken from make_league_season, so the documents of
+    two teams that meet hold the same event.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team abbreviation
+        games (int): Number of games, defaults to the league's regular season length
+        start (datetime): First game time, defaults to the league's season opener
+
+    Returns:
+        dict: The schedule document
+    """
+    teams = SUPPORTED_LEAGUES[league]["teams"]
+    team = next((abbr, name) for name, abbr in teams if abbr.lower() == team_abbr.lower())
+    start = start or SEASON_START[league]
+
+    events = [
+        make_event(league, event_id, game_start, home, away)
+        for event_id, game_start, home, away in make_league_season(league, start)
+        if team in (home, away)
+    ]
+
+    return {
+        "timestamp": start.strftime("%Y-%m-%dT%H:%MZ"),
+        "status": "success",
+        "season": {"year": start.year, "type": 2, "name": "Regular Season"},
+        "team": make_team(league, team[0], team[1]),
+        "events": events[:games],
+        "requestedSeason": {"year": start.year, "type": 2, "name": "Regular Season", "displayName": str(start.year)},
+    }
@@ -0,0 +1,276 @@
+"""A local stand-in for site.api.espn.com that replays recorded or synthetic responses.
+
+Schedules and scoreboards are answered from benchmarks/fixtures, with
+synthetic seasons where nothing is recorded. No recordings are committed, so
+on a fresh checkout every response is synthetic. Latency, 429 Too Many Requests and
+403 Forbidden responses can be injected, and payloads can be scaled up, so
+concurrency, retries and caching can be load-tested offline. With --record,
+requests are forwarded to ESPN and every response is saved as a fixture.
+
+Usage: python benchmarks/espn_server.py [--port 8765] [--latency 0.05] [--throttle-rate 0.1]
+                                         [--forbid-rate 0.05] [--scale 4] [--record]
+
+Then run the checker against it:
+
+    ESPN_API_BASE_URL=http://127.0.0.1:8765 python3 main.py --sport 1 --nba-teams lal
+"""
+import argparse
+import hashlib
+import json
+import os, sys
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import FIXTURE_DIR, FixtureLibrary, recording_path, write_recording
+
+ESPN_UPSTREAM_URL = "https://site.api.espn.com/apis/site/v2/sports"
+
+
+def scale_document(body, scale):
+    """
+    Repeat every event in a schedule or scoreboard document to make it larger.
+
+    Copies keep their dates and teams and get a distinct event id, so the
+    checker finds the same games but decodes a document scale times the size.
+
+    Args:
+        body (bytes): The JSON document
+        scale (int): How many copies of each event to include
+
+    Returns:
+        bytes: The scaled JSON document
+    """
+    if scale <= 1:
+        return body
+
+    document = json.loads(body)
+    events = document.get("events", [])
+    document["events"] = [
+        {**event, "id": f"{event.get('id', '')}{'' if copy == 0 else f'-{copy}'}"}
+        for event in events for copy in range(scale)
+    ]
+
+    return json.dumps(document).encode()
+
+
+class ESPNStandInServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server that answers ESPN schedule and scoreboard requests from fixtures.
+
+    Each response has an ETag so conditional requests from the schedule cache
+    are answered with 304 Not Modified, as ESPN does. Injected failures are
+    drawn from a seeded random generator, so a run can be repeated exactly.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, library=None, latency=0.0, throttle_rate=0.0, forbid_rate=0.0,
+                 retry_after=1, scale=1, seed=0, record=False, upstream_url=ESPN_UPSTREAM_URL):
+        super().__init__(address, StandInHandler)
+        self.library = library or FixtureLibrary()
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.forbid_rate = forbid_rate
+        self.retry_after = retry_after
+        self.scale = scale
+        self.record = record
+        self.upstream_url = upstream_url.rstrip("/")
+        self.stats = {"requests": 0, "ok": 0, "not_modified": 0, "throttled": 0, "forbidden": 0,
+                      "not_found": 0, "recorded": 0}
+        self._random = random.Random(seed)
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+
+    @property
+    def base_url(self):
+        """The URL to use as ESPN_API_BASE_URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+    def count(self, stat):
+        """Increment one of the request counters."""
+        with self._lock:
+            self.stats[stat] += 1
+
+
+    def inject_failure(self):
+        """
+        Decide whether the next request is refused.
+
+        Returns:
+            int: 429 or 403 for an injected failure, otherwise None
+        """
+        with self._lock:
+            draw = self._random.random()
+
+        if draw < self.throttle_rate:
+            return 429
+        if draw < self.throttle_rate + self.forbid_rate:
+            return 403
+
+        return None
+
+
+    def fetch_upstream(self, path):
+        """Forward a request to ESPN and save the response as a fixture."""
+        response = requests.get(f"{self.upstream_url}{path}", timeout=(5, 30))
+        response.raise_for_status()
+
+        fixture = recording_path(path, self.library.fixture_dir)
+        if fixture is not None:
+            write_recording(fixture, response.content)
+            self.count("recorded")
+
+        return response.content
+
+
+    def get_body(self, path):
+        """
+        Get the (scaled) document for a request path and its ETag.
+
+        Args:
+            path (str): The request path and query string
+
+        Returns:
+            tuple: (body, etag), or (None, None) if the path is not an ESPN document
+        """
+        with self._lock:
+            cached = self._bodies.get(path)
+        if cached is not None:
+            return cached
+
+        body = self.fetch_upstream(path) if self.record else self.library.respond(path)
+        if body is None:
+            return None, None
+
+        body = scale_document(body, self.scale)
+        entry = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+
+        with self._lock:
+            self._bodies[path] = entry
+
+        return entry
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler for ESPNStandInServer."""
+
+    def do_GET(self):
+        server = self.server
+
+        if self.path == "/__stats":
+            with server._lock:
+                stats = json.dumps(server.stats).encode()
+            self.send_json(200, stats)
+            return
+
+        server.count("requests")
+        if server.latency:
+            time.sleep(server.latency)
+
+        status = server.inject_failure()
+        if status == 429:
+            server.count("throttled")
+            self.send_json(429, b'{"error":"Too Many Requests"}', {"Retry-After": str(server.retry_after)})
+            return
+        if status == 403:
+            server.count("forbidden")
+            self.send_json(403, b'{"error":"Forbidden"}')
+            return
+
+        try:
+            body, etag = server.get_body(self.path)
+        except requests.exceptions.RequestException as e:
+            self.send_json(502, json.dumps({"error": str(e)}).encode())
+            return
+
+        if body is None:
+            server.count("not_found")
+            self.send_json(404, b'{"error":"Not Found"}')
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            server.count("not_modified")
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        server.count("ok")
+        self.send_json(200, body, {"ETag": etag})
+
+
+    def send_json(self, status, body, headers=None):
+        """Send a complete JSON response."""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(host="127.0.0.1", port=0, **options):
+    """
+    Start a stand-in server on a background thread.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): Port to listen on; 0 picks a free port
+        **options: Keyword arguments for ESPNStandInServer
+
+    Returns:
+        ESPNStandInServer: The running server; call shutdown() and server_close() when done
+    """
+    server = ESPNStandInServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local record/replay stand-in for the ESPN site API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each response")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--forbid-rate", type=float, default=0.0, help="Fraction of requests answered with 403")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429 responses")
+    parser.add_argument("--scale", type=int, default=1, help="Copies of each event in every document")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the injected failures")
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="Directory of recorded responses")
+    parser.add_argument("--record", action="store_true", help="Forward requests to ESPN and record the responses")
+    args = parser.parse_args(argv)
+
+    server = ESPNStandInServer(
+        (args.host, args.port), FixtureLibrary(args.fixtures), latency=args.latency,
+        throttle_rate=args.throttle_rate, forbid_rate=args.forbid_rate, retry_after=args.retry_after,
+        scale=args.scale, seed=args.seed, record=args.record
+    )
+    mode = "Recording from ESPN" if args.record else "Replaying fixtures"
+    print(f"🏟️  {mode} at {server.base_url} (set ESPN_API_BASE_URL={server.base_url})")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""ESPN schedule payloads, replayed through a requests transport adapter.
+
+No recordings are committed to the repository, so on a fresh checkout every
+team is served a synthetic season from espn_payloads and the benchmarks and
+tests measure synthetic payloads only. Recordings made locally are read from
+benchmarks/fixtures/<league>/<team>.json.gz (and scoreboard-<dates>.json.gz)
+in place of the synthetic season for that team. To record the real team
+schedules:
+
+Usage: python benchmarks/fixtures.py --league nba,nfl,mlb
+"""
+import argparse
+import gzip
+import io
+import json
+import os, sys
+import threading
+import time
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.espn_payloads import make_schedule_payload
+from constants import SUPPORTED_LEAGUES
+from gamechecker.game_checker import SPORT_PATHS, build_schedule_url
+from gamechecker.models import EASTERN_TZ, parse_espn_datetime
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+LEAGUE_BY_PATH = {sport_path: league for league, sport_path in SPORT_PATHS.items()}
+
+
+def fixture_path(league, team_abbr, fixture_dir=FIXTURE_DIR):
+    """Get the file path of a team's recorded schedule."""
+    return os.path.join(fixture_dir, league, f"{team_abbr.lower()}.json.gz")
+
+
+def scoreboard_fixture_path(league, start_date, end_date, fixture_dir=FIXTURE_DIR):
+    """Get the file path of a recorded league scoreboard for a YYYYMMDD date range."""
+    return os.path.join(fixture_dir, league, f"scoreboard-{start_date}-{end_date}.json.gz")
+
+
+def parse_espn_url(url):
+    """
+    Work out which document an ESPN schedule or scoreboard URL asks for.
+
+    Args:
+        url (str): The requested URL, on ESPN or a stand-in server
+
+    Returns:
+        tuple: ('schedule', league, team_abbr), ('scoreboard', league, start_date, end_date)
+               with YYYYMMDD dates, or None for any other URL
+    """
+    parsed = urlparse(url)
+    parts = parsed.path.rstrip("/").split("/")
+
+    if len(parts) >= 5 and parts[-1] == "schedule" and parts[-3] == "teams":
+        league = LEAGUE_BY_PATH.get("/".join(parts[-5:-3]))
+        if league:
+            return ("schedule", league, parts[-2].lower())
+
+    if len(parts) >= 3 and parts[-1] == "scoreboard":
+        league = LEAGUE_BY_PATH.get("/".join(parts[-3:-1]))
+        dates = parse_qs(parsed.query).get("dates", [""])[0].split("-")
+        if league and len(dates) == 2:
+            return ("scoreboard", league, dates[0], dates[1])
+
+    return None
+
+
+def recording_path(url, fixture_dir=FIXTURE_DIR):
+    """Get the file a response to an ESPN URL is recorded in, or None if it is not a URL the checker requests."""
+    document = parse_espn_url(url)
+    if document is None:
+        return None
+
+    if document[0] == "schedule":
+        return fixture_path(document[1], document[2], fixture_dir)
+
+    return scoreboard_fixture_path(*document[1:], fixture_dir=fixture_dir)
+
+
+def write_recording(path, body):
+    """Save a response body as a gzipped recording."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.GzipFile(path, "wb", mtime=0) as file:
+        file.write(body)
+
+
+class FixtureLibrary:
+    """
+    The raw schedule document of every team, read (or generated) once and kept in memory.
+
+    Scoreboards are assembled from the team documents, keeping each event
+    inside the requested dates once.
+    """
+
+    def __init__(self, fixture_dir=FIXTURE_DIR):
+        self.fixture_dir = fixture_dir
+        self._raw = {}
+        self._scoreboards = {}
+        self._lock = threading.Lock()
+
+
+    def schedule_bytes(self, league, team_abbr):
+        """
+        Get a team's schedule document as it came off the wire.
+
+        Args:
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+            team_abbr (str): The team abbreviation
+
+        Returns:
+            bytes: The JSON document
+        """
+        key = (league, team_abbr.lower())
+
+        with self._lock:
+            if key not in self._raw:
+                try:
+                    with gzip.open(fixture_path(league, team_abbr, self.fixture_dir), "rb") as file:
+                        self._raw[key] = file.read()
+                except OSError:
+                    self._raw[key] = json.dumps(make_schedule_payload(league, team_abbr)).encode()
+
+            return self._raw[key]
+
+
+    def is_recorded(self, league, team_abbr):
+        """Check if a team is served from a recording rather than a synthetic season."""
+        return os.path.exists(fixture_path(league, team_abbr, self.fixture_dir))
+
+
+    def scoreboard_bytes(self, league, start_date, end_date):
+        """
+        Get a league scoreboard document for a date range.
+
+        A recorded scoreboard is used if there is one. Otherwise it is built from
+        the team documents, placing games on their Eastern date like ESPN. Each
+        document is built once, so building it is not counted against the
+        checker's fetch time.
+
+        Args:
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+            start_date (str): First date as YYYYMMDD
+            end_date (str): Last date as YYYYMMDD (inclusive)
+
+        Returns:
+            bytes: The JSON document
+        """
+        key = (league, start_date, end_date)
+        if key in self._scoreboards:
+            return self._scoreboards[key]
+
+        try:
+            with gzip.open(scoreboard_fixture_path(league, start_date, end_date, self.fixture_dir), "rb") as file:
+                self._scoreboards[key] = file.read()
+            return self._scoreboards[key]
+        except OSError:
+            pass
+
+        events = {}
+        for _, team_abbr in SUPPORTED_LEAGUES[league]["teams"]:
+            for event in json.loads(self.schedule_bytes(league, team_abbr)).get("events", []):
+                start = parse_espn_datetime(event.get("date", ""))
+                if start and start_date <= start.astimezone(EASTERN_TZ).strftime("%Y%m%d") <= end_date:
+                    events.setdefault(event.get("id"), event)
+
+        body = json.dumps({"events": sorted(events.values(), key=lambda event: event.get("date", ""))}).encode()
+        self._scoreboards[key] = body
+
+        return body
+
+
+    def respond(self, url):
+        """
+        Get the document ESPN would return for a schedule or scoreboard URL.
+
+        Args:
+            url (str): The requested URL
+
+        Returns:
+            bytes: The JSON document, or None if the URL is not one the checker requests
+        """
+        document = parse_espn_url(url)
+        if document is None:
+            return None
+
+        if document[0] == "schedule":
+            return self.schedule_bytes(document[1], document[2])
+
+        return self.scoreboard_bytes(*document[1:])
+
+
+class FixtureAdapter(BaseAdapter):
+    """
+    A requests transport adapter that answers from a FixtureLibrary instead of the network.
+
+    Every request is counted, and an optional fixed latency is slept per
+    request to approximate a round trip to ESPN.
+    """
+
+    def __init__(self, library=None, latency=0.0):
+        super().__init__()
+        self.library = library or FixtureLibrary()
+        self.latency = latency
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.request_count += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        body = self.library.respond(request.url)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 200 if body is not None else 404
+        response.reason = "OK" if body is not None else "Not Found"
+        response.headers["Content-Type"] = "application/json"
+        response.raw = io.BytesIO(body if body is not None else b"{}")
+
+        return response
+
+
+    def close(self):
+        pass
+
+
+def record_fixtures(league, fixture_dir=FIXTURE_DIR):
+    """
+    Download every team's schedule in a league from ESPN and save it as a recording.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        fixture_dir (str): Directory to write the recordings to
+
+    Returns:
+        int: Number of teams recorded
+    """
+    session = requests.Session()
+    recorded = 0
+
+    for _, team_abbr in SUPPORTED_LEAGUES[league]["teams"]:
+        response = session.get(build_schedule_url(league, team_abbr.lower()), timeout=(5, 30))
+        if not response.ok:
+            print(f"   {team_abbr}: HTTP {response.status_code}, skipped")
+            continue
+
+        write_recording(fixture_path(league, team_abbr, fixture_dir), response.content)
+        recorded += 1
+
+    return recorded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record ESPN schedule fixtures for the benchmarks")
+    parser.add_argument("--league", default="nba,nfl,mlb", help="Comma-separated leagues to record")
+    args = parser.parse_args(argv)
+
+    for league in [league.strip().lower() for league in args.league.split(",") if league.strip()]:
+        if league not in SUPPORTED_LEAGUES:
+            print(f"Unsupported league: {league}")
+            continue
+
+        recorded = record_fixtures(league)
+        print(f"✅ Recorded {recorded} {league.upper()} schedules on {datetime.now():%Y-%m-%d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,66 @@ import os
 PUSHOVER_USER_KEY    = os.getenv("PUSHOVER_USER_KEY")
 PUSHOVER_API_TOKEN   = os.getenv("PUSHOVER_API_TOKEN")
 
+PROJECT_ROOT         = os.path.dirname(os.path.abspath(__file__))
+
+# Shared HTTP connection pool used for ESPN and Pushover requests. Timeouts are in seconds.
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE    = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT    = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+
+# Base URL of the ESPN site API. Point it at a local stand-in server (benchmarks/espn_server.py)
+# to run against recorded responses instead of site.api.espn.com.
+ESPN_API_BASE_URL    = os.getenv("ESPN_API_BASE_URL", "https://site.api.espn.com/apis/site/v2/sports").rstrip("/")
+
+# Concurrent ESPN fetching. Requests are paced by a token bucket that refills at
+# ESPN_REQUESTS_PER_SECOND and allows bursts of up to ESPN_REQUEST_BURST requests.
+ESPN_MAX_WORKERS     = int(os.getenv("ESPN_MAX_WORKERS", "32"))
+ESPN_REQUESTS_PER_SECOND = float(os.getenv("ESPN_REQUESTS_PER_SECOND", "10"))
+ESPN_REQUEST_BURST   = int(os.getenv("ESPN_REQUEST_BURST", "32"))
+
+# Retries for throttled or failed ESPN requests. Delays are in seconds and
+# ESPN_RETRY_DEADLINE caps the total time spent on one request including retries.
+ESPN_RETRY_ATTEMPTS  = int(os.getenv("ESPN_RETRY_ATTEMPTS", "4"))
+ESPN_RETRY_BASE_DELAY = float(os.getenv("ESPN_RETRY_BASE_DELAY", "0.5"))
+ESPN_RETRY_MAX_DELAY = float(os.getenv("ESPN_RETRY_MAX_DELAY", "8"))
+ESPN_RETRY_DEADLINE  = float(os.getenv("ESPN_RETRY_DEADLINE", "20"))
+
+# How team schedules are fetched: "team" downloads each team's season schedule,
+# "scoreboard" downloads the league scoreboard for the searched dates (one request
+# per ESPN_SCOREBOARD_DAYS_PER_REQUEST days), and "auto" picks whichever needs fewer requests.
+ESPN_FETCH_STRATEGY  = os.getenv("ESPN_FETCH_STRATEGY", "auto")
+ESPN_SCOREBOARD_DAYS_PER_REQUEST = int(os.getenv("ESPN_SCOREBOARD_DAYS_PER_REQUEST", "7"))
+
+# On-disk cache for ESPN schedule responses. TTLs are in seconds and can be
+# overridden per league (e.g. ESPN_CACHE_TTL_MLB=3600).
+ESPN_CACHE_DIR       = os.getenv("ESPN_CACHE_DIR", os.path.join(PROJECT_ROOT, ".cache", "espn"))
+ESPN_CACHE_TTL       = int(os.getenv("ESPN_CACHE_TTL", "21600"))
+ESPN_CACHE_TTLS      = {
+    league: int(os.getenv(f"ESPN_CACHE_TTL_{league.upper()}", ESPN_CACHE_TTL))
+    for league in ("nba", "nfl", "mlb")
+}
+
+# League-wide season indexes written by `main.py build-index`. While an index is
+# younger than SEASON_INDEX_TTL seconds, games are looked up in it without any ESPN requests.
+SEASON_INDEX_DIR     = os.getenv("SEASON_INDEX_DIR", os.path.join(PROJECT_ROOT, ".cache", "index"))
+SEASON_INDEX_TTL     = int(os.getenv("SEASON_INDEX_TTL", "86400"))
+
+# Games reported by the last --changes-only run, used to work out what changed since then.
+CHANGE_STATE_PATH    = os.getenv("CHANGE_STATE_PATH", os.path.join(PROJECT_ROOT, ".cache", "last_games.json"))
+
+# Time zone game times are shown in (e.g. "America/Chicago"). Eastern time is used when unset,
+# and a "timezone" key in the preferences overrides it for a single run.
+DISPLAY_TIMEZONE     = os.getenv("DISPLAY_TIMEZONE")
+
+# Resized team logos for the GUI. Thumbnails are saved under LOGO_CACHE_DIR and up to
+# LOGO_CACHE_SIZE decoded logos are kept in memory besides those on screens the GUI keeps.
+LOGO_CACHE_DIR       = os.getenv("LOGO_CACHE_DIR", os.path.join(PROJECT_ROOT, ".cache", "logos"))
+LOGO_CACHE_SIZE      = int(os.getenv("LOGO_CACHE_SIZE", "128"))
+
+# Teams picked in the last GUI search, prefetched while the splash screen is shown.
+GUI_STATE_PATH       = os.getenv("GUI_STATE_PATH", os.path.join(PROJECT_ROOT, ".cache", "gui_state.json"))
+
 SUPPORTED_LEAGUES = {
     "nba": {
         "name": "Basketball (NBA)",
@@ -114,4 +174,43 @@ SUPPORTED_LEAGUES = {
             ("Washington Nationals", "WSH")
         ]
     },
-}
\ No newline at end of file
+}
+
+# Alternate abbreviations accepted for a team, mapped to the abbreviation ESPN's
+# team endpoints use (e.g. --nba-teams gsw resolves to GS).
+TEAM_ALIASES = {
+    "nba": {
+        "BRK": "BKN",
+        "CHO": "CHA",
+        "GSW": "GS",
+        "NOP": "NO",
+        "NYK": "NY",
+        "PHO": "PHX",
+        "SAS": "SA",
+        "UTA": "UTAH",
+        "WAS": "WSH",
+    },
+    "nfl": {
+        "GNB": "GB",
+        "JAC": "JAX",
+        "KAN": "KC",
+        "LA": "LAR",
+        "NWE": "NE",
+        "NOR": "NO",
+        "SFO": "SF",
+        "TAM": "TB",
+        "WAS": "WSH",
+    },
+    "mlb": {
+        "ANA": "LAA",
+        "AZ": "ARI",
+        "CWS": "CHW",
+        "KCR": "KC",
+        "OAK": "ATH",
+        "SDP": "SD",
+        "SFG": "SF",
+        "TBR": "TB",
+        "WAS": "WSH",
+        "WSN": "WSH",
+    },
+}
@@ -0,0 +1,311 @@
+from datetime import timedelta
+from constants import SUPPORTED_LEAGUES
+from gamechecker.game_checker import (
+    build_games_summary,
+    build_schedule_url,
+    build_scoreboard_url,
+    build_team_games,
+    bucket_schedule_by_date,
+    choose_fetch_strategy,
+    get_current_date,
+    get_date_range,
+    get_date_range_description,
+    get_scoreboard_chunks,
+    parse_schedule_events,
+    parse_scoreboard_events,
+    sort_games_chronologically,
+)
+from gamechecker.datetime_format import format_game_datetimes
+from gamechecker.http_client import create_async_client
+from gamechecker.rate_limiter import espn_rate_limiter
+from gamechecker.retry import call_with_retry_async
+from gamechecker.schedule_decoder import SCHEDULE_CHUNK_SIZE, ScheduleStreamDecoder
+from gamechecker.schedule_cache import schedule_cache
+from gamechecker.schedule_index import ScheduleIndex
+from gamechecker.season_index import season_indexes
+from gamechecker.team_registry import team_registry
+import asyncio
+import httpx
+import json
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+async def fetch_schedule_payload_async(client, league, team_abbr, url):
+    """
+    Async counterpart of fetch_schedule_payload, sharing the same on-disk cache and rate limiter.
+
+    Cache reads and writes run in worker threads so they never block the event loop,
+    and the response body is decoded as it streams in.
+
+    Args:
+        client (httpx.AsyncClient): The client to send requests with
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team abbreviation
+        url (str): The ESPN schedule URL for the team
+
+    Returns:
+        dict: The schedule document, reduced to the fields the parsers read
+    """
+    entry = await asyncio.to_thread(schedule_cache.load, league, team_abbr)
+    if entry and schedule_cache.is_fresh(entry, league):
+        schedule_cache.count("hits")
+        return entry["payload"]
+
+    async def request():
+        await asyncio.sleep(espn_rate_limiter.reserve())
+        async with client.stream("GET", url, headers=schedule_cache.conditional_headers(entry)) as response:
+            if response.status_code == 429:
+                espn_rate_limiter.penalize()
+            elif response.is_success:
+                espn_rate_limiter.reward()
+
+            if response.status_code == 304:
+                return response, None
+
+            response.raise_for_status()
+
+            decoder = ScheduleStreamDecoder()
+            try:
+                async for chunk in response.aiter_bytes(SCHEDULE_CHUNK_SIZE):
+                    decoder.feed(chunk)
+                return response, decoder.close()
+            except json.JSONDecodeError as e:
+                # Report a malformed body as a failed request, like the sync path
+                raise httpx.DecodingError(f"Invalid schedule document: {e}", request=response.request) from e
+
+    try:
+        response, payload = await call_with_retry_async(request)
+    except httpx.HTTPError:
+        if entry:
+            schedule_cache.count("stale")
+            return entry["payload"]
+        raise
+
+    if response.status_code == 304 and entry:
+        schedule_cache.count("revalidated")
+        entry = await asyncio.to_thread(schedule_cache.touch, league, team_abbr, entry)
+        return entry["payload"]
+
+    schedule_cache.count("misses")
+    await asyncio.to_thread(schedule_cache.store, league, team_abbr, payload, response.headers)
+
+    return payload
+
+
+async def get_schedule_from_espn_async(client, league, team_abbr, base_url=None):
+    """
+    Async counterpart of get_schedule_from_espn. A fresh season index answers without a request.
+
+    Args:
+        client (httpx.AsyncClient): The client to send requests with
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team abbreviation
+        base_url (str): Override for the ESPN API base URL
+
+    Returns:
+        ScheduleIndex: The team's games indexed by date, or an empty list on failure
+    """
+    season_index = await asyncio.to_thread(season_indexes.get, league)
+    if season_index is not None:
+        return season_index.team_schedule(team_abbr)
+
+    try:
+        url = build_schedule_url(league, team_abbr, base_url)
+        data = await fetch_schedule_payload_async(client, league, team_abbr, url)
+    except ValueError as e:
+        print(e)
+        return []
+    except httpx.HTTPError as e:
+        print(f"Error fetching {league.upper()} schedule for {team_abbr}: {e}")
+        return []
+
+    return ScheduleIndex(parse_schedule_events(data, team_abbr, league))
+
+
+async def fetch_scoreboard_schedules_async(client, league, team_abbrs, target_dates, base_url=None):
+    """
+    Async counterpart of fetch_scoreboard_schedules. Every date range is fetched concurrently.
+
+    Args:
+        client (httpx.AsyncClient): The client to send requests with
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbrs (list): List of team abbreviations
+        target_dates (list): The dates being checked
+        base_url (str): Override for the ESPN API base URL
+
+    Returns:
+        list: A ScheduleIndex per team, in the same order as team_abbrs
+    """
+    payloads = await asyncio.gather(
+        *(fetch_schedule_payload_async(client, league, cache_key,
+                                       build_scoreboard_url(league, start_date, end_date, base_url))
+          for start_date, end_date, cache_key in get_scoreboard_chunks(target_dates))
+    )
+
+    schedules = {team_abbr.upper(): [] for team_abbr in team_abbrs}
+    for payload in payloads:
+        for team_abbr, games in parse_scoreboard_events(payload, team_abbrs, league).items():
+            schedules[team_abbr].extend(games)
+
+    return [ScheduleIndex(schedules[team_abbr.upper()]) for team_abbr in team_abbrs]
+
+
+async def fetch_schedules_for_dates_async(client, league, team_abbrs, target_dates, base_url=None):
+    """
+    Async counterpart of fetch_schedules_for_dates, choosing team or scoreboard mode the same way.
+
+    If the scoreboard cannot be fetched, each team's schedule is fetched instead.
+
+    Args:
+        client (httpx.AsyncClient): The client to send requests with
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbrs (list): List of team abbreviations
+        target_dates (list): The dates being checked
+        base_url (str): Override for the ESPN API base URL
+
+    Returns:
+        list: A schedule per team, in the same order as team_abbrs
+    """
+    if not team_abbrs or not target_dates:
+        return []
+
+    day_count = (max(target_dates) - min(target_dates)).days + 1
+    season_index = await asyncio.to_thread(season_indexes.get, league)
+    if season_index is None and choose_fetch_strategy(len(team_abbrs), day_count) == 'scoreboard':
+        try:
+            return await fetch_scoreboard_schedules_async(client, league, team_abbrs, target_dates, base_url)
+        except Exception as e:
+            print(f"Scoreboard unavailable for {league.upper()} ({e}), fetching team schedules instead.")
+
+    return await asyncio.gather(
+        *(get_schedule_from_espn_async(client, league, team_abbr, base_url) for team_abbr in team_abbrs)
+    )
+
+
+async def check_games_async(client, favorite_teams, league, target_dates, base_url=None):
+    """
+    Async counterpart of check_games_for_dates. All teams are fetched concurrently.
+
+    Args:
+        client (httpx.AsyncClient): The client to send requests with
+        favorite_teams (list): List of team abbreviations (e.g., ['lal', 'bos'])
+        league (str): The league to check (e.g., 'nba', 'nfl', 'mlb')
+        target_dates (list): The dates to check for games, in order
+        base_url (str): Override for the ESPN API base URL
+
+    Returns:
+        dict: Dictionary with each target date as a key and a list of game information as values
+    """
+    games_found = {target_date: [] for target_date in target_dates}
+
+    if not favorite_teams or not target_dates or league not in SUPPORTED_LEAGUES:
+        return games_found
+
+    known_teams = []
+    for team_abbr in favorite_teams:
+        abbr = team_registry.resolve(team_abbr, league)
+        if abbr and abbr.lower() not in known_teams:
+            known_teams.append(abbr.lower())
+    team_names = {team_abbr: team_registry.get_name(team_abbr, league) for team_abbr in known_teams}
+
+    schedules = await fetch_schedules_for_dates_async(client, league, known_teams, target_dates, base_url)
+
+    for team_abbr, schedule in zip(known_teams, schedules):
+        games_by_date = bucket_schedule_by_date(schedule, target_dates)
+
+        for target_date, game_info in build_team_games(games_by_date, team_abbr, team_names[team_abbr], league, target_dates):
+            games_found[target_date].append(game_info)
+
+    return games_found
+
+
+def get_target_dates(start_date=None, end_date=None):
+    """
+    Get the dates to check the same way game_checker does: start_date through end_date, inclusive.
+
+    Args:
+        start_date (date): First date to check; today if omitted
+        end_date (date): Last date to check (inclusive); six days after start_date if omitted
+
+    Returns:
+        list: The dates to check, in order
+    """
+    start_date = start_date or get_current_date()
+    end_date = end_date or start_date + timedelta(days=6)
+    if end_date < start_date:
+        raise ValueError(f"End date {end_date} is before start date {start_date}")
+
+    return get_date_range(start_date, end_date)
+
+
+async def collect_games_async(preferences, client=None, base_url=None, start_date=None, end_date=None):
+    """
+    Get the games for every league in the preferences, running all leagues concurrently.
+
+    Args:
+        preferences (dict): User preferences containing favorite teams and leagues
+        client (httpx.AsyncClient): Client to reuse across calls; one is created if omitted
+        base_url (str): Override for the ESPN API base URL
+        start_date (date): First date to check; today if omitted
+        end_date (date): Last date to check (inclusive); six days after start_date if omitted
+
+    Returns:
+        list: Game information dictionaries from all leagues in chronological order
+    """
+    if not preferences:
+        return []
+
+    target_dates = get_target_dates(start_date, end_date)
+    leagues = [
+        league_key for league_key in SUPPORTED_LEAGUES.keys()
+        if preferences.get(f"{league_key}_team")
+    ]
+
+    owns_client = client is None
+    if owns_client:
+        client = create_async_client()
+
+    try:
+        league_results = await asyncio.gather(
+            *(check_games_async(client, preferences[f"{league_key}_team"], league_key, target_dates, base_url)
+              for league_key in leagues)
+        )
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    all_games = []
+    for games_by_date in league_results:
+        for games_for_date in games_by_date.values():
+            all_games.extend(games_for_date)
+
+    return sort_games_chronologically(all_games)
+
+
+async def game_checker_async(preferences, client=None, base_url=None, start_date=None, end_date=None):
+    """
+    Async counterpart of game_checker that returns the summary without printing the games table.
+
+    Args:
+        preferences (dict): User preferences containing favorite teams and leagues
+        client (httpx.AsyncClient): Client to reuse across calls; one is created if omitted
+        base_url (str): Override for the ESPN API base URL
+        start_date (date): First date to check; today if omitted
+        end_date (date): Last date to check (inclusive); six days after start_date if omitted
+
+    Returns:
+        str: Summary of games for the dates checked
+    """
+    if not preferences:
+        return "No preferences provided."
+
+    target_dates = get_target_dates(start_date, end_date)
+    all_games = await collect_games_async(preferences, client, base_url, target_dates[0], target_dates[-1])
+    datetime_displays = format_game_datetimes(all_games, preferences.get("timezone"))
+
+    date_description = get_date_range_description(target_dates)
+    label = "This Week's Games:" if date_description == "this week" else f"Games for {date_description}:"
+
+    return build_games_summary(all_games, label, datetime_displays)
@@ -0,0 +1,38 @@
+import contextlib
+import tempfile
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w"):
+    """
+    Write a file through a temporary file that replaces it once the block finishes.
+
+    Readers, including concurrent runs, see either the old file or the whole
+    new one, never a partial write. If the block or the write fails, the
+    temporary file is removed and the old file is left as it was.
+
+    Args:
+        path (str): The file to write
+        mode (str): 'w' to write UTF-8 text or 'wb' to write bytes
+
+    Yields:
+        file: The temporary file, open for writing
+
+    Raises:
+        OSError: If the directory or file can not be written
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else "utf-8") as file:
+            yield file
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
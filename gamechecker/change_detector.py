@@ -0,0 +1,233 @@
+from constants import CHANGE_STATE_PATH
+from gamechecker.atomic_write import atomic_write
+from gamechecker.datetime_format import format_game_datetime
+from gamechecker.models import POSTPONED_STATUSES
+import json
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The game fields kept between runs; everything else is derived or only used for display
+GAME_STATE_FIELDS = ('league', 'team', 'team_abbr', 'opponent', 'opponent_abbr', 'is_home', 'date', 'datetime', 'status')
+
+
+def game_key(game):
+    """Get the league:team:event key a game is tracked under between runs."""
+    return f"{game['league']}:{game['team_abbr'].upper()}:{game.get('event_id') or game['date']}"
+
+
+def team_key(game):
+    """Get the league:team key a team's checked dates are tracked under between runs."""
+    return f"{game['league']}:{game['team_abbr'].upper()}"
+
+
+def normalize_game(game):
+    """Reduce a game information dictionary to the JSON fields kept between runs."""
+    return {field: game.get(field, '') for field in GAME_STATE_FIELDS}
+
+
+def is_postponed(game):
+    """Whether a normalized game is postponed or canceled."""
+    return game.get('status') in POSTPONED_STATUSES
+
+
+def diff_games(previous, current, checked_teams, target_dates, previous_spans=None):
+    """
+    Compare the games from the last run against this run.
+
+    Games only count as removed if their team was fetched successfully this run
+    and they fall inside the dates that were checked, so games that simply
+    dropped out of the search window or belong to a failed fetch are not reported.
+    Likewise, a game missing from the last run is only reported if the last run
+    checked its team on its date, so games that simply moved into the search
+    window (e.g. the next day of a rolling week) are not reported as new.
+
+    Args:
+        previous (dict): Game key to normalized game from the last run
+        current (dict): Game key to normalized game from this run
+        checked_teams (set): (league, upper-case team abbreviation) pairs fetched this run
+        target_dates (list): The dates checked this run
+        previous_spans (dict): Team key to the [first, last] date the last run checked for
+                               that team; teams without a span count as never checked
+
+    Returns:
+        dict: Lists of games under 'new', 'time_changed', 'postponed' and 'removed';
+              'time_changed' holds (previous, current) pairs
+    """
+    checked_dates = {target_date.strftime('%Y-%m-%d') for target_date in target_dates}
+    previous_spans = previous_spans or {}
+    changes = {'new': [], 'time_changed': [], 'postponed': [], 'removed': []}
+
+    for key, game in current.items():
+        old_game = previous.get(key)
+
+        span = previous_spans.get(team_key(game))
+        if not old_game and span and not span[0] <= game['date'] <= span[1]:
+            # First seen because the search window moved, not because the schedule changed
+            continue
+
+        if is_postponed(game):
+            if not old_game or not is_postponed(old_game):
+                changes['postponed'].append(game)
+        elif not old_game:
+            changes['new'].append(game)
+        elif old_game['datetime'] != game['datetime']:
+            changes['time_changed'].append((old_game, game))
+
+    for key, old_game in previous.items():
+        if key in current:
+            continue
+
+        if (old_game['league'], old_game['team_abbr']) in checked_teams and old_game['date'] in checked_dates:
+            changes['removed'].append(old_game)
+
+    return changes
+
+
+def has_changes(changes):
+    """Check if a diff from diff_games holds any change."""
+    return any(changes.values())
+
+
+def count_changes(changes):
+    """Count the changes in a diff from diff_games."""
+    return sum(len(games) for games in changes.values())
+
+
+def _describe_game(game, tz_name=None):
+    """One line describing a normalized game (e.g. 'Lakers vs Celtics 🏠 10/22/2025 07:30 PM EST')."""
+    if game['is_home']:
+        matchup = f"{game['team']} vs {game['opponent']}"
+        venue = "🏠"
+    else:
+        matchup = f"{game['team']} @ {game['opponent']}"
+        venue = "✈️"
+
+    return f"{matchup} {venue} {format_game_datetime(game['datetime'], tz_name)}"
+
+
+def build_changes_summary(changes, label="Schedule Changes:", tz_name=None):
+    """
+    Build the notification text for a diff from diff_games.
+
+    Args:
+        changes (dict): Output of diff_games
+        label (str): The first line of the summary
+        tz_name (str): Time zone to show game times in
+
+    Returns:
+        str: Summary of the changes, or None if nothing changed
+    """
+    if not has_changes(changes):
+        return None
+
+    lines = [label]
+
+    for game in changes['new']:
+        lines.append(f"🆕 {_describe_game(game, tz_name)}")
+
+    for old_game, game in changes['time_changed']:
+        lines.append(f"🕒 {_describe_game(game, tz_name)} (was {format_game_datetime(old_game['datetime'], tz_name)})")
+
+    for game in changes['postponed']:
+        lines.append(f"⛔ Postponed: {_describe_game(game, tz_name)}")
+
+    for game in changes['removed']:
+        lines.append(f"❌ Removed: {_describe_game(game, tz_name)}")
+
+    return "\n".join(lines)
+
+
+class ChangeDetector:
+    """
+    Remembers the games seen by the last run so the next run can report only what changed.
+
+    The state file holds one normalized game per league:team:event key, and
+    the first and last date each team was checked for, so a later run with a
+    different window can tell a new game from one that was never in view.
+    Teams that were not checked in a run keep their entries, so separate runs
+    for different teams can share one state file.
+    """
+
+    def __init__(self, state_path=CHANGE_STATE_PATH):
+        self.state_path = state_path
+
+
+    def _read_state(self, field):
+        """Read one dict from the state file, empty if there is no readable state."""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        value = state.get(field) if isinstance(state, dict) else None
+
+        return value if isinstance(value, dict) else {}
+
+
+    def load(self):
+        """
+        Load the games recorded by the last run.
+
+        Returns:
+            dict: Game key to normalized game, empty if there is no readable state
+        """
+        return self._read_state("games")
+
+
+    def load_spans(self):
+        """
+        Load the dates each team was last checked for.
+
+        Returns:
+            dict: Team key to its [first, last] checked date, empty if there is no readable state
+        """
+        return self._read_state("checked")
+
+
+    def save(self, games, spans=None):
+        """Atomically write the recorded games and checked dates so an interrupted run never leaves a partial file."""
+        try:
+            with atomic_write(self.state_path) as file:
+                json.dump({"games": games, "checked": spans or {}}, file, separators=(",", ":"), sort_keys=True)
+        except OSError as e:
+            print(f"Unable to save game state to {self.state_path}: {e}")
+
+
+    def detect(self, games, checked_teams, target_dates):
+        """
+        Diff this run's games against the last run and record this run's games.
+
+        Args:
+            games (list): Game information dictionaries found this run
+            checked_teams (set): (league, upper-case team abbreviation) pairs fetched this run
+            target_dates (list): The dates checked this run, in order
+
+        Returns:
+            dict: Output of diff_games
+        """
+        previous, previous_spans = self.load(), self.load_spans()
+        current = {game_key(game): normalize_game(game) for game in games}
+        changes = diff_games(previous, current, checked_teams, target_dates, previous_spans)
+
+        # Keep other teams' games, but drop this run's teams and anything already played
+        first_date = target_dates[0].strftime('%Y-%m-%d') if target_dates else ''
+        state = {
+            key: game for key, game in previous.items()
+            if (game['league'], game['team_abbr']) not in checked_teams and game['date'] >= first_date
+        }
+        state.update(current)
+
+        # This run's teams now hold exactly the games in this run's dates
+        spans = dict(previous_spans)
+        if target_dates:
+            span = [min(target_dates).strftime('%Y-%m-%d'), max(target_dates).strftime('%Y-%m-%d')]
+            for league, team_abbr in checked_teams:
+                spans[f"{league}:{team_abbr.upper()}"] = span
+        self.save(state, spans)
+
+        return changes
+
+
+change_detector = ChangeDetector()
@@ -0,0 +1,174 @@
+from gamechecker.models import EASTERN_TZ
+from datetime import date, datetime
+import calendar
+import re
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The format each league's schedule pages use, tried first for that league
+LEAGUE_DATE_FORMATS = {
+    'nba': '%a, %b %d, %Y',
+    'mlb': '%A, %b %d',
+    'nfl': '%a, %b %d, %Y',
+}
+
+# Every format the parser understands, in the order they are tried after the league's own
+FALLBACK_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%A, %b %d, %Y',
+    '%a, %b %d, %Y',
+    '%A, %b %d',
+    '%B %d, %Y',
+    '%m/%d/%Y',
+)
+
+
+def _names_pattern(names):
+    """Regex alternation for a list of month or weekday names, longest first."""
+    return "|".join(sorted((re.escape(name) for name in names if name), key=len, reverse=True))
+
+
+_MONTH_NUMBERS = {}
+for _number in range(1, 13):
+    _MONTH_NUMBERS[calendar.month_name[_number].lower()] = _number
+    _MONTH_NUMBERS[calendar.month_abbr[_number].lower()] = _number
+
+# Regex pieces for the strptime directives used above. Like strptime, names are
+# case-insensitive, a space matches any run of whitespace and the weekday is
+# checked for spelling only.
+_DIRECTIVES = {
+    '%Y': r'(?P<year>\d{4})',
+    '%m': r'(?P<month>\d{1,2})',
+    '%d': r'(?P<day>\d{1,2})',
+    '%b': rf'(?P<month_name>{_names_pattern(calendar.month_abbr)})',
+    '%B': rf'(?P<month_name>{_names_pattern(calendar.month_name)})',
+    '%a': rf'(?:{_names_pattern(calendar.day_abbr)})',
+    '%A': rf'(?:{_names_pattern(calendar.day_name)})',
+}
+
+
+def compile_date_format(date_format):
+    """
+    Compile a strptime date format into an equivalent regular expression.
+
+    Args:
+        date_format (str): A format built from %Y, %m, %d, %b, %B, %a and %A
+
+    Returns:
+        re.Pattern: A case-insensitive pattern with year/month/day groups
+    """
+    pattern = ""
+    for piece in re.split(r'(%[a-zA-Z])', date_format):
+        if piece in _DIRECTIVES:
+            pattern += _DIRECTIVES[piece]
+        else:
+            pattern += r'\s+'.join(re.escape(part) for part in piece.split(' '))
+
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def current_year():
+    """Get the current year in Eastern time, used for formats without a year."""
+    return datetime.now(EASTERN_TZ).year
+
+
+class DateParser:
+    """
+    Parse schedule date strings with compiled patterns instead of a strptime cascade.
+
+    The parser remembers which format last succeeded for each league (or any
+    other source key) and tries it first, so a feed with one consistent format
+    is matched on the first attempt.
+    """
+
+    def __init__(self, league_formats=None, fallback_formats=FALLBACK_DATE_FORMATS):
+        self.league_formats = LEAGUE_DATE_FORMATS if league_formats is None else league_formats
+        self.fallback_formats = tuple(fallback_formats)
+        self.last_formats = {}
+
+        all_formats = list(self.league_formats.values()) + list(self.fallback_formats)
+        self._patterns = {date_format: compile_date_format(date_format) for date_format in all_formats}
+
+
+    def _candidate_formats(self, source):
+        """The formats to try for a source: last success, league format, then fallbacks."""
+        candidates = []
+        for date_format in (self.last_formats.get(source), self.league_formats.get(source), *self.fallback_formats):
+            if date_format and date_format not in candidates:
+                candidates.append(date_format)
+
+        return candidates
+
+
+    def _match(self, date_format, date_str, year):
+        """Build a date if date_str matches date_format, otherwise return None."""
+        match = self._patterns[date_format].fullmatch(date_str)
+        if not match:
+            return None
+
+        fields = match.groupdict()
+        if fields.get('month_name'):
+            month = _MONTH_NUMBERS[fields['month_name'].lower()]
+        else:
+            month = int(fields['month'])
+
+        try:
+            return date(int(fields['year']) if fields.get('year') else year, month, int(fields['day']))
+        except ValueError:
+            return None
+
+
+    def parse(self, date_str, source=None, year=None):
+        """
+        Parse one date string.
+
+        Args:
+            date_str (str): The date string from the game
+            source (str): The league or feed the string came from (e.g., 'nba')
+            year (int): Year for formats without one; the current year if omitted
+
+        Returns:
+            date: Parsed date object or None if no format matches
+        """
+        if not date_str or not isinstance(date_str, str):
+            return None
+
+        if year is None:
+            year = current_year()
+
+        for date_format in self._candidate_formats(source):
+            parsed_date = self._match(date_format, date_str, year)
+            if parsed_date is not None:
+                self.last_formats[source] = date_format
+                return parsed_date
+
+        return None
+
+
+    def parse_many(self, date_strs, source=None, year=None):
+        """
+        Parse a list of date strings, parsing each distinct string only once.
+
+        Args:
+            date_strs (list): The date strings to parse
+            source (str): The league or feed the strings came from (e.g., 'nba')
+            year (int): Year for formats without one; the current year if omitted
+
+        Returns:
+            list: A date (or None) for each string, in the same order
+        """
+        if year is None:
+            year = current_year()
+
+        parsed = {}
+        results = []
+        for date_str in date_strs:
+            if date_str not in parsed:
+                parsed[date_str] = self.parse(date_str, source, year)
+            results.append(parsed[date_str])
+
+        return results
+
+
+game_date_parser = DateParser()
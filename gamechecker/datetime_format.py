@@ -0,0 +1,91 @@
+from constants import DISPLAY_TIMEZONE
+from gamechecker.models import EASTERN_TZ, parse_espn_datetime
+from datetime import datetime
+from functools import lru_cache
+import pytz
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Eastern times have always been labelled "EST" in the games table and the Pushover summary
+EASTERN_LABEL = "EST"
+
+# A week of games for every team in a league is only a few hundred distinct start times
+FORMAT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def get_timezone(tz_name=None):
+    """
+    Get a timezone object, looking each name up only once per process.
+
+    Args:
+        tz_name (str): An IANA time zone name (e.g., 'America/Chicago'); Eastern time if omitted
+
+    Returns:
+        tzinfo: The time zone, or Eastern time if the name is not known
+    """
+    if not tz_name:
+        return EASTERN_TZ
+
+    try:
+        return pytz.timezone(tz_name)
+    except pytz.UnknownTimeZoneError:
+        print(f"⚠️  Unknown time zone '{tz_name}', showing game times in Eastern time.")
+        return EASTERN_TZ
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _parse_iso_datetime(value):
+    """Memoized parse_espn_datetime for callers that still pass ISO strings."""
+    return parse_espn_datetime(value)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_start(start, tz_name):
+    """Format one aware start time for one time zone."""
+    tz = get_timezone(tz_name)
+    local_start = start.astimezone(tz)
+    label = EASTERN_LABEL if tz is EASTERN_TZ else local_start.strftime('%Z')
+
+    return f"{local_start.strftime('%m/%d/%Y %I:%M %p')} {label}"
+
+
+def format_game_datetime(game_datetime, tz_name=None):
+    """
+    Format a game's start time for display.
+
+    Results are memoized per start time and time zone, so the same game
+    shown in the games table and the summary is only formatted once.
+
+    Args:
+        game_datetime (datetime | str): The aware start time of the game, or its ISO string
+        tz_name (str): Time zone to show the time in; DISPLAY_TIMEZONE or Eastern time if omitted
+
+    Returns:
+        str: Formatted date and time string or 'TBD' if there is no start time
+    """
+    if isinstance(game_datetime, datetime):
+        start = game_datetime
+    elif game_datetime and 'T' in game_datetime:
+        start = _parse_iso_datetime(game_datetime)
+        if start is None:
+            return game_datetime
+    else:
+        return 'TBD'
+
+    return _format_start(start, tz_name or DISPLAY_TIMEZONE)
+
+
+def format_game_datetimes(games, tz_name=None):
+    """
+    Format the start time of every game in a list in one pass.
+
+    Args:
+        games (list): List of game dictionaries
+        tz_name (str): Time zone to show the times in; DISPLAY_TIMEZONE or Eastern time if omitted
+
+    Returns:
+        list: The display string for each game, in the same order as the games
+    """
+    return [format_game_datetime(game.get('start') or game.get('datetime', ''), tz_name) for game in games]
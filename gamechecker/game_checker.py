@@ -1,8 +1,20 @@
 from datetime import datetime, date, timedelta
-from constants import SUPPORTED_LEAGUES
-import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from constants import SUPPORTED_LEAGUES, ESPN_API_BASE_URL, ESPN_MAX_WORKERS, ESPN_FETCH_STRATEGY, ESPN_SCOREBOARD_DAYS_PER_REQUEST
+from gamechecker.schedule_decoder import SCHEDULE_CHUNK_SIZE, decode_schedule_stream
+from gamechecker.schedule_cache import schedule_cache
+from gamechecker.http_client import get_session
+from gamechecker.rate_limiter import espn_rate_limiter
+from gamechecker.retry import RequestCancelled, call_with_retry, get_retry_stats, get_status_code
+from gamechecker.models import EASTERN_TZ, GameCheckEvent, make_game
+from gamechecker.datetime_format import format_game_datetime, format_game_datetimes
+from gamechecker.date_parser import game_date_parser
+from gamechecker.team_registry import team_registry
+from gamechecker.schedule_index import ScheduleIndex
+from gamechecker.season_index import SeasonIndex, season_indexes
+from gamechecker.change_detector import change_detector, build_changes_summary, count_changes
+import threading
 import requests
-import pytz
 import ssl
 import json
 import os, sys
@@ -11,76 +23,470 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 def get_current_date():
     """Get the current date using Eastern timezone for consistency."""
-    eastern_tz = pytz.timezone('US/Eastern')
-    now_eastern = datetime.now(eastern_tz)
+    now_eastern = datetime.now(EASTERN_TZ)
     current_date = now_eastern.date()
     
     return current_date
 
 
 def get_team_name_from_abbreviation(abbreviation, league):
-    """Get the full team name from abbreviation for a specific league."""
-    if league not in SUPPORTED_LEAGUES:
-        return None
-        
-    teams = SUPPORTED_LEAGUES[league]["teams"]
-    for name, abbr in teams:
-        if abbr.lower() == abbreviation.lower():
-            return name
+    """Get the full team name from an abbreviation, ESPN alias or name for a specific league."""
+    return team_registry.get_name(abbreviation, league)
+
+
+def iter_until_cancelled(chunks, cancel_event):
+    """Pass response chunks through, raising RequestCancelled as soon as cancel_event is set."""
+    for chunk in chunks:
+        if cancel_event.is_set():
+            raise RequestCancelled()
+        yield chunk
+
+
+def fetch_schedule_payload(league, team_abbr, url, cancel_event=None):
+    """
+    Get the ESPN schedule document for a team, going through the on-disk cache.
+
+    Fresh entries are served without a request. Stale entries are revalidated
+    with ETag/Last-Modified, and are used as a fallback if ESPN refuses the request.
+    Throttling and transient failures are retried with backoff before giving up.
+    The response body is decoded as it streams in, so it is never held whole.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team abbreviation
+        url (str): The ESPN schedule URL for the team
+        cancel_event (threading.Event): Once set, the download stops between chunks
+                                        and no further request or retry is made
+
+    Returns:
+        dict: The schedule document, reduced to the fields the parsers read
+
+    Raises:
+        RequestCancelled: If cancel_event is set before the document is complete
+    """
+    entry = schedule_cache.load(league, team_abbr)
+    if entry and schedule_cache.is_fresh(entry, league):
+        schedule_cache.count("hits")
+        return entry["payload"]
+
+    def request():
+        espn_rate_limiter.acquire()
+        if cancel_event is not None and cancel_event.is_set():
+            raise RequestCancelled()
+        response = get_session().get(url, headers=schedule_cache.conditional_headers(entry), stream=True)
+
+        try:
+            if response.status_code == 429:
+                espn_rate_limiter.penalize()
+            elif response.ok:
+                espn_rate_limiter.reward()
+
+            if response.status_code == 304:
+                return response, None
+
+            response.raise_for_status()
+            chunks = response.iter_content(SCHEDULE_CHUNK_SIZE)
+            if cancel_event is not None:
+                chunks = iter_until_cancelled(chunks, cancel_event)
+            try:
+                return response, decode_schedule_stream(chunks)
+            except json.JSONDecodeError as e:
+                # Report a malformed body as a failed request, as response.json() would
+                raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+        finally:
+            response.close()
+
+    try:
+        response, payload = call_with_retry(request, cancel_event=cancel_event)
+    except requests.exceptions.RequestException:
+        if entry:
+            schedule_cache.count("stale")
+            return entry["payload"]
+        raise
+
+    if response.status_code == 304 and entry:
+        schedule_cache.count("revalidated")
+        return schedule_cache.touch(league, team_abbr, entry)["payload"]
+
+    schedule_cache.count("misses")
+    schedule_cache.store(league, team_abbr, payload, response.headers)
+
+    return payload
+
 
-    return None
+SPORT_PATHS = {
+    'nfl': 'football/nfl',
+    'nba': 'basketball/nba', 
+    'mlb': 'baseball/mlb'
+}
+
+
+def build_schedule_url(league, team_abbr, base_url=None):
+    """
+    Build the ESPN schedule URL for a team.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team abbreviation
+        base_url (str): Override for ESPN_API_BASE_URL, e.g. a local stand-in server
+
+    Returns:
+        str: The schedule URL
+    """
+    sport_path = SPORT_PATHS.get(league)
+    if not sport_path:
+        raise ValueError(f"Unsupported league: {league}")
+
+    return f"{base_url or ESPN_API_BASE_URL}/{sport_path}/teams/{team_abbr}/schedule"
+
+
+def get_event_status(event):
+    """Get the ESPN status name of an event (e.g., 'STATUS_SCHEDULED'), or '' if it has none."""
+    status = event.get('competitions', [{}])[0].get('status')
+    if not isinstance(status, dict):
+        return ''
+
+    return status.get('type', {}).get('name', '')
+
+
+def parse_schedule_events(data, team_abbr, league):
+    """
+    Extract a team's games from an ESPN schedule document.
+
+    Args:
+        data (dict): The decoded ESPN schedule document
+        team_abbr (str): The team abbreviation
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+    Returns:
+        list: List of Game records for the team
+    """
+    games = []
+    events = data.get('events', [])
+    
+    for event in events:
+        competitors = event.get('competitions', [{}])[0].get('competitors', [])
+        for competitor in competitors:
+            team_data = competitor.get('team', {})
+
+            if team_data.get('abbreviation', '').upper() == team_abbr.upper():
+                opponent = None
+                for comp in competitors:
+                    if comp != competitor:
+                        opponent = comp.get('team', {}).get('abbreviation', 'Unknown')
+                        break
+                
+                game = make_game(league, team_abbr, opponent, competitor.get('homeAway') == 'home',
+                                 event.get('date', ''), event.get('id', ''), get_event_status(event))
+                if game:
+                    games.append(game)
+                break
+    
+    return games
+
+
+def fetch_team_schedule(league, team_abbr, cancel_event=None):
+    """
+    Get schedule from ESPN API for a specific team, raising on any failure.
+
+    A fresh season index for the league answers without any request.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team abbreviation
+        cancel_event (threading.Event): Once set, the request is abandoned
+
+    Returns:
+        ScheduleIndex: The team's games, indexed by date
+    """
+    season_index = season_indexes.get(league)
+    if season_index is not None:
+        return season_index.team_schedule(team_abbr)
+
+    return download_team_schedule(league, team_abbr, cancel_event)
+
+
+def download_team_schedule(league, team_abbr, cancel_event=None):
+    """
+    Get a team's schedule from ESPN (through the schedule cache), ignoring any season index.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team abbreviation
+        cancel_event (threading.Event): Once set, the request is abandoned
+
+    Returns:
+        ScheduleIndex: The team's games, indexed by date
+    """
+    url = build_schedule_url(league, team_abbr)
+    data = fetch_schedule_payload(league, team_abbr, url, cancel_event)
+
+    return ScheduleIndex(parse_schedule_events(data, team_abbr, league))
 
 
 def get_schedule_from_espn(league, team_abbr):
     """Get schedule from ESPN API for a specific team in any league"""
-    sport_paths = {
-        'nfl': 'football/nfl',
-        'nba': 'basketball/nba', 
-        'mlb': 'baseball/mlb'
-    }
-    
-    sport_path = sport_paths.get(league)
-    if not sport_path:
+    if league not in SPORT_PATHS:
         print(f"Unsupported league: {league}")
         return []
     
     try:
-        url = f"https://site.api.espn.com/apis/site/v2/sports/{sport_path}/teams/{team_abbr}/schedule"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        games = []
-        events = data.get('events', [])
-        
-        for event in events:
-            competitors = event.get('competitions', [{}])[0].get('competitors', [])
-            for competitor in competitors:
-                team_data = competitor.get('team', {})
-
-                if team_data.get('abbreviation', '').upper() == team_abbr.upper():
-                    opponent = None
-                    for comp in competitors:
-                        if comp != competitor:
-                            opponent = comp.get('team', {}).get('abbreviation', 'Unknown')
-                            break
-                    
-                    game_info = {
-                        'date': event.get('date', ''),
-                        'opponent_abbr': opponent,
-                        'location': 'Home' if competitor.get('homeAway') == 'home' else 'Away'
-                    }
-
-                    games.append(game_info)
-                    break
-        
-        return games
-        
+        return fetch_team_schedule(league, team_abbr)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching {league.upper()} schedule for {team_abbr}: {e}")
         return []
 
 
+def fetch_team_schedules(league, team_abbrs, cancel_event=None):
+    """
+    Fetch several teams' schedules in parallel.
+
+    Requests are paced by the shared token bucket rather than a fixed sleep.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbrs (list): List of team abbreviations
+        cancel_event (threading.Event): Once set, the remaining requests are abandoned
+
+    Returns:
+        list: A (schedule, error) tuple per team, in the same order as team_abbrs
+    """
+    if not team_abbrs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(ESPN_MAX_WORKERS, len(team_abbrs))) as executor:
+        return list(executor.map(lambda team_abbr: fetch_team_result(league, team_abbr, cancel_event), team_abbrs))
+
+
+def fetch_team_result(league, team_abbr, cancel_event=None):
+    """Fetch a team's schedule as a (schedule, error) tuple instead of raising."""
+    try:
+        return fetch_team_schedule(league, team_abbr, cancel_event), None
+    except Exception as e:
+        return None, e
+
+
+def build_scoreboard_url(league, start_date, end_date, base_url=None):
+    """
+    Build the ESPN league scoreboard URL for a date range.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        start_date (date): First date of the range
+        end_date (date): Last date of the range (inclusive)
+        base_url (str): Override for ESPN_API_BASE_URL, e.g. a local stand-in server
+
+    Returns:
+        str: The scoreboard URL
+    """
+    sport_path = SPORT_PATHS.get(league)
+    if not sport_path:
+        raise ValueError(f"Unsupported league: {league}")
+
+    dates = f"{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}"
+    return f"{base_url or ESPN_API_BASE_URL}/{sport_path}/scoreboard?dates={dates}&limit=1000"
+
+
+def parse_scoreboard_events(data, team_abbrs, league):
+    """
+    Extract the selected teams' games from an ESPN league scoreboard document.
+
+    Args:
+        data (dict): The decoded ESPN scoreboard document
+        team_abbrs (list): The team abbreviations to keep
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+    Returns:
+        dict: Upper-cased team abbreviation to a list of Game records
+    """
+    schedules = {team_abbr.upper(): [] for team_abbr in team_abbrs}
+
+    for event in data.get('events', []):
+        competitors = event.get('competitions', [{}])[0].get('competitors', [])
+        abbreviations = [comp.get('team', {}).get('abbreviation', '').upper() for comp in competitors]
+
+        for competitor, abbreviation in zip(competitors, abbreviations):
+            if abbreviation not in schedules:
+                continue
+
+            opponent = next((abbr for abbr in abbreviations if abbr != abbreviation), 'Unknown')
+            game = make_game(league, abbreviation, opponent, competitor.get('homeAway') == 'home',
+                             event.get('date', ''), event.get('id', ''), get_event_status(event))
+            if game:
+                schedules[abbreviation].append(game)
+
+    return schedules
+
+
+def choose_fetch_strategy(team_count, day_count):
+    """
+    Decide whether to fetch per-team schedules or league scoreboards.
+
+    Team mode costs one request per team. Scoreboard mode costs one request per
+    ESPN_SCOREBOARD_DAYS_PER_REQUEST days, whatever the number of teams.
+
+    Args:
+        team_count (int): Number of teams being checked
+        day_count (int): Number of days spanned by the search
+
+    Returns:
+        str: 'team' or 'scoreboard'
+    """
+    if ESPN_FETCH_STRATEGY in ('team', 'scoreboard'):
+        return ESPN_FETCH_STRATEGY
+
+    scoreboard_requests = -(-day_count // ESPN_SCOREBOARD_DAYS_PER_REQUEST)
+    return 'scoreboard' if scoreboard_requests < team_count else 'team'
+
+
+def get_scoreboard_chunks(target_dates):
+    """
+    Split the dates being checked into the date ranges fetched by one scoreboard request each.
+
+    Args:
+        target_dates (list): The dates being checked
+
+    Returns:
+        list: (start date, end date, cache key) tuples covering every date, in order
+    """
+    first_date, last_date = min(target_dates), max(target_dates)
+    chunks = []
+    chunk_start = first_date
+
+    while chunk_start <= last_date:
+        chunk_end = min(last_date, chunk_start + timedelta(days=ESPN_SCOREBOARD_DAYS_PER_REQUEST - 1))
+        cache_key = f"scoreboard-{chunk_start.strftime('%Y%m%d')}-{chunk_end.strftime('%Y%m%d')}"
+        chunks.append((chunk_start, chunk_end, cache_key))
+        chunk_start = chunk_end + timedelta(days=1)
+
+    return chunks
+
+
+def fetch_scoreboard_schedules(league, team_abbrs, target_dates, cancel_event=None):
+    """
+    Fetch the selected teams' games from the league scoreboard instead of each team's schedule.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbrs (list): List of team abbreviations
+        target_dates (list): The dates being checked
+        cancel_event (threading.Event): Once set, the remaining requests are abandoned
+
+    Returns:
+        list: A (schedule, error) tuple per team, in the same order as team_abbrs
+    """
+    chunks = get_scoreboard_chunks(target_dates)
+
+    def fetch(chunk):
+        start_date, end_date, cache_key = chunk
+        url = build_scoreboard_url(league, start_date, end_date)
+        return fetch_schedule_payload(league, cache_key, url, cancel_event)
+
+    with ThreadPoolExecutor(max_workers=min(ESPN_MAX_WORKERS, len(chunks))) as executor:
+        payloads = list(executor.map(fetch, chunks))
+
+    schedules = {team_abbr.upper(): [] for team_abbr in team_abbrs}
+    for payload in payloads:
+        for team_abbr, games in parse_scoreboard_events(payload, team_abbrs, league).items():
+            schedules[team_abbr].extend(games)
+
+    return [(ScheduleIndex(schedules[team_abbr.upper()]), None) for team_abbr in team_abbrs]
+
+
+def fetch_schedules_for_dates(league, team_abbrs, target_dates, cancel_event=None):
+    """
+    Fetch schedules for the given teams using the cheaper of team or scoreboard mode.
+
+    If the scoreboard cannot be fetched, each team's schedule is fetched instead.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbrs (list): List of team abbreviations
+        target_dates (list): The dates being checked
+        cancel_event (threading.Event): Once set, the remaining requests are abandoned
+
+    Returns:
+        list: A (schedule, error) tuple per team, in the same order as team_abbrs
+    """
+    if not team_abbrs or not target_dates:
+        return []
+
+    season_index = season_indexes.get(league)
+    if season_index is not None:
+        return [(season_index.team_schedule(team_abbr), None) for team_abbr in team_abbrs]
+
+    day_count = (max(target_dates) - min(target_dates)).days + 1
+    if choose_fetch_strategy(len(team_abbrs), day_count) == 'scoreboard':
+        try:
+            return fetch_scoreboard_schedules(league, team_abbrs, target_dates, cancel_event)
+        except RequestCancelled:
+            raise
+        except Exception as e:
+            print(f"Scoreboard unavailable for {league.upper()} ({e}), fetching team schedules instead.")
+
+    return fetch_team_schedules(league, team_abbrs, cancel_event)
+
+
+def build_season_index(league):
+    """
+    Download every team's schedule in a league concurrently and save a deduplicated season index.
+
+    The index is only saved if every team could be fetched and no game was
+    dropped for sharing its event id with another, so a partial season is
+    never used to answer queries.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+    Returns:
+        SeasonIndex: The saved index, or None if it is incomplete or could not be written
+    """
+    team_abbrs = [abbr.lower() for _, abbr in team_registry.teams(league)]
+    if not team_abbrs:
+        print(f"Unsupported league: {league}")
+        return None
+
+    league_name = SUPPORTED_LEAGUES[league]["name"]
+    print(f"📚 Building the {league_name} season index from {len(team_abbrs)} team schedules...")
+
+    def fetch(team_abbr):
+        try:
+            return download_team_schedule(league, team_abbr), None
+        except Exception as e:
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=min(ESPN_MAX_WORKERS, len(team_abbrs))) as executor:
+        results = list(executor.map(fetch, team_abbrs))
+
+    failed_teams = [(team_abbr, error) for team_abbr, (_, error) in zip(team_abbrs, results) if error is not None]
+    if failed_teams:
+        for team_abbr, error in failed_teams:
+            print(f"   {team_abbr.upper()}:{describe_fetch_error(error)}")
+        print(f"❌ {len(failed_teams)} team schedule(s) could not be fetched; the {league_name} index was not saved.")
+        return None
+
+    season_index = SeasonIndex.from_schedules(league, (schedule for schedule, _ in results))
+    if season_index.conflicts:
+        for event_id, start, home, away, _ in season_index.conflicts:
+            print(f"   {away} @ {home} {start}: event id {event_id} is already used by another game")
+        print(f"❌ {len(season_index.conflicts)} game(s) clashed with another game's event id; the {league_name} index was not saved.")
+        return None
+
+    indexed_teams = set(season_index.teams())
+    missing_teams = [team_abbr.upper() for team_abbr in team_abbrs if team_abbr.upper() not in indexed_teams]
+    if missing_teams:
+        print(f"⚠️  No games found for {', '.join(missing_teams)}")
+
+    path = season_indexes.save(season_index)
+    if path is None:
+        print(f"❌ The {league_name} index could not be saved.")
+        return None
+
+    print(f"✅ Saved {len(season_index.events)} {league_name} games for {len(season_index.teams())} teams to {path}")
+
+    return season_index
+
+
 def get_schedule_for_league(league, team_abbr):
     """Get schedule data for a team in the specified league"""
     return get_schedule_from_espn(league, team_abbr)
@@ -107,6 +513,308 @@ def get_date_description(target_date):
         return target_date.strftime('%B %d, %Y')
 
 
+def get_date_range_description(target_dates):
+    """
+    Get a readable description for a list of dates.
+
+    Args:
+        target_dates (list): The dates being searched, in order
+
+    Returns:
+        str: Human-readable description of the date range
+    """
+    if len(target_dates) == 1:
+        return get_date_description(target_dates[0])
+
+    first_date, last_date = target_dates[0], target_dates[-1]
+    if first_date == get_current_date() and len(target_dates) == 7:
+        return "this week"
+
+    return f"{first_date.strftime('%B %d')} - {last_date.strftime('%B %d, %Y')}"
+
+
+def bucket_schedule_by_date(schedule, target_dates):
+    """
+    Get the first game of a team's schedule on each target date.
+
+    Only the games between the first and last target date are visited, found by
+    bisecting the schedule's date index.
+
+    Args:
+        schedule (ScheduleIndex | list): A team's schedule as fetched, or a plain list of Game records
+        target_dates (iterable): The dates to keep
+
+    Returns:
+        dict: Dictionary with dates as keys and the first game on that date as values, in date order
+    """
+    wanted_dates = set(target_dates)
+    if not wanted_dates:
+        return {}
+
+    index = schedule if isinstance(schedule, ScheduleIndex) else ScheduleIndex(schedule)
+    first_date, last_date = min(wanted_dates), max(wanted_dates)
+    games_by_date = index.first_game_per_date(first_date, last_date)
+
+    if len(wanted_dates) == (last_date - first_date).days + 1:
+        return games_by_date
+
+    return {game_date: game for game_date, game in games_by_date.items() if game_date in wanted_dates}
+
+
+def build_team_games(games_by_date, team_abbr, team_name, league, target_dates):
+    """
+    Build the game information dictionaries for one team's bucketed games.
+
+    Args:
+        games_by_date (dict): Output of bucket_schedule_by_date for the team
+        team_abbr (str): The team abbreviation
+        team_name (str): The full team name
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        target_dates (list): The dates being checked, in order
+
+    Returns:
+        list: (date, game_info) tuples in date order
+    """
+    league_name = SUPPORTED_LEAGUES[league]["name"]
+    team_games = []
+
+    # Only the dates that have a game are visited, however long the range is
+    for target_date in sorted(games_by_date):
+        game = games_by_date[target_date]
+
+        opponent = game.opponent_abbr
+        opponent_name = get_team_name_from_abbreviation(opponent, league)
+        
+        game_info = {
+            'league': league,
+            'league_name': league_name,
+            'team': team_name,
+            'team_abbr': team_abbr.upper(),
+            'opponent': opponent_name or opponent,
+            'opponent_abbr': opponent,
+            'is_home': game.is_home,
+            'date': target_date.strftime('%Y-%m-%d'),
+            'datetime': game.iso_datetime,
+            'start': game.start,
+            'event_id': game.event_id,
+            'status': game.status
+        }
+        
+        team_games.append((target_date, game_info))
+
+    return team_games
+
+
+def fetch_league_schedules(favorite_teams, league, target_dates):
+    """
+    Fetch the schedules of a league's favorite teams without printing anything.
+
+    Args:
+        favorite_teams (list): List of team abbreviations (e.g., ['lal', 'bos'])
+        league (str): The league to check (e.g., 'nba', 'nfl', 'mlb')
+        target_dates (list): The dates to check for games, in order
+
+    Returns:
+        dict: Team abbreviation to a (schedule, error) tuple; unknown teams are left out
+    """
+    if not favorite_teams or not target_dates or league not in SUPPORTED_LEAGUES:
+        return {}
+
+    resolved_teams = {team_abbr: team_registry.resolve(team_abbr, league) for team_abbr in favorite_teams}
+    known_teams = {team_abbr: abbr.lower() for team_abbr, abbr in resolved_teams.items() if abbr}
+
+    return dict(zip(known_teams, fetch_schedules_for_dates(league, list(known_teams.values()), target_dates)))
+
+
+def describe_team_result(game_count):
+    """Get the status shown next to a team once its schedule has been searched."""
+    if game_count == 1:
+        return " ✅ Game Found!"
+    elif game_count:
+        return f" ✅ {game_count} Games Found!"
+
+    return " ❌ No game"
+
+
+def format_check_event(event):
+    """
+    Get the progress line for an event from iter_games.
+
+    Args:
+        event (GameCheckEvent): The event to describe
+
+    Returns:
+        str: The line to show, or None for events that are not shown as progress (games)
+    """
+    if event.kind == 'unknown_team':
+        return f"   ⚠️  Unknown team: {event.team_abbr}"
+
+    if event.kind == 'error':
+        status = describe_fetch_error(event.error)
+    elif event.kind == 'team':
+        status = describe_team_result(event.game_count)
+    else:
+        return None
+
+    return f"   📅 {event.team_name}...{' ' * (40 - len(event.team_name))}{status}"
+
+
+# How often a cancellable search checks whether it has been cancelled while waiting on ESPN
+CANCEL_POLL_SECONDS = 0.1
+
+
+def iter_games(preferences, target_dates=None, cancel_event=None):
+    """
+    Yield games and per-team results as soon as each fetch finishes.
+
+    Every team (or league scoreboard, when that needs fewer requests) is
+    fetched concurrently, and events are yielded in the order the fetches
+    complete, so the first result arrives after a single request. Closing
+    the generator early, or setting cancel_event, cancels the fetches that
+    have not started yet and stops those in flight between response chunks
+    or before their next retry, so no further request is made.
+
+    Args:
+        preferences (dict): User preferences containing favorite teams and leagues
+        target_dates (list): The dates to check, in order; this week if omitted
+        cancel_event (threading.Event): Stops the search within CANCEL_POLL_SECONDS once set
+
+    Yields:
+        GameCheckEvent: A 'game' event per game found, then a 'team' (or 'error')
+                        event once that team is done; 'unknown_team' events come first
+    """
+    target_dates = target_dates or get_week_dates()
+    day_count = (max(target_dates) - min(target_dates)).days + 1
+    executor = ThreadPoolExecutor(max_workers=ESPN_MAX_WORKERS)
+    futures = {}
+    # Set once the search ends for any reason, so fetches still running stop too
+    stop_fetching = threading.Event()
+
+    try:
+        for league in SUPPORTED_LEAGUES:
+            known_teams = {}
+            for team_abbr in preferences.get(f"{league}_team") or []:
+                abbr = team_registry.resolve(team_abbr, league)
+                if abbr is None:
+                    yield GameCheckEvent('unknown_team', league, team_abbr)
+                elif abbr not in known_teams:
+                    known_teams[abbr] = team_registry.get_name(abbr, league)
+
+            if not known_teams:
+                continue
+
+            if choose_fetch_strategy(len(known_teams), day_count) == 'scoreboard':
+                team_abbrs = list(known_teams)
+                future = executor.submit(
+                    lambda league, team_abbrs: list(zip(team_abbrs, fetch_schedules_for_dates(
+                        league, [abbr.lower() for abbr in team_abbrs], target_dates, stop_fetching))),
+                    league, team_abbrs
+                )
+                futures[future] = (league, known_teams)
+            else:
+                for abbr in known_teams:
+                    future = executor.submit(
+                        lambda league, abbr: [(abbr, fetch_team_result(league, abbr.lower(), stop_fetching))], league, abbr
+                    )
+                    futures[future] = (league, known_teams)
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=CANCEL_POLL_SECONDS if cancel_event else None,
+                                 return_when=FIRST_COMPLETED)
+
+            for future in done:
+                league, team_names = futures[future]
+
+                for abbr, (schedule, error) in future.result():
+                    if cancel_event is not None and cancel_event.is_set():
+                        return
+
+                    team_name = team_names[abbr]
+                    if error is not None:
+                        yield GameCheckEvent('error', league, abbr, team_name, error=error)
+                        continue
+
+                    games_by_date = bucket_schedule_by_date(schedule, target_dates)
+                    for _, game_info in build_team_games(games_by_date, abbr, team_name, league, target_dates):
+                        yield GameCheckEvent('game', league, abbr, team_name, game=game_info)
+
+                    yield GameCheckEvent('team', league, abbr, team_name, game_count=len(games_by_date))
+
+            if cancel_event is not None and cancel_event.is_set():
+                return
+    finally:
+        stop_fetching.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def check_games_for_dates(favorite_teams, league, target_dates):
+    """
+    Check if any of the selected favorite teams have games scheduled on any of the given dates.
+
+    Each team's schedule is downloaded once and answers every date in the list.
+    The search runs through iter_games and each team's line is printed with
+    format_check_event as it finishes, exactly as the GUI and collect_games show it.
+
+    Args:
+        favorite_teams (list): List of team abbreviations (e.g., ['lal', 'bos'])
+        league (str): The league to check (e.g., 'nba', 'nfl', 'mlb') - REQUIRED
+        target_dates (list): The dates to check for games, in order
+
+    Returns:
+        dict: Dictionary with each target date as a key and a list of game information as values,
+              each list in the order of favorite_teams
+    """
+    games_found = {target_date: [] for target_date in target_dates}
+
+    if not favorite_teams or not target_dates or league not in SUPPORTED_LEAGUES:
+        return games_found
+
+    league_name = SUPPORTED_LEAGUES[league]["name"]
+    print(f"\n🔍 Searching {league_name} games for {get_date_range_description(target_dates)}...")
+    print("─" * 90)
+
+    dates_by_text = {target_date.strftime('%Y-%m-%d'): target_date for target_date in target_dates}
+    for event in iter_games({f"{league}_team": favorite_teams}, target_dates):
+        if event.kind == 'game':
+            games_found[dates_by_text[event.game['date']]].append(event.game)
+        else:
+            print(format_check_event(event))
+
+    # Teams finish in any order, so each date's games are put back in the order the teams were given
+    team_order = {}
+    for team_abbr in favorite_teams:
+        team_order.setdefault(team_registry.resolve(team_abbr, league), len(team_order))
+    for games in games_found.values():
+        games.sort(key=lambda game: team_order[game['team_abbr']])
+
+    return games_found
+
+
+def describe_fetch_error(error):
+    """
+    Describe a failed schedule fetch for the per-team status line.
+
+    Args:
+        error (Exception): The error raised while fetching the schedule
+
+    Returns:
+        str: The status text to print
+    """
+    status_code = get_status_code(error)
+
+    if status_code == 429:
+        return " ⚠️ Rate limit"
+    elif status_code == 403:
+        return " 🚫 Blocked"
+    elif isinstance(error, requests.exceptions.HTTPError):
+        return f" ❌ HTTP error: {str(error)}"
+    elif isinstance(error, requests.exceptions.RequestException):
+        return f" ❌ Network error: {str(error)}"
+
+    return f" ❌ Error: {str(error)}"
+
+
 def check_games(favorite_teams, league, target_date):
     """
     Check if any of the selected favorite teams have games scheduled for a specific date.
@@ -119,86 +827,28 @@ def check_games(favorite_teams, league, target_date):
     Returns:
         list: List of dictionaries containing game information for the target date
     """
-    games_found = []
-    
-    if not favorite_teams or league not in SUPPORTED_LEAGUES:
-        return games_found
-    
-    league_name = SUPPORTED_LEAGUES[league]["name"]
-    date_description = get_date_description(target_date)
-    print(f"\n🔍 Searching {league_name} games for {date_description}...")
-    print("─" * 90)
-    
-    for i, team_abbr in enumerate(favorite_teams):
-        team_name = get_team_name_from_abbreviation(team_abbr, league)
-        if not team_name:
-            print(f"   ⚠️  Unknown team: {team_abbr}")
-            continue
-            
-        print(f"   📅 {team_name}...", end="")
-        print(" " * (40 - len(team_name)), end="")
-        
-        try:
-            # Put a sleep between requests to avoid rate limiting
-            if i > 0:
-                time.sleep(0.5)  # Reduced sleep time since ESPN is more reliable
-            schedule = get_schedule_for_league(league, team_abbr)
-            
-            team_has_game = False
-            
-            for game in schedule:
-                try:
-                    game_date_str = game.get('date', '')
-                    if game_date_str:
-                        game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00')).date()
-                    else:
-                        continue
-                except (ValueError, AttributeError):
-                    continue
-                
-                if game_date == target_date:
-                    is_home = game.get('location') == 'Home'
-                    opponent = game.get('opponent_abbr', 'Unknown')
-                    opponent_name = get_team_name_from_abbreviation(opponent, league)
-                    
-                    game_info = {
-                        'league': league,
-                        'league_name': league_name,
-                        'team': team_name,
-                        'team_abbr': team_abbr.upper(),
-                        'opponent': opponent_name or opponent,
-                        'opponent_abbr': opponent,
-                        'is_home': is_home,
-                        'date': game_date.strftime('%Y-%m-%d'),
-                        'datetime': game.get('date', '')
-                    }
-                    
-                    games_found.append(game_info)
-                    print(" ✅ Game Found!")
-                    team_has_game = True
-                    break
-            
-            if not team_has_game:
-                print(" ❌ No game")
-                    
-        except requests.exceptions.HTTPError as e:
-            if "429" in str(e):
-                print(" ⚠️ Rate limit")
-                continue
-            elif "403" in str(e):
-                print(" 🚫 Blocked")
-            else:
-                print(f" ❌ HTTP error: {str(e)}")
-        except requests.exceptions.RequestException as e:
-            print(f" ❌ Network error: {str(e)}")
-        except Exception as e:
-            if "403" in str(e) and "Forbidden" in str(e):
-                print(" 🚫 Blocked (403)")
-            else:
-                print(f" ❌ Error: {str(e)}")
-            continue
-    
-    return games_found
+    return check_games_for_dates(favorite_teams, league, [target_date])[target_date]
+
+
+def check_games_in_range(favorite_teams, league, start_date, end_date):
+    """
+    Check if any of the selected favorite teams have games scheduled between two dates.
+
+    Each team's schedule is indexed by date once, so a long range such as the
+    rest of the season costs no more per team than a single week.
+
+    Args:
+        favorite_teams (list): List of team abbreviations (e.g., ['lal', 'bos'])
+        league (str): The league to check (e.g., 'nba', 'nfl', 'mlb') - REQUIRED
+        start_date (date): First date to check
+        end_date (date): Last date to check (inclusive)
+
+    Returns:
+        dict: Dictionary with dates as keys and lists of game information as values
+    """
+    games_by_date = check_games_for_dates(favorite_teams, league, get_date_range(start_date, end_date))
+
+    return {target_date: games for target_date, games in games_by_date.items() if games}
 
 
 def check_games_this_week(favorite_teams, league):
@@ -212,36 +862,32 @@ def check_games_this_week(favorite_teams, league):
     Returns:
         dict: Dictionary with dates as keys and lists of game information as values
     """
-    weekly_games = {}
     current_date = get_current_date()
-    
-    for day_offset in range(7):
-        target_date = current_date + timedelta(days=day_offset)
-        games_for_date = check_games(favorite_teams, league, target_date)
 
-        if games_for_date:
-            weekly_games[target_date] = games_for_date
-    
-    return weekly_games
+    return check_games_in_range(favorite_teams, league, current_date, current_date + timedelta(days=6))
 
 
-def display_games(games_list):
+def display_games(games_list, datetime_displays=None):
     """
     Display information about games scheduled for your favorite teams.
     
     Args:
         games_list (list): List of game dictionaries
+        datetime_displays (list): Formatted start times from format_game_datetimes; computed if omitted
     """
     if not games_list:
         print(f"\n📅 No games scheduled for your favorite teams")
         return
+
+    if datetime_displays is None:
+        datetime_displays = format_game_datetimes(games_list)
     
     games_by_league = {}
-    for game in games_list:
+    for game, date_time_display in zip(games_list, datetime_displays):
         league = game['league']
         if league not in games_by_league:
             games_by_league[league] = []
-        games_by_league[league].append(game)
+        games_by_league[league].append((game, date_time_display))
     
     print(f"\nGames for your favorite teams")
     
@@ -250,7 +896,7 @@ def display_games(games_list):
         print(f"{'Team':<35} {'Matchup':<45} {'Date/Time':<20}")
         print("─" * 90)
         
-        for game in games:
+        for game, date_time_display in games:
             team = game['team']
             if game['is_home']:
                 matchup = f"{game['team']} vs {game['opponent']}"
@@ -258,44 +904,18 @@ def display_games(games_list):
             else:
                 matchup = f"{game['team']} @ {game['opponent']}"
                 venue = "✈️ "
-            
-            game_datetime = game.get('datetime', '')
-            date_time_display = format_game_datetime(game_datetime)
                 
             print(f"{team:<35} {matchup:<45} {venue} {date_time_display}")
         
         print()
 
 
-def format_game_datetime(game_datetime):
-    """
-    Helper function to format game datetime consistently for display.
-    
-    Args:
-        game_datetime (str): The datetime string from the game
-        
-    Returns:
-        str: Formatted date and time string or 'TBD' if parsing fails
-    """
-    if game_datetime and 'T' in game_datetime:
-        try:
-            dt = datetime.fromisoformat(game_datetime.replace('Z', '+00:00'))
-            eastern = pytz.timezone('America/New_York')
-            dt_et = dt.astimezone(eastern)
-
-            game_date = dt_et.strftime('%m/%d/%Y')
-            game_time = dt_et.strftime('%I:%M %p EST')
-
-            return f"{game_date} {game_time}"
-        except Exception as e:
-            return game_datetime
-    else:
-        return 'TBD'
-
-
 def parse_game_date(date_str, league):
     """
     Parse game date string based on the league's specific format.
+
+    The format that last worked for the league is tried first, so repeated
+    strings from the same feed usually match on the first pattern.
     
     Args:
         date_str (str): The date string from the game
@@ -304,65 +924,43 @@ def parse_game_date(date_str, league):
     Returns:
         date: Parsed date object or None if parsing fails
     """
-    if not date_str:
-        return None
-    
-    current_year = get_current_date().year
-    
-    date_pattern = {
-        'nba': '%a, %b %d, %Y',
-        'mlb': '%A, %b %d',
-        'nfl': '%a, %b %d, %Y',
-    }
+    return game_date_parser.parse(date_str, league, get_current_date().year)
 
-    pattern = date_pattern.get(league, '%Y-%m-%d') 
 
-    try:
-        parsed_date = datetime.strptime(date_str, pattern).date()
-        
-        if league == 'mlb' and parsed_date.year == 1900:
-            parsed_date = parsed_date.replace(year=current_year)
-        
-        return parsed_date
-    except (ValueError, AttributeError):
-        fallback_patterns = [
-            '%Y-%m-%d',
-            '%A, %b %d, %Y',
-            '%a, %b %d, %Y',
-            '%A, %b %d',
-            '%B %d, %Y',
-            '%m/%d/%Y',
-        ]
-        
-        for fallback in fallback_patterns:
-            try:
-                parsed_date = datetime.strptime(date_str, fallback).date()
-                if parsed_date.year == 1900:
-                    parsed_date = parsed_date.replace(year=current_year)
-                return parsed_date
-            except (ValueError, AttributeError):
-                continue
-        
-        return None
+def parse_game_dates(date_strs, league):
+    """
+    Parse a list of game date strings for a league in bulk.
+
+    Args:
+        date_strs (list): The date strings to parse
+        league (str): The league ('nba', 'nfl', 'mlb')
+
+    Returns:
+        list: A date (or None) for each string, in the same order
+    """
+    return game_date_parser.parse_many(date_strs, league, get_current_date().year)
     
 
-def build_games_summary(games, label):
+def build_games_summary(games, label, datetime_displays=None):
     """
     Helper to build a summary string for a list of games.
+
+    datetime_displays takes the output of format_game_datetimes so times
+    already formatted for the games table are not formatted again.
     """
     lines = [label]
 
     if games:
-        for game in games:
+        if datetime_displays is None:
+            datetime_displays = format_game_datetimes(games)
+
+        for game, date_time_display in zip(games, datetime_displays):
             if game['is_home']:
                 matchup = f"{game['team']} vs {game['opponent']}"
                 venue = "🏠"
             else:
                 matchup = f"{game['team']} @ {game['opponent']}"
                 venue = "✈️"
-            
-            game_datetime = game.get('datetime', '')
-            date_time_display = format_game_datetime(game_datetime)
 
             lines.append(f"{matchup} {venue} {date_time_display}")
     else:
@@ -371,34 +969,127 @@ def build_games_summary(games, label):
     return "\n".join(lines)
 
 
-def game_checker(preferences):
+def sort_games_chronologically(games):
     """
-    Function to check if the selected teams are playing this week and display the games.
+    Sort games from any number of leagues by start time, keeping league order for ties.
+
+    Args:
+        games (list): List of game dictionaries
+
+    Returns:
+        list: The games sorted by date and start time
+    """
+    return sorted(games, key=lambda game: (game.get('date', ''), game.get('datetime', '')))
+
+
+def get_date_range(start_date, end_date):
+    """Get every date from start_date to end_date, inclusive."""
+    return [start_date + timedelta(days=day_offset) for day_offset in range((end_date - start_date).days + 1)]
+
+
+def get_week_dates():
+    """Get the seven dates starting today that a weekly check searches."""
+    current_date = get_current_date()
+
+    return get_date_range(current_date, current_date + timedelta(days=6))
+
+
+def collect_games(preferences, checked_teams=None, target_dates=None):
+    """
+    Check the games for every league in the preferences, this week unless other dates are given.
+
+    Each team's result is printed as soon as its fetch finishes, whichever
+    league it is in.
+
+    Args:
+        preferences (dict): User preferences containing favorite teams and leagues
+        checked_teams (set): Filled with a (league, upper-case abbreviation) pair for
+                             every team whose schedule was fetched successfully
+        target_dates (list): The dates to check, in order; this week if omitted
+
+    Returns:
+        list: Game information dictionaries from all leagues in chronological order
+    """
+    target_dates = target_dates or get_week_dates()
+    leagues = [
+        league_key for league_key in SUPPORTED_LEAGUES.keys()
+        if preferences.get(f"{league_key}_team")
+    ]
+
+    if not leagues:
+        return []
+
+    league_names = ", ".join(SUPPORTED_LEAGUES[league_key]["name"] for league_key in leagues)
+    print(f"\n🔍 Searching {league_names} games for {get_date_range_description(target_dates)}...")
+    print("─" * 90)
+
+    all_games = []
+    for event in iter_games(preferences, target_dates):
+        if event.kind == 'game':
+            all_games.append(event.game)
+            continue
+
+        if event.kind == 'team' and checked_teams is not None:
+            checked_teams.add((event.league, event.team_abbr))
+
+        print(format_check_event(event))
+
+    return sort_games_chronologically(all_games)
+
+
+def game_checker(preferences, changes_only=False, start_date=None, end_date=None):
+    """
+    Function to check if the selected teams are playing this week (or in a date range) and display the games.
     
     Args:
         preferences (dict): User preferences containing favorite teams and leagues
+        changes_only (bool): Return only what changed since the last changes-only run
+        start_date (date): First date to check; today if omitted
+        end_date (date): Last date to check (inclusive); six days after start_date if omitted
 
     Returns:
-        str: Summary of games for this week
+        str: Summary of games for the dates checked, or of the changes (None if nothing changed)
     """
     if not preferences:
         return "No preferences provided."
 
-    all_weekly_games = []
+    start_date = start_date or get_current_date()
+    end_date = end_date or start_date + timedelta(days=6)
+    if end_date < start_date:
+        raise ValueError(f"End date {end_date} is before start date {start_date}")
+
+    target_dates = get_date_range(start_date, end_date)
+
+    # The counters are shared by every run in the process, so only this run's share is reported
+    cache_stats_before, retry_stats_before = schedule_cache.get_stats(), get_retry_stats()
+
+    checked_teams = set()
+    all_weekly_games = collect_games(preferences, checked_teams, target_dates)
     all_games_summary = []
 
-    for league_key in SUPPORTED_LEAGUES.keys():
-        team_key = f"{league_key}_team"
+    # Format every start time once for both the games table and the summary
+    datetime_displays = format_game_datetimes(all_weekly_games, preferences.get("timezone"))
+    display_games(all_weekly_games, datetime_displays)
+
+    cache_stats = {stat: count - cache_stats_before[stat] for stat, count in schedule_cache.get_stats().items()}
+    print(f"📦 Schedule cache: {cache_stats['hits']} hit(s), {cache_stats['revalidated']} revalidated, "
+          f"{cache_stats['misses']} miss(es), {cache_stats['stale']} stale")
+
+    retry_stats = {stat: count - retry_stats_before[stat] for stat, count in get_retry_stats().items()}
+    if retry_stats['retries'] or retry_stats['give_ups']:
+        print(f"🔁 ESPN requests: {retry_stats['retries']} retried, {retry_stats['give_ups']} gave up")
 
-        if team_key in preferences and preferences[team_key]:
-            favorite_teams = preferences[team_key]
-            weekly_games = check_games_this_week(favorite_teams, league_key)
-            
-            for date, games_for_date in weekly_games.items():
-                all_weekly_games.extend(games_for_date)
+    if changes_only:
+        changes = change_detector.detect(all_weekly_games, checked_teams, target_dates)
+        if not count_changes(changes):
+            print("🔕 No schedule changes since the last run")
+            return None
 
-    display_games(all_weekly_games)
+        print(f"🔔 {count_changes(changes)} schedule change(s) since the last run")
+        return build_changes_summary(changes, tz_name=preferences.get("timezone"))
 
-    all_games_summary.append(build_games_summary(all_weekly_games, "This Week's Games:"))
+    date_description = get_date_range_description(target_dates)
+    label = "This Week's Games:" if date_description == "this week" else f"Games for {date_description}:"
+    all_games_summary.append(build_games_summary(all_weekly_games, label, datetime_displays))
 
     return "\n".join(all_games_summary)
\ No newline at end of file
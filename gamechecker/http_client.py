@@ -0,0 +1,98 @@
+from constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+from requests.adapters import HTTPAdapter
+import threading
+import requests
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "friday-night-bytes",
+}
+
+
+class PooledSession(requests.Session):
+    """A requests session that applies a default timeout to every request."""
+
+    def __init__(self, timeout):
+        super().__init__()
+        self.timeout = timeout
+
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                   connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT):
+    """
+    Create a keep-alive session backed by a connection pool.
+
+    Args:
+        pool_connections (int): Number of hosts to keep connection pools for
+        pool_maxsize (int): Maximum number of connections kept open per host
+        connect_timeout (float): Seconds to wait for a connection to be established
+        read_timeout (float): Seconds to wait for the server to send data
+
+    Returns:
+        PooledSession: The configured session
+    """
+    session = PooledSession(timeout=(connect_timeout, read_timeout))
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Get the shared session, creating it on first use."""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+
+    return _session
+
+
+def close_session():
+    """Close the shared session and release its pooled connections."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def create_async_client(pool_maxsize=HTTP_POOL_MAXSIZE, connect_timeout=HTTP_CONNECT_TIMEOUT,
+                        read_timeout=HTTP_READ_TIMEOUT):
+    """
+    Create a non-blocking HTTP client with the same pooling and timeout settings as the shared session.
+
+    Args:
+        pool_maxsize (int): Maximum number of open connections
+        connect_timeout (float): Seconds to wait for a connection to be established
+        read_timeout (float): Seconds to wait for the server to send data
+
+    Returns:
+        httpx.AsyncClient: The configured client
+    """
+    import httpx
+
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+    )
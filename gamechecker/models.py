@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from datetime import datetime, date, timezone
+import pytz
+import sys
+
+EASTERN_TZ = pytz.timezone('America/New_York')
+
+# ESPN status names for games that will not be played at their scheduled time
+POSTPONED_STATUSES = frozenset({'STATUS_POSTPONED', 'STATUS_CANCELED', 'STATUS_SUSPENDED'})
+
+
+@dataclass(frozen=True, slots=True)
+class Game:
+    """
+    One scheduled game from a team's point of view.
+
+    Timestamps are parsed once when the ESPN payload is ingested so nothing
+    downstream has to re-parse ISO strings.
+    """
+    league: str
+    team_abbr: str
+    opponent_abbr: str
+    is_home: bool
+    start: datetime
+    eastern_date: date
+    event_id: str = ""
+    status: str = ""
+
+
+    @property
+    def location(self):
+        """'Home' or 'Away', matching the labels used in the ESPN schedule."""
+        return 'Home' if self.is_home else 'Away'
+
+
+    @property
+    def is_postponed(self):
+        """Whether ESPN lists the game as postponed or canceled."""
+        return self.status in POSTPONED_STATUSES
+
+
+    @property
+    def iso_datetime(self):
+        """The start time in ESPN's ISO format (e.g., '2025-10-22T23:30Z')."""
+        return self.start.strftime('%Y-%m-%dT%H:%MZ')
+
+
+@dataclass(frozen=True, slots=True)
+class GameCheckEvent:
+    """
+    One result from iter_games, emitted as soon as it is known.
+
+    kind is 'game' for each game found (with the game information dictionary
+    in game), 'team' when a team's schedule has been searched, 'error' when
+    its fetch failed, and 'unknown_team' for an abbreviation not in the league.
+    """
+    kind: str
+    league: str
+    team_abbr: str
+    team_name: str = ""
+    game: dict = None
+    game_count: int = 0
+    error: Exception = None
+
+
+def parse_espn_datetime(value):
+    """
+    Parse an ESPN ISO datetime string into an aware UTC datetime.
+
+    Args:
+        value (str): The datetime string from ESPN (e.g., '2025-10-22T23:30Z')
+
+    Returns:
+        datetime: The aware datetime or None if parsing fails
+    """
+    if not value:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed.astimezone(timezone.utc)
+
+
+def make_game(league, team_abbr, opponent_abbr, is_home, event_datetime, event_id="", status=""):
+    """
+    Build a Game from raw ESPN values.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        team_abbr (str): The team's abbreviation
+        opponent_abbr (str): The opponent's abbreviation
+        is_home (bool): Whether the team is the home side
+        event_datetime (str): The ESPN ISO datetime string
+        event_id (str): The ESPN event id
+        status (str): The ESPN status name (e.g., 'STATUS_SCHEDULED')
+
+    Returns:
+        Game: The game record or None if the datetime cannot be parsed
+    """
+    start = parse_espn_datetime(event_datetime)
+    if start is None:
+        return None
+
+    return Game(
+        league=sys.intern(league),
+        team_abbr=sys.intern(team_abbr.upper()),
+        opponent_abbr=sys.intern((opponent_abbr or 'Unknown').upper()),
+        is_home=is_home,
+        start=start,
+        eastern_date=start.astimezone(EASTERN_TZ).date(),
+        event_id=str(event_id or ""),
+        status=sys.intern(status or ""),
+    )
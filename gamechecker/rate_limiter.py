@@ -0,0 +1,74 @@
+from constants import ESPN_REQUESTS_PER_SECOND, ESPN_REQUEST_BURST
+import threading
+import time
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace outbound requests.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. When the
+    server throttles us, `penalize` halves the refill rate; each successful
+    request then nudges it back toward the configured rate.
+    """
+
+    def __init__(self, rate=ESPN_REQUESTS_PER_SECOND, capacity=ESPN_REQUEST_BURST, min_rate=0.5):
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+
+    def _refill(self, now):
+        """Add the tokens earned since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+    def reserve(self):
+        """
+        Take a token, going into debt if none are available.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0.0
+
+            return -self.tokens / self.rate
+
+
+    def acquire(self):
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+    def penalize(self):
+        """Slow down after the server responds with 429 Too Many Requests."""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+
+    def reward(self):
+        """Recover toward the configured rate after a successful request."""
+        with self.lock:
+            if self.rate < self.base_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.base_rate, self.rate * 1.25)
+
+
+espn_rate_limiter = TokenBucket()
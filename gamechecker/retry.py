@@ -0,0 +1,209 @@
+from constants import ESPN_RETRY_ATTEMPTS, ESPN_RETRY_BASE_DELAY, ESPN_RETRY_MAX_DELAY, ESPN_RETRY_DEADLINE
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import threading
+import asyncio
+import requests
+import random
+import time
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+try:
+    import httpx
+    TRANSIENT_ERRORS += (httpx.TransportError,)
+except ImportError:
+    pass
+
+
+class RequestCancelled(Exception):
+    """Raised when a request is abandoned because the search that made it was cancelled."""
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, bounded by an overall deadline.
+
+    A Retry-After header from the server takes precedence over the computed
+    backoff as long as it still fits within the deadline.
+    """
+
+    def __init__(self, max_attempts=ESPN_RETRY_ATTEMPTS, base_delay=ESPN_RETRY_BASE_DELAY,
+                 max_delay=ESPN_RETRY_MAX_DELAY, deadline=ESPN_RETRY_DEADLINE):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            attempt (int): Number of attempts made so far (1 after the first failure)
+            retry_after (float): Seconds requested by the server's Retry-After header
+
+        Returns:
+            float: Seconds to wait
+        """
+        if retry_after is not None:
+            return retry_after
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+retry_stats = {"retries": 0, "give_ups": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(stat):
+    with _stats_lock:
+        retry_stats[stat] += 1
+
+
+def get_retry_stats():
+    """Get the retry and give-up counters."""
+    with _stats_lock:
+        return dict(retry_stats)
+
+
+def get_status_code(error):
+    """Get the HTTP status code behind a requests or httpx error, if there is one."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (str): Either a number of seconds or an HTTP date
+
+    Returns:
+        float: Seconds to wait or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_retry_after(error):
+    """Get the Retry-After delay from an error's response, if the server sent one."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+def is_retryable(error):
+    """Check if an error is transient: throttling, a server error, or a connection problem."""
+    if get_status_code(error) in RETRYABLE_STATUS_CODES:
+        return True
+
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+def _next_delay(error, attempt, policy, started):
+    """Get the delay before retrying, or None if the request should give up."""
+    if not is_retryable(error) or attempt >= policy.max_attempts:
+        return None
+
+    delay = policy.backoff(attempt, get_retry_after(error))
+    if time.monotonic() - started + delay > policy.deadline:
+        return None
+
+    return delay
+
+
+def call_with_retry(func, policy=None, sleep=time.sleep, cancel_event=None):
+    """
+    Call func, retrying transient failures according to the policy.
+
+    Args:
+        func (callable): Function making the request; it should raise on failure
+        policy (RetryPolicy): The retry policy, defaults to the configured ESPN policy
+        sleep (callable): Function used to wait between attempts
+        cancel_event (threading.Event): Once set, no further attempt is made
+
+    Returns:
+        The return value of func
+
+    Raises:
+        RequestCancelled: If cancel_event is set before or while waiting to retry
+    """
+    policy = policy or RetryPolicy()
+    started = time.monotonic()
+    attempt = 0
+
+    while True:
+        attempt += 1
+        try:
+            return func()
+        except Exception as e:
+            delay = _next_delay(e, attempt, policy, started)
+            if delay is None:
+                if is_retryable(e):
+                    _count("give_ups")
+                raise
+
+            if cancel_event is not None and cancel_event.is_set():
+                raise RequestCancelled() from e
+
+            _count("retries")
+            if cancel_event is None:
+                sleep(delay)
+            elif cancel_event.wait(delay):
+                raise RequestCancelled() from e
+
+
+async def call_with_retry_async(func, policy=None):
+    """
+    Async counterpart of call_with_retry.
+
+    Args:
+        func (callable): Coroutine function making the request; it should raise on failure
+        policy (RetryPolicy): The retry policy, defaults to the configured ESPN policy
+
+    Returns:
+        The return value of func
+    """
+    policy = policy or RetryPolicy()
+    started = time.monotonic()
+    attempt = 0
+
+    while True:
+        attempt += 1
+        try:
+            return await func()
+        except Exception as e:
+            delay = _next_delay(e, attempt, policy, started)
+            if delay is None:
+                if is_retryable(e):
+                    _count("give_ups")
+                raise
+
+            _count("retries")
+            await asyncio.sleep(delay)
@@ -0,0 +1,145 @@
+from constants import ESPN_CACHE_DIR, ESPN_CACHE_TTL, ESPN_CACHE_TTLS
+from gamechecker.atomic_write import atomic_write
+import threading
+import time
+import json
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ScheduleCache:
+    """
+    On-disk cache of ESPN schedule responses keyed by league and team.
+
+    Each entry stores the decoded payload along with the ETag and Last-Modified
+    headers so a stale entry can be revalidated with a conditional request
+    instead of downloading the whole season again.
+    """
+
+    def __init__(self, cache_dir=ESPN_CACHE_DIR, ttls=None, default_ttl=ESPN_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttls = ESPN_CACHE_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0}
+        self._stats_lock = threading.Lock()
+
+
+    def count(self, stat):
+        """Increment one of the hit/miss counters; safe to call from the fetch worker threads."""
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+
+    def get_stats(self):
+        """Get a consistent copy of the hit/miss counters."""
+        with self._stats_lock:
+            return dict(self.stats)
+
+
+    def _entry_path(self, league, team_abbr):
+        """Get the file path of the cache entry for a team."""
+        return os.path.join(self.cache_dir, league.lower(), f"{team_abbr.lower()}.json")
+
+
+    def load(self, league, team_abbr):
+        """
+        Load the cache entry for a team.
+
+        Args:
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+            team_abbr (str): The team abbreviation
+
+        Returns:
+            dict: The cache entry or None if it is missing or unreadable
+        """
+        try:
+            with open(self._entry_path(league, team_abbr), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or "payload" not in entry:
+            return None
+
+        return entry
+
+
+    def is_fresh(self, entry, league):
+        """Check if a cache entry is still within the league's TTL."""
+        ttl = self.ttls.get(league, self.default_ttl)
+        return time.time() - entry.get("fetched_at", 0) < ttl
+
+
+    def conditional_headers(self, entry):
+        """Build the revalidation headers for a cache entry."""
+        headers = {}
+        if not entry:
+            return headers
+
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        return headers
+
+
+    def store(self, league, team_abbr, payload, headers=None):
+        """
+        Write a fresh response to the cache.
+
+        Args:
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+            team_abbr (str): The team abbreviation
+            payload (dict): The decoded JSON response
+            headers (Mapping): The response headers
+
+        Returns:
+            dict: The stored cache entry
+        """
+        headers = headers or {}
+        entry = {
+            "fetched_at": time.time(),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "payload": payload,
+        }
+        self._write(league, team_abbr, entry)
+
+        return entry
+
+
+    def touch(self, league, team_abbr, entry):
+        """Mark a revalidated entry as fresh again without rewriting its payload."""
+        entry["fetched_at"] = time.time()
+        self._write(league, team_abbr, entry)
+
+        return entry
+
+
+    def _write(self, league, team_abbr, entry):
+        """Atomically write an entry so concurrent runs never read a partial file."""
+        path = self._entry_path(league, team_abbr)
+
+        try:
+            with atomic_write(path) as file:
+                json.dump(entry, file, separators=(",", ":"))
+        except OSError as e:
+            print(f"Unable to write schedule cache for {team_abbr}: {e}")
+
+
+    def clear(self):
+        """Remove every cached entry."""
+        for root, _, files in os.walk(self.cache_dir):
+            for filename in files:
+                if filename.endswith(".json"):
+                    os.remove(os.path.join(root, filename))
+
+
+schedule_cache = ScheduleCache()
+
+
+def get_cache_stats():
+    """Get the hit/miss counters of the shared schedule cache."""
+    return schedule_cache.get_stats()
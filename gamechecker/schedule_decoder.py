@@ -0,0 +1,283 @@
+import codecs
+import json
+import re
+
+# Response bodies are decoded this many bytes at a time
+SCHEDULE_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_value_decoder = json.JSONDecoder()
+
+
+class _NeedMoreData(Exception):
+    """Raised inside ScheduleStreamDecoder when the next token has not fully arrived yet."""
+
+
+def extract_event_fields(event):
+    """
+    Copy just the fields the parsers read out of one decoded ESPN event.
+
+    Args:
+        event (dict): A decoded schedule or scoreboard event
+
+    Returns:
+        dict: The event's id, date, and first competition's competitors and status
+    """
+    competitions = []
+    for competition in event.get("competitions", [])[:1]:
+        competitors = [
+            {
+                "homeAway": competitor.get("homeAway"),
+                "team": {"abbreviation": competitor.get("team", {}).get("abbreviation", "")},
+            }
+            for competitor in competition.get("competitors", [])
+        ]
+        compact_competition = {"competitors": competitors}
+        status_name = competition.get("status", {}).get("type", {}).get("name")
+        if status_name:
+            compact_competition["status"] = {"type": {"name": status_name}}
+        competitions.append(compact_competition)
+
+    return {"id": event.get("id", ""), "date": event.get("date", ""), "competitions": competitions}
+
+
+def extract_schedule_fields(data):
+    """
+    Copy just the schedule fields out of an already decoded ESPN document.
+
+    Args:
+        data (dict): A decoded schedule or scoreboard document
+
+    Returns:
+        dict: A document with the same shape that only holds the schedule fields
+    """
+    return {"events": [extract_event_fields(event) for event in data.get("events", []) if isinstance(event, dict)]}
+
+
+class ScheduleStreamDecoder:
+    """
+    Decode an ESPN schedule or scoreboard document incrementally, one event at a time.
+
+    Feed it the response body in chunks as they arrive. Each entry of the
+    top-level "events" array is decoded by the standard library's C scanner
+    as soon as it is complete, reduced with extract_event_fields and dropped,
+    so neither the whole body nor its full object tree is ever held. Other
+    top-level values are decoded and discarded.
+    """
+
+    def __init__(self):
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._checkpoint = 0
+        self._state = "start"
+        self._key = None
+        self._ended = False
+        self._events = []
+
+
+    def feed(self, chunk):
+        """Decode as many events as the body received so far (bytes) allows."""
+        self._append(self._decode_text(chunk))
+
+
+    def close(self):
+        """
+        Finish decoding once the whole body has been fed.
+
+        Returns:
+            dict: The pruned schedule document
+
+        Raises:
+            json.JSONDecodeError: If the body is not a complete JSON object
+        """
+        self._ended = True
+        self._append(self._decode_text(b"", final=True))
+
+        if self._state != "done":
+            raise json.JSONDecodeError("Unexpected end of document", self._buffer, self._pos)
+
+        return {"events": self._events}
+
+
+    def _decode_text(self, chunk, final=False):
+        """Decode a chunk of UTF-8 bytes, reporting invalid bytes like any other malformed body."""
+        try:
+            return self._text_decoder.decode(chunk, final)
+        except UnicodeDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid UTF-8 ({e.reason})", self._buffer, len(self._buffer)) from e
+
+
+    def _append(self, text):
+        """Add decoded text to the unconsumed rest of the buffer and parse it."""
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = self._checkpoint = 0
+        self._parse()
+
+
+    def _next_char(self):
+        """Skip whitespace and get the next character without consuming it."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos >= len(self._buffer):
+            if self._ended:
+                raise json.JSONDecodeError("Unexpected end of document", self._buffer, self._pos)
+            raise _NeedMoreData()
+
+        return self._buffer[self._pos]
+
+
+    def _expect(self, char):
+        """Consume the next character, which must be char."""
+        if self._next_char() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+
+    def _decode_value(self):
+        """Decode the complete JSON value at the current position."""
+        try:
+            value, end = _value_decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._ended:
+                raise
+            raise _NeedMoreData()
+
+        # A number or literal running up to the end of the buffer may continue in the next chunk
+        if end >= len(self._buffer) and not self._ended:
+            raise _NeedMoreData()
+
+        self._pos = end
+        return value
+
+
+    def _decode_events(self):
+        """
+        Decode array entries, one after another, until the array ends or the buffered text runs out.
+
+        Every decoded entry moves the checkpoint past it, so an entry cut off at
+        the end of the buffer is only parsed again once the next chunk arrives.
+        """
+        buffer, match = self._buffer, _WHITESPACE.match
+
+        while True:
+            pos = match(buffer, self._pos).end()
+            try:
+                event, end = _value_decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if self._ended:
+                    raise
+                raise _NeedMoreData()
+
+            if isinstance(event, dict):
+                self._events.append(extract_event_fields(event))
+
+            pos = match(buffer, end).end()
+            if pos >= len(buffer) or buffer[pos] not in ",]":
+                # Leave the delimiter (or the error for a missing one) to the after_event state
+                self._pos, self._state = end, "after_event"
+                return
+
+            self._pos = self._checkpoint = pos + 1
+            if buffer[pos] == "]":
+                self._state = "after_value"
+                return
+
+
+    def _step(self):
+        """Consume one token of the document, moving to the next state."""
+        state = self._state
+
+        if state == "start":
+            self._expect("{")
+            self._state = "first_key"
+        elif state in ("first_key", "key"):
+            if state == "first_key" and self._next_char() == "}":
+                self._pos += 1
+                self._state = "done"
+                return
+            self._expect('"')
+            try:
+                key, self._pos = json.decoder.scanstring(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._ended:
+                    raise
+                raise _NeedMoreData()
+            self._expect(":")
+            self._key = key
+            self._state = "value"
+        elif state == "value":
+            if self._next_char() == "[" and self._key == "events":
+                self._pos += 1
+                self._state = "first_event"
+            else:
+                self._decode_value()
+                self._state = "after_value"
+        elif state == "first_event":
+            if self._next_char() == "]":
+                self._pos += 1
+                self._state = "after_value"
+            else:
+                self._state = "event"
+        elif state == "event":
+            self._decode_events()
+        elif state == "after_event":
+            char = self._next_char()
+            if char not in ",]":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, self._pos)
+            self._pos += 1
+            self._state = "event" if char == "," else "after_value"
+        elif state == "after_value":
+            char = self._next_char()
+            if char not in ",}":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, self._pos)
+            self._pos += 1
+            self._state = "key" if char == "," else "done"
+        else:
+            raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+
+
+    def _parse(self):
+        """Consume tokens until the buffered text runs out."""
+        while True:
+            if self._state == "done":
+                self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+                if self._pos < len(self._buffer):
+                    raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+                return
+
+            self._checkpoint = self._pos
+            try:
+                self._step()
+            except _NeedMoreData:
+                self._pos = self._checkpoint
+                return
+
+
+def decode_schedule_stream(chunks):
+    """
+    Decode an ESPN schedule or scoreboard response body from an iterable of byte chunks.
+
+    Args:
+        chunks (iterable): The response body, e.g. response.iter_content(SCHEDULE_CHUNK_SIZE)
+
+    Returns:
+        dict: The pruned schedule document
+    """
+    decoder = ScheduleStreamDecoder()
+    for chunk in chunks:
+        decoder.feed(chunk)
+
+    return decoder.close()
+
+
+def decode_schedule_payload(raw):
+    """
+    Decode a whole ESPN schedule or scoreboard response body, keeping only the fields we use.
+
+    Args:
+        raw (bytes | str): The response body
+
+    Returns:
+        dict: The pruned schedule document
+    """
+    return decode_schedule_stream([raw.encode("utf-8") if isinstance(raw, str) else raw])
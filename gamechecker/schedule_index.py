@@ -0,0 +1,73 @@
+from collections.abc import Sequence
+from bisect import bisect_left, bisect_right
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ScheduleIndex(Sequence):
+    """
+    A team's games sorted by Eastern date, for date-range lookups by bisection.
+
+    The index is built once, when a schedule is fetched or expanded from a
+    season index, and is passed around in place of the list of games, which it
+    can be iterated and indexed like. Any range query after that costs
+    O(log n + k) for k games in the range, however many days it spans.
+    """
+
+    __slots__ = ("games", "dates")
+
+    def __init__(self, schedule):
+        # ESPN returns schedules in date order, so this sort is usually a single linear pass
+        self.games = sorted(schedule, key=lambda game: (game.eastern_date, game.start))
+        self.dates = [game.eastern_date for game in self.games]
+
+
+    def __len__(self):
+        return len(self.games)
+
+
+    def __getitem__(self, index):
+        return self.games[index]
+
+
+    def __eq__(self, other):
+        # Compares equal to the list of games it stands in for, as returned before schedules were indexed
+        if isinstance(other, (ScheduleIndex, list)):
+            return self.games == list(other)
+        return NotImplemented
+
+
+    def games_between(self, start_date, end_date):
+        """
+        Get the games from start_date to end_date, inclusive.
+
+        Args:
+            start_date (date): First Eastern date of the range
+            end_date (date): Last Eastern date of the range
+
+        Returns:
+            list: Game records in chronological order
+        """
+        low = bisect_left(self.dates, start_date)
+        high = bisect_right(self.dates, end_date, lo=low)
+
+        return self.games[low:high]
+
+
+    def first_game_per_date(self, start_date, end_date):
+        """
+        Get the first game on each date in a range that has one.
+
+        Args:
+            start_date (date): First Eastern date of the range
+            end_date (date): Last Eastern date of the range
+
+        Returns:
+            dict: Date to the first Game record on that date, in date order
+        """
+        games_by_date = {}
+        for game in self.games_between(start_date, end_date):
+            games_by_date.setdefault(game.eastern_date, game)
+
+        return games_by_date
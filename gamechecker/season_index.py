@@ -0,0 +1,237 @@
+from constants import SEASON_INDEX_DIR, SEASON_INDEX_TTL
+from gamechecker.atomic_write import atomic_write
+from gamechecker.models import make_game
+from gamechecker.schedule_index import ScheduleIndex
+import threading
+import time
+import gzip
+import json
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEASON_INDEX_VERSION = 1
+
+# How long a missing or expired index is remembered before its file is looked at again
+SEASON_INDEX_RECHECK_SECONDS = 60
+
+
+class SeasonIndex:
+    """
+    Every game of a league's season, stored once per event rather than once per team.
+
+    Events are kept as compact [event_id, start, home, away, status] rows. A
+    team's schedule is expanded into Game records and indexed by date the
+    first time it is asked for.
+    conflicts lists the games from_schedules had to drop because another game
+    already used their event id.
+    """
+
+    def __init__(self, league, events, built_at=None):
+        self.league = league
+        self.events = events
+        self.built_at = time.time() if built_at is None else built_at
+        self.conflicts = []
+        self._schedules = {}
+        self._lock = threading.Lock()
+
+
+    @classmethod
+    def from_schedules(cls, league, schedules):
+        """
+        Build an index from team schedules, keeping each game once.
+
+        A game whose event id is already taken by a different game (another
+        start time or pairing) is not indexed but recorded in conflicts.
+
+        Args:
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+            schedules (iterable): Lists of Game records, one list per team
+
+        Returns:
+            SeasonIndex: The deduplicated season, sorted by start time
+        """
+        events, conflicts = {}, []
+        for schedule in schedules:
+            for game in schedule:
+                home, away = (game.team_abbr, game.opponent_abbr) if game.is_home else (game.opponent_abbr, game.team_abbr)
+                key = game.event_id or f"{game.iso_datetime}:{home}:{away}"
+                event = events.setdefault(key, [game.event_id, game.iso_datetime, home, away, game.status])
+                if event[1:4] != [game.iso_datetime, home, away]:
+                    conflicts.append([game.event_id, game.iso_datetime, home, away, game.status])
+
+        season_index = cls(league, sorted(events.values(), key=lambda event: (event[1], event[2])))
+        season_index.conflicts = conflicts
+
+        return season_index
+
+
+    def is_fresh(self, ttl=SEASON_INDEX_TTL):
+        """Check if the index is younger than the TTL."""
+        return time.time() - self.built_at < ttl
+
+
+    def teams(self):
+        """Get the abbreviation of every team in the index."""
+        return sorted({abbr for event in self.events for abbr in event[2:4]})
+
+
+    def team_schedule(self, team_abbr):
+        """
+        Get a team's games from the index.
+
+        Args:
+            team_abbr (str): The team abbreviation
+
+        Returns:
+            ScheduleIndex: The team's games, indexed by date
+        """
+        team_abbr = team_abbr.upper()
+
+        with self._lock:
+            if team_abbr not in self._schedules:
+                schedule = []
+                for event_id, start, home, away, status in self.events:
+                    if team_abbr in (home, away):
+                        is_home = team_abbr == home
+                        game = make_game(self.league, team_abbr, away if is_home else home, is_home, start, event_id, status)
+                        if game:
+                            schedule.append(game)
+                self._schedules[team_abbr] = ScheduleIndex(schedule)
+
+            return self._schedules[team_abbr]
+
+
+    def to_dict(self):
+        """The JSON document written to disk."""
+        return {"version": SEASON_INDEX_VERSION, "league": self.league, "built_at": self.built_at, "events": self.events}
+
+
+def season_index_path(league, index_dir=SEASON_INDEX_DIR):
+    """Get the file path of a league's season index."""
+    return os.path.join(index_dir, f"{league.lower()}.json.gz")
+
+
+def save_season_index(season_index, index_dir=SEASON_INDEX_DIR):
+    """
+    Atomically write a season index as gzipped JSON.
+
+    Args:
+        season_index (SeasonIndex): The index to write
+        index_dir (str): Directory holding the season indexes
+
+    Returns:
+        str: The path written to, or None if the index could not be written
+    """
+    path = season_index_path(season_index.league, index_dir)
+
+    try:
+        with atomic_write(path, "wb") as file:
+            with gzip.GzipFile(fileobj=file, mode="wb", mtime=0) as gzip_file:
+                gzip_file.write(json.dumps(season_index.to_dict(), separators=(",", ":")).encode())
+    except OSError as e:
+        print(f"Unable to save season index to {path}: {e}")
+        return None
+
+    return path
+
+
+def load_season_index(league, index_dir=SEASON_INDEX_DIR):
+    """
+    Read a league's season index from disk.
+
+    Args:
+        league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+        index_dir (str): Directory holding the season indexes
+
+    Returns:
+        SeasonIndex: The index, or None if it is missing, unreadable or from another version
+    """
+    try:
+        with gzip.open(season_index_path(league, index_dir), "rb") as file:
+            document = json.loads(file.read())
+    except (OSError, ValueError, EOFError):
+        return None
+
+    if not isinstance(document, dict) or document.get("version") != SEASON_INDEX_VERSION:
+        return None
+
+    return SeasonIndex(league, document.get("events", []), document.get("built_at", 0))
+
+
+class SeasonIndexStore:
+    """
+    Keeps each league's season index in memory once it has been read.
+
+    An index that is missing or past its TTL is never returned, so lookups
+    fall back to ESPN until the index is rebuilt. Such a miss is remembered
+    for recheck_seconds, and after that the file is only read again if its
+    modification time changed, so fetches do not touch the disk per team
+    when no index has been built.
+    """
+
+    def __init__(self, index_dir=SEASON_INDEX_DIR, ttl=SEASON_INDEX_TTL, recheck_seconds=SEASON_INDEX_RECHECK_SECONDS):
+        self.index_dir = index_dir
+        self.ttl = ttl
+        self.recheck_seconds = recheck_seconds
+        # League to (index or None, file mtime or None, monotonic time the file was checked)
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+
+    def get(self, league):
+        """
+        Get a league's season index if a fresh one exists.
+
+        Args:
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+        Returns:
+            SeasonIndex: The fresh index, or None
+        """
+        with self._lock:
+            entry = self._indexes.get(league)
+
+        now = time.monotonic()
+        if entry is not None:
+            season_index, mtime, checked_at = entry
+            if season_index is not None and season_index.is_fresh(self.ttl):
+                return season_index
+            if now - checked_at < self.recheck_seconds:
+                return None
+
+        # The file is read outside the lock so fetch threads never wait on each other's disk access
+        try:
+            mtime = os.path.getmtime(season_index_path(league, self.index_dir))
+        except OSError:
+            mtime = None
+
+        if entry is not None and entry[1] == mtime:
+            season_index = entry[0]
+        else:
+            season_index = load_season_index(league, self.index_dir) if mtime is not None else None
+
+        with self._lock:
+            # An index saved by another thread in the meantime is kept
+            if self._indexes.get(league) is entry:
+                self._indexes[league] = (season_index, mtime, now)
+
+        if season_index is None or not season_index.is_fresh(self.ttl):
+            return None
+
+        return season_index
+
+
+    def save(self, season_index):
+        """Write an index to disk and start serving it, unless it could not be written."""
+        path = save_season_index(season_index, self.index_dir)
+        if path is None:
+            return None
+
+        with self._lock:
+            self._indexes[season_index.league] = (season_index, os.path.getmtime(path), time.monotonic())
+
+        return path
+
+
+season_indexes = SeasonIndexStore()
@@ -0,0 +1,118 @@
+from constants import SUPPORTED_LEAGUES, TEAM_ALIASES
+import os, sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TeamRegistry:
+    """
+    Case-insensitive team lookups for every supported league.
+
+    Each league gets a dictionary keyed by the lower-cased abbreviation, full
+    name and any alternate abbreviations of every team, so resolving a team
+    is a single dictionary lookup instead of a scan over the league's teams.
+    """
+
+    def __init__(self, leagues=None, aliases=None):
+        leagues = SUPPORTED_LEAGUES if leagues is None else leagues
+        aliases = TEAM_ALIASES if aliases is None else aliases
+
+        self._teams = {}
+        self._names = {}
+        self._keys = {}
+
+        for league, league_info in leagues.items():
+            teams = tuple(league_info["teams"])
+            keys = {}
+
+            for alias, abbr in aliases.get(league, {}).items():
+                keys[alias.lower()] = abbr.upper()
+
+            # Names and real abbreviations are added last so an alias can never shadow them
+            for name, abbr in teams:
+                keys[name.lower()] = abbr.upper()
+                keys[abbr.lower()] = abbr.upper()
+
+            self._teams[league] = teams
+            self._names[league] = {abbr.upper(): name for name, abbr in teams}
+            self._keys[league] = keys
+
+
+    def teams(self, league):
+        """
+        Get the (name, abbreviation) pairs for a league, in display order.
+
+        Args:
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+        Returns:
+            tuple: The league's teams, or an empty tuple for an unsupported league
+        """
+        return self._teams.get(league, ())
+
+
+    def resolve(self, query, league):
+        """
+        Resolve an abbreviation, alias or full team name to ESPN's abbreviation.
+
+        Args:
+            query (str): What the user typed (e.g., 'gsw', 'GS', 'Golden State Warriors')
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+        Returns:
+            str: The upper-case abbreviation, or None if the team is not in the league
+        """
+        if not query:
+            return None
+
+        return self._keys.get(league, {}).get(query.strip().lower())
+
+
+    def is_valid(self, query, league):
+        """Check if a query names a team in the league."""
+        return self.resolve(query, league) is not None
+
+
+    def get_name(self, query, league):
+        """
+        Get the full team name for an abbreviation, alias or name.
+
+        Args:
+            query (str): The team to look up
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+        Returns:
+            str: The full team name, or None if the team is not in the league
+        """
+        abbr = self.resolve(query, league)
+        if abbr is None:
+            return None
+
+        return self._names[league][abbr]
+
+
+    def split_valid(self, queries, league):
+        """
+        Split user input into resolved teams and the entries that are not valid.
+
+        Args:
+            queries (list): The abbreviations, aliases or names to resolve
+            league (str): The league (e.g., 'nba', 'nfl', 'mlb')
+
+        Returns:
+            tuple: (lower-case abbreviations of the valid teams, invalid entries as given)
+        """
+        teams = []
+        invalid = []
+
+        for query in queries:
+            abbr = self.resolve(query, league)
+            if abbr is None:
+                invalid.append(query)
+            else:
+                teams.append(abbr.lower())
+
+        return teams, invalid
+
+
+team_registry = TeamRegistry()
@@ -2,13 +2,31 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from gamechecker.game_checker import game_checker
-from constants import SUPPORTED_LEAGUES
+from gamechecker.game_checker import fetch_league_schedules, format_check_event, get_week_dates, iter_games
+from gamechecker.team_registry import team_registry
+from gui.gui_state import load_last_teams, save_last_teams
+from gui.logo_cache import LogoCache
+from gui.results_table import GameResultsTable
+from constants import GUI_STATE_PATH, SUPPORTED_LEAGUES
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
 import tkinter as tk
-import io
-import contextlib
+import threading
+import time
+import queue
+
+# Logo sizes in pixels: the splash screen logo, the sport buttons and the team buttons
+SPLASH_LOGO_SIZE = 500
+SPORT_LOGO_SIZE = 250
+TEAM_LOGO_SIZE = 80
+
+# The splash screen stays up until warm-up finishes, but at least SPLASH_MIN_MS and at most
+# SPLASH_MAX_MS milliseconds, checking every SPLASH_POLL_MS
+SPLASH_MIN_MS = 1500
+SPLASH_MAX_MS = 5000
+SPLASH_POLL_MS = 50
+
+# How often the results screen picks up events from the search worker, in milliseconds
+RESULTS_POLL_MS = 50
 
 class FridayNightBytesGUI:
     def __init__(self):
@@ -21,6 +39,29 @@ class FridayNightBytesGUI:
         
         self.selected_sport = None
         self.selected_teams = []
+        self.league_selections = {}
+        self.logo_cache = LogoCache()
+
+        # Sport and team screens are built on their first visit and then only hidden and shown again
+        self.screens = {}
+        self.team_screens = {}
+        self.state_path = GUI_STATE_PATH
+        self.splash_started = None
+        self.warmup_done = None
+        self.results_table = None
+        self.progress_label = None
+        self.notes_label = None
+        self.cancel_btn = None
+
+        # The search runs on a worker thread and hands its events to the Tk thread through this queue
+        self.results_queue = queue.Queue()
+        self.search_id = 0
+        self.search_thread = None
+        self.cancel_event = None
+        self.search_games = []
+        self.search_notes = []
+        self.search_total = 0
+        self.search_done = 0
         
         self.show_splash_screen()
 
@@ -34,34 +75,111 @@ class FridayNightBytesGUI:
 
 
     def clear_window(self):
-        """Clear all widgets from the window."""
+        """Clear the window, cancelling any search still running.
+
+        Screens kept in self.screens are hidden so they can be shown again;
+        everything else is destroyed.
+        """
+        self.cancel_search()
+        self.results_table = None
+        self.progress_label = None
+        self.notes_label = None
+        self.cancel_btn = None
+
+        kept_screens = list(self.screens.values())
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if any(widget is screen for screen in kept_screens):
+                widget.pack_forget()
+            else:
+                widget.destroy()
+
+
+    def show_kept_screen(self, key, build):
+        """Show a screen kept from an earlier visit, calling build to create it on the first one.
+
+        build must create the screen's frame, pack it into the root window and return it.
+        """
+        self.clear_window()
+
+        screen = self.screens.get(key)
+        if screen is None:
+            self.screens[key] = build()
+        else:
+            screen.pack(expand=True, fill="both")
 
 
     def show_splash_screen(self):
-        """Display the splash screen for 5 seconds."""
+        """Display the splash screen while the logos and teams are warmed up in the background.
+
+        Moves on to sport selection once warm-up finishes, after SPLASH_MIN_MS at
+        the earliest and SPLASH_MAX_MS at the latest.
+        """
         self.clear_window()
         
         main_frame = tk.Frame(self.root, bg="#1a1a2e")
         main_frame.pack(expand=True, fill="both")
         
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "logo.png")
-
-        logo_img = Image.open(logo_path)
-        logo_img = logo_img.resize((500, 500), Image.Resampling.LANCZOS)
-            
-        self.logo_photo = ImageTk.PhotoImage(logo_img)
+        self.logo_photo = self.logo_cache.get_asset("logo", SPLASH_LOGO_SIZE)
         logo_label = tk.Label(main_frame, image=self.logo_photo, bg="#1a1a2e")
         logo_label.pack(expand=True)
 
-        self.root.after(5000, self.show_sport_selection)
+        self.splash_started = time.monotonic()
+        self.warmup_done = threading.Event()
+        threading.Thread(target=self.warm_up, args=(self.warmup_done,), daemon=True).start()
+        threading.Thread(target=self.prefetch_last_teams, daemon=True).start()
+
+        self.root.after(SPLASH_POLL_MS, self.poll_splash)
+
+
+    def warm_up(self, done):
+        """Load the team registry, sport logos and team logo atlases, then set done.
+
+        Runs on a background thread, so it only decodes images; their PhotoImages
+        are made on the Tk thread when the screens are shown.
+        """
+        try:
+            for league_key in SUPPORTED_LEAGUES:
+                team_registry.teams(league_key)
+                self.logo_cache.warm_asset(f"{league_key}-logo", SPORT_LOGO_SIZE)
+                self.logo_cache.warm_league(league_key, TEAM_LOGO_SIZE)
+        except Exception as e:
+            print(f"Warm-up stopped early: {e}")
+        finally:
+            done.set()
+
+
+    def prefetch_last_teams(self):
+        """Fetch this week's schedules for the teams of the last search, so searching them again hits the cache.
+
+        Runs on a background thread and is not waited for; errors are ignored.
+        """
+        target_dates = get_week_dates()
+
+        for league_key, team_abbrs in load_last_teams(self.state_path).items():
+            try:
+                fetch_league_schedules(team_abbrs, league_key, target_dates)
+            except Exception:
+                pass
+
+
+    def poll_splash(self):
+        """Move on to sport selection once warm-up finishes and the splash has been up long enough."""
+        elapsed_ms = (time.monotonic() - self.splash_started) * 1000
+
+        if (self.warmup_done.is_set() and elapsed_ms >= SPLASH_MIN_MS) or elapsed_ms >= SPLASH_MAX_MS:
+            self.show_sport_selection()
+            return
+
+        self.root.after(SPLASH_POLL_MS, self.poll_splash)
 
 
     def show_sport_selection(self):
         """Display the sport selection screen with clickable sports."""
-        self.clear_window()
-        
+        self.show_kept_screen("sports", self.build_sport_selection)
+
+
+    def build_sport_selection(self):
+        """Build the sport selection screen and return its frame."""
         main_frame = tk.Frame(self.root, bg="#1a1a2e")
         main_frame.pack(expand=True, fill="both")
         
@@ -81,6 +199,8 @@ class FridayNightBytesGUI:
         self.create_sport_button(sports_frame, "nfl", 1)
         self.create_sport_button(sports_frame, "mlb", 2)
 
+        return main_frame
+
 
     def create_sport_button(self, parent, sport_key, row):
         """Create a clickable sport button."""
@@ -92,11 +212,8 @@ class FridayNightBytesGUI:
         
         sport_frame.bind("<Button-1>", lambda e: self.select_sport(sport_key))
         
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", f"{sport_key}-logo.png")
-        
-        logo_img = Image.open(logo_path)
-        logo_img = logo_img.resize((250, 250), Image.Resampling.LANCZOS)
-        sport_logo = ImageTk.PhotoImage(logo_img)
+        # The sport screen is kept, so its logo must outlive any eviction from the logo cache
+        sport_logo = self.logo_cache.get_asset(f"{sport_key}-logo", SPORT_LOGO_SIZE, pin=True)
                 
         logo_label = tk.Label(
             sport_frame,
@@ -104,11 +221,6 @@ class FridayNightBytesGUI:
             bg="#16213e",
             cursor="hand2"
         )
-                
-        if not hasattr(self, 'sport_logos'):
-            self.sport_logos = {}
-
-        self.sport_logos[sport_key] = sport_logo
         
         logo_label.pack(expand=True)
         logo_label.bind("<Button-1>", lambda e: self.select_sport(sport_key))
@@ -145,17 +257,28 @@ class FridayNightBytesGUI:
         
         Additionally, if you wish to go back to the sport selection,
         you can click the back button at the top left.
+
+        Each league's screen is built on its first visit and reused after that,
+        with only the buttons whose selection changed updated.
         """
-        self.selected_teams = []
-        
-        self.clear_window()
-        
         if not self.selected_sport or self.selected_sport not in SUPPORTED_LEAGUES:
             self.show_sport_selection()
             return
-            
-        league_info = SUPPORTED_LEAGUES[self.selected_sport]
-        
+
+        # Selections are kept per league so one search can cover several sports
+        self.selected_teams = self.league_selections.setdefault(self.selected_sport, [])
+
+        self.show_kept_screen(("teams", self.selected_sport), self.build_team_selection)
+
+        team_screen = self.team_screens[self.selected_sport]
+        self.team_buttons = team_screen["team_buttons"]
+        self.continue_btn = team_screen["continue_btn"]
+        self.canvas = team_screen["canvas"]
+        self.sync_team_buttons()
+
+
+    def build_team_selection(self):
+        """Build the team selection screen for the chosen sport and return its frame."""
         main_frame = tk.Frame(self.root, bg="#16213e")
         main_frame.pack(expand=True, fill="both")
         
@@ -177,7 +300,7 @@ class FridayNightBytesGUI:
         )
         back_btn.pack(side="left", padx=20)
         
-        self.continue_btn = tk.Button(
+        continue_btn = tk.Button(
             header_frame,
             text="View Games",
             font=("Helvetica", 12),
@@ -218,9 +341,7 @@ class FridayNightBytesGUI:
         teams_frame = tk.Frame(teams_wrapper, bg="#1a1a2e")
         teams_frame.pack(fill="both", expand=True, pady=20)
         
-        self.team_buttons = {}        
-        self.teams_frame = teams_frame
-        self.teams_wrapper = teams_wrapper
+        self.team_buttons = {}
         
         self.root.update_idletasks()
         canvas_width = canvas.winfo_width()
@@ -233,15 +354,8 @@ class FridayNightBytesGUI:
         cols_per_row = max(1, available_width // button_width)
         
         self.cols_per_row = cols_per_row
-        
-        for i, (team_name, team_abbr) in enumerate(league_info["teams"]):
-            self.create_team_button(teams_frame, team_name, team_abbr, i)
-        
-        canvas.pack(side="left", fill="both", expand=True, padx=(20, 0))
-        scrollbar.pack(side="right", fill="y", padx=(0, 20))
-
-        self.canvas = canvas
 
+        # The wheel callbacks scroll this screen's canvas, so they are set up before its buttons bind to them
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
@@ -261,11 +375,50 @@ class FridayNightBytesGUI:
             'down': _on_mousewheel_down
         }
         
+        for i, (team_name, team_abbr) in enumerate(team_registry.teams(self.selected_sport)):
+            self.create_team_button(teams_frame, team_name, team_abbr, i)
+        
+        canvas.pack(side="left", fill="both", expand=True, padx=(20, 0))
+        scrollbar.pack(side="right", fill="y", padx=(0, 20))
+
         self._bind_mousewheel_to_widget(canvas)
         self._bind_mousewheel_to_widget(scrollable_frame)
         self._bind_mousewheel_to_widget(teams_wrapper)
         self._bind_mousewheel_to_widget(teams_frame)
 
+        # button_keys maps the lower-case abbreviations used in selections to team_buttons keys, and
+        # highlighted holds the teams whose buttons are currently drawn as selected
+        button_keys = {team_abbr.lower(): team_abbr for team_abbr in self.team_buttons}
+        self.team_screens[self.selected_sport] = {
+            "team_buttons": self.team_buttons,
+            "continue_btn": continue_btn,
+            "canvas": canvas,
+            "button_keys": button_keys,
+            "highlighted": {team_abbr for team_abbr in self.selected_teams if team_abbr in button_keys},
+        }
+
+        return main_frame
+
+
+    def sync_team_buttons(self):
+        """Bring a kept team screen up to date with the current selections.
+
+        Only the buttons whose selection changed since they were last drawn are
+        updated, so showing the screen again costs the same for any league.
+        """
+        team_screen = self.team_screens[self.selected_sport]
+        button_keys = team_screen["button_keys"]
+        selected = {team_abbr for team_abbr in self.selected_teams if team_abbr in button_keys}
+
+        for team_abbr in team_screen["highlighted"] ^ selected:
+            self.team_buttons[button_keys[team_abbr]].config(bg="#ac9c7c" if team_abbr in selected else "#ffffff")
+        team_screen["highlighted"] = selected
+
+        if self.has_selected_teams():
+            self.continue_btn.pack(side="right", padx=20)
+        else:
+            self.continue_btn.pack_forget()
+
 
     def _bind_mousewheel_to_widget(self, widget):
         """Helper method to bind mouse wheel events to a widget.
@@ -291,42 +444,20 @@ class FridayNightBytesGUI:
         parent.grid_columnconfigure(col, weight=1, minsize=120)
         parent.grid_rowconfigure(row, weight=1)
 
-        sport_folder = str(self.selected_sport)
-        base_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "teamlogos", sport_folder)
-        
-        possible_filenames = [
-            f"{team_abbr.lower()}.png",
-            f"{team_name.lower().replace(' ', '_')}.png",
-        ]
-        
-        logo_path = None
-        for filename in possible_filenames:
-            potential_path = os.path.join(base_path, filename)
-
-            if os.path.exists(potential_path):
-                logo_path = potential_path
-                break
-        
-        logo_size = 80
-        logo_img = Image.open(logo_path)
-        logo_img = logo_img.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
-        team_logo = ImageTk.PhotoImage(logo_img)
+        # Team screens are kept, so their logos must outlive any eviction from the logo cache
+        team_logo = self.logo_cache.get(self.selected_sport, team_abbr, team_name, TEAM_LOGO_SIZE, pin=True)
             
         team_btn = tk.Button(
             team_frame,
-            image=team_logo,
-            bg="#ffffff",
+            image=team_logo or "",
+            text="" if team_logo else team_name,
+            bg="#ac9c7c" if team_abbr.lower() in self.selected_teams else "#ffffff",
             activebackground="#ac9c7c",
             border=0,
             padx=15,
             pady=15,
             command=lambda abbr=team_abbr: self.toggle_team(abbr)
         )
-            
-        if not hasattr(self, 'team_logos'):
-            self.team_logos = {}
-
-        self.team_logos[team_abbr] = team_logo
         
         team_btn.pack(fill="both", expand=True)
         self.team_buttons[team_abbr] = team_btn
@@ -350,9 +481,12 @@ class FridayNightBytesGUI:
 
             if hasattr(self.team_buttons[team_abbr], 'cget') and 'text' in str(self.team_buttons[team_abbr].cget('text')):
                 self.team_buttons[team_abbr].config(fg="#1a1a2e")
+
+        if self.selected_sport in self.team_screens:
+            self.team_screens[self.selected_sport]["highlighted"] ^= {team_abbr.lower()}
         
-        # Show/hide the continue button based on team selection
-        if self.selected_teams:
+        # Show/hide the continue button based on team selection in any league
+        if self.has_selected_teams():
             if not self.continue_btn.winfo_viewable():
                 self.continue_btn.pack(side="right", padx=20)
         else:
@@ -360,9 +494,17 @@ class FridayNightBytesGUI:
                 self.continue_btn.pack_forget()
 
 
+    def has_selected_teams(self):
+        """Check if any team is selected in the current or any other league."""
+        return bool(self.selected_teams) or any(self.league_selections.values())
+
+
     def show_games(self):
-        """Display games for selected teams. You must select at least one team."""
-        if not self.selected_teams:
+        """Display games for selected teams across every league. You must select at least one team."""
+        if self.selected_sport:
+            self.league_selections[self.selected_sport] = self.selected_teams
+
+        if not self.has_selected_teams():
             messagebox.showwarning("No Teams Selected", "Please select at least one team.")
             return
         
@@ -371,46 +513,153 @@ class FridayNightBytesGUI:
             return
         
         sport_mapping = {"nba": "1", "nfl": "2", "mlb": "3"}
-        preferences = {
-            "sport": sport_mapping[self.selected_sport],
-            f"{self.selected_sport}_team": self.selected_teams
-        }
-        
-        self.clear_window()
-        
-        loading_frame = tk.Frame(self.root, bg="#1a1a2e")
-        loading_frame.pack(expand=True, fill="both")
-        
-        loading_label = tk.Label(
-            loading_frame,
-            text="Searching for upcoming games...",
-            font=("Helvetica", 20),
-            fg="#eee2dc",
-            bg="#1a1a2e"
+        leagues = [league_key for league_key in SUPPORTED_LEAGUES if self.league_selections.get(league_key)]
+        preferences = {"sport": ",".join(sport_mapping[league_key] for league_key in leagues)}
+        for league_key in leagues:
+            preferences[f"{league_key}_team"] = list(self.league_selections[league_key])
+
+        save_last_teams({league_key: preferences[f"{league_key}_team"] for league_key in leagues}, self.state_path)
+        
+        # Games are added to the results table as each team's search finishes rather than all at once
+        self.show_games_result(searching=True)
+        self.start_search(preferences)
+
+
+    def start_search(self, preferences):
+        """Start searching for games on a worker thread and poll for its results."""
+        self.search_id += 1
+        self.cancel_event = threading.Event()
+        self.search_games = []
+        self.search_notes = []
+        self.search_total = sum(len(preferences.get(f"{league_key}_team") or []) for league_key in SUPPORTED_LEAGUES)
+        self.search_done = 0
+        self.update_progress()
+
+        self.search_thread = threading.Thread(
+            target=self.search_worker,
+            args=(preferences, self.search_id, self.cancel_event),
+            daemon=True
         )
-        loading_label.pack(expand=True)
-        
-        self.root.update()
-        
-        try:          
-            file = io.StringIO()
-            with contextlib.redirect_stdout(file):
-                game_checker(preferences)
+        self.search_thread.start()
+        self.root.after(RESULTS_POLL_MS, self.poll_search_results, self.search_id)
 
-            output = file.getvalue()
-            self.show_games_result(output)
-            
+
+    def search_worker(self, preferences, search_id, cancel_event):
+        """Run iter_games off the Tk thread, queueing each event for poll_search_results."""
+        try:
+            for event in iter_games(preferences, cancel_event=cancel_event):
+                self.results_queue.put((search_id, "event", event))
         except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while fetching games: {str(e)}")
-            self.show_team_selection()
+            self.results_queue.put((search_id, "error", e))
+        finally:
+            self.results_queue.put((search_id, "done", None))
+
+
+    def poll_search_results(self, search_id):
+        """Show the events queued by the search worker, then check again shortly until it is done."""
+        if search_id != self.search_id:
+            return
+
+        while True:
+            try:
+                event_search_id, kind, payload = self.results_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            # Events from a cancelled or replaced search are dropped
+            if event_search_id != search_id:
+                continue
+
+            if kind == "event":
+                self.handle_search_event(payload)
+            elif kind == "error":
+                self.cancel_search()
+                messagebox.showerror("Error", f"An error occurred while fetching games: {str(payload)}")
+                self.show_team_selection()
+                return
+            else:
+                self.finish_search()
+                return
+
+        self.root.after(RESULTS_POLL_MS, self.poll_search_results, search_id)
+
 
+    def handle_search_event(self, event):
+        """Add one event from iter_games to the results screen.
 
-    def show_games_result(self, games_output):
-        """Display the games result. It will show potential games for today and tomorrow.
+        Games go into the results table; teams that could not be searched are
+        listed below it.
+        """
+        if event.kind == 'game':
+            self.search_games.append(event.game)
+            if self.results_table is not None:
+                self.results_table.add_game(event.game)
+            return
+
+        self.search_done += 1
+        if event.kind in ('error', 'unknown_team'):
+            self.search_notes.append(format_check_event(event).strip())
+            self.update_notes()
+        self.update_progress()
+
+
+    def finish_search(self):
+        """Mark the search as finished once every team has been searched."""
+        self.cancel_event = None
+        self.update_progress(finished=True)
+
+
+    def cancel_search(self):
+        """Stop the running search, if any. Its remaining results are discarded.
+
+        Returns True if a search was running.
+        """
+        if self.cancel_event is None:
+            return False
+
+        self.cancel_event.set()
+        self.cancel_event = None
+        self.search_id += 1
+
+        return True
+
+
+    def on_cancel_clicked(self):
+        """Cancel button handler on the results screen."""
+        if self.cancel_search():
+            self.update_progress(finished=True, cancelled=True)
+
+
+    def update_progress(self, finished=False, cancelled=False):
+        """Update the progress line and hide the Cancel button once the search is over."""
+        if self.progress_label is not None:
+            if cancelled:
+                text = f"Cancelled after {self.search_done} of {self.search_total} teams"
+            elif finished:
+                text = f"Searched {self.search_total} team{'s' if self.search_total != 1 else ''}"
+                if not self.search_games:
+                    text += ", no games scheduled"
+            else:
+                text = f"Searching... {self.search_done} of {self.search_total} teams"
+            self.progress_label.config(text=text)
+
+        if (finished or cancelled) and self.cancel_btn is not None:
+            self.cancel_btn.pack_forget()
+
+
+    def update_notes(self):
+        """Show the teams that could not be searched below the results table."""
+        if self.notes_label is not None:
+            self.notes_label.config(text="\n".join(self.search_notes))
+
+
+    def show_games_result(self, searching=False):
+        """Display the games result as a table, sortable by clicking a column heading.
         
         Once done, you have the options to go back to the team selection or select a new sport.
         
-        Or, you can just close the window.
+        Or, you can just close the window. While a search is running, a progress line
+        and a Cancel button are shown.
         """
         self.clear_window()
         
@@ -458,28 +707,50 @@ class FridayNightBytesGUI:
             bg="#1a1a2e"
         )
         title_label.pack()
-        
-        text_frame = tk.Frame(main_frame, bg="#1a1a2e")
-        text_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        text_widget = tk.Text(
-            text_frame,
-            bg="#16213e",
-            fg="#eee2dc",
-            font=("Courier", 11),
-            wrap="word",
-            padx=15,
-            pady=15
+
+        progress_frame = tk.Frame(main_frame, bg="#1a1a2e")
+        progress_frame.pack(fill="x", padx=20)
+
+        self.progress_label = tk.Label(
+            progress_frame,
+            text="🔍 Searching for upcoming games..." if searching else "",
+            font=("Helvetica", 12),
+            fg="#ac9c7c",
+            bg="#1a1a2e"
         )
+        self.progress_label.pack(side="left")
+
+        if searching:
+            self.cancel_btn = tk.Button(
+                progress_frame,
+                text="Cancel",
+                font=("Helvetica", 12),
+                bg="#16213e",
+                fg="#eee2dc",
+                activebackground="#ac9c7c",
+                activeforeground="#1a1a2e",
+                border=0,
+                padx=15,
+                pady=5,
+                command=self.on_cancel_clicked
+            )
+            self.cancel_btn.pack(side="right")
+
+        self.notes_label = tk.Label(
+            main_frame,
+            text="",
+            font=("Helvetica", 11),
+            fg="#ac9c7c",
+            bg="#1a1a2e",
+            justify="left",
+            anchor="w"
+        )
+        self.notes_label.pack(side="bottom", fill="x", padx=20, pady=(0, 10))
         
-        scrollbar_text = ttk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar_text.set)
-        
-        text_widget.insert("1.0", games_output)
-        text_widget.config(state="disabled")
-        
-        text_widget.pack(side="left", fill="both", expand=True)
-        scrollbar_text.pack(side="right", fill="y")
+        table_frame = tk.Frame(main_frame, bg="#1a1a2e")
+        table_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        self.results_table = GameResultsTable(table_frame, self.root)
 
 
     def run(self):
@@ -0,0 +1,38 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import GUI_STATE_PATH, SUPPORTED_LEAGUES
+from gamechecker.atomic_write import atomic_write
+import json
+
+
+def load_last_teams(state_path=GUI_STATE_PATH):
+    """Load the teams picked in the last GUI search.
+
+    Returns a dict of league to team abbreviations, empty if nothing was saved.
+    """
+    try:
+        with open(state_path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    teams = state.get("teams") if isinstance(state, dict) else None
+    if not isinstance(teams, dict):
+        return {}
+
+    return {
+        league: [str(team_abbr) for team_abbr in team_abbrs]
+        for league, team_abbrs in teams.items()
+        if league in SUPPORTED_LEAGUES and isinstance(team_abbrs, list) and team_abbrs
+    }
+
+
+def save_last_teams(teams, state_path=GUI_STATE_PATH):
+    """Atomically save the teams picked in a GUI search, a dict of league to team abbreviations."""
+    try:
+        with atomic_write(state_path) as file:
+            json.dump({"teams": teams}, file, separators=(",", ":"), sort_keys=True)
+    except OSError as e:
+        print(f"Unable to save GUI state to {state_path}: {e}")
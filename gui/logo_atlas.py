@@ -0,0 +1,172 @@
+"""Pack each league's team logos into one pre-scaled atlas image.
+
+Usage: python gui/logo_atlas.py [--size 80] [--league nba,nfl,mlb]
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import SUPPORTED_LEAGUES
+from functools import lru_cache
+from PIL import Image
+import argparse
+import hashlib
+import json
+
+TEAM_LOGO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "teamlogos")
+
+
+@lru_cache(maxsize=None)
+def find_logo_path(league, team_abbr, team_name):
+    """Find a team's logo file, trying the abbreviation and then the team name.
+
+    Returns None if the team has no logo.
+    """
+    base_path = os.path.join(TEAM_LOGO_DIR, league)
+
+    for filename in (f"{team_abbr.lower()}.png", f"{team_name.lower().replace(' ', '_')}.png"):
+        potential_path = os.path.join(base_path, filename)
+
+        if os.path.exists(potential_path):
+            return potential_path
+
+    return None
+
+
+ATLAS_DIR = os.path.join(TEAM_LOGO_DIR, "atlas")
+ATLAS_COLUMNS = 8
+
+
+def atlas_paths(league, size, atlas_dir=ATLAS_DIR):
+    """Get the image and manifest paths of a league's atlas."""
+    base_path = os.path.join(atlas_dir, f"{league}-{size}")
+    return f"{base_path}.png", f"{base_path}.json"
+
+
+def logo_source(logo_path):
+    """Describe a logo file for the atlas manifest: its file name and the SHA-256 of its contents.
+
+    A content hash is used rather than the modification time, which a git
+    checkout resets.
+    """
+    with open(logo_path, "rb") as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+
+    return {"file": os.path.basename(logo_path), "sha256": digest}
+
+
+def league_logos(league):
+    """Get (upper-case abbreviation, logo path) for every team in a league that has a logo."""
+    logos = []
+    for team_name, team_abbr in SUPPORTED_LEAGUES[league]["teams"]:
+        logo_path = find_logo_path(league, team_abbr, team_name)
+        if logo_path is not None:
+            logos.append((team_abbr.upper(), logo_path))
+
+    return logos
+
+
+def build_logo_atlas(league, size, atlas_dir=ATLAS_DIR):
+    """Resize every logo in a league to size x size and pack them into one image.
+
+    The manifest maps each upper-case team abbreviation to the top-left corner
+    of its tile, and records the logo file each tile was made from so a
+    changed logo is noticed. Teams without a logo are left out.
+
+    Returns the paths of the atlas image and manifest.
+    """
+    logos = league_logos(league)
+
+    rows = -(-len(logos) // ATLAS_COLUMNS)
+    atlas = Image.new("RGBA", (ATLAS_COLUMNS * size, max(rows, 1) * size), (0, 0, 0, 0))
+    tiles = {}
+    sources = {}
+
+    for index, (team_abbr, logo_path) in enumerate(logos):
+        x, y = (index % ATLAS_COLUMNS) * size, (index // ATLAS_COLUMNS) * size
+        with Image.open(logo_path) as logo_img:
+            atlas.paste(logo_img.convert("RGBA").resize((size, size), Image.Resampling.LANCZOS), (x, y))
+        tiles[team_abbr] = [x, y]
+        sources[team_abbr] = logo_source(logo_path)
+
+    image_path, manifest_path = atlas_paths(league, size, atlas_dir)
+    os.makedirs(atlas_dir, exist_ok=True)
+    atlas.save(image_path, format="PNG", optimize=True)
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump({"league": league, "size": size, "tiles": tiles, "sources": sources}, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+    return image_path, manifest_path
+
+
+class LogoAtlas:
+    """A league's atlas image and manifest, read with one image open."""
+
+    def __init__(self, image, tiles, size):
+        self.image = image
+        self.tiles = tiles
+        self.size = size
+
+
+    @classmethod
+    def load(cls, league, size, atlas_dir=ATLAS_DIR):
+        """Load a league's atlas, or return None if none was built for this size.
+
+        Tiles whose logo file changed or was removed since the atlas was built
+        are left out, so those teams fall back to their own thumbnails until
+        the atlas is rebuilt.
+        """
+        image_path, manifest_path = atlas_paths(league, size, atlas_dir)
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+            with Image.open(image_path) as atlas_img:
+                image = atlas_img.copy()
+        except (OSError, ValueError):
+            return None
+
+        tiles, sources = manifest.get("tiles", {}), manifest.get("sources", {})
+        current = {}
+        for team_abbr, logo_path in league_logos(league):
+            if team_abbr in tiles:
+                try:
+                    if logo_source(logo_path) == sources.get(team_abbr):
+                        current[team_abbr] = tiles[team_abbr]
+                except OSError:
+                    pass
+
+        if len(current) < len(tiles):
+            print(f"Logo atlas {os.path.basename(image_path)} is out of date for {len(tiles) - len(current)} team(s); "
+                  f"rebuild it with python3 gui/logo_atlas.py")
+
+        return cls(image, current, size)
+
+
+    def tile(self, team_abbr):
+        """Crop a team's logo out of the atlas, or return None if it is not in the atlas."""
+        position = self.tiles.get(team_abbr.upper())
+        if position is None:
+            return None
+
+        x, y = position
+        return self.image.crop((x, y, x + self.size, y + self.size))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the per-league team logo atlases")
+    parser.add_argument("--size", type=int, default=80, help="Tile size in pixels")
+    parser.add_argument("--league", default="nba,nfl,mlb", help="Comma-separated leagues to build")
+    args = parser.parse_args(argv)
+
+    for league in [league.strip().lower() for league in args.league.split(",") if league.strip()]:
+        if league not in SUPPORTED_LEAGUES:
+            print(f"Unsupported league: {league}")
+            continue
+
+        image_path, _ = build_logo_atlas(league, args.size)
+        print(f"✅ Built {os.path.relpath(image_path)} ({os.path.getsize(image_path) // 1024} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import LOGO_CACHE_DIR, LOGO_CACHE_SIZE
+from gamechecker.atomic_write import atomic_write
+from gui.logo_atlas import ATLAS_DIR, LogoAtlas, find_logo_path
+from collections import OrderedDict
+from PIL import Image, ImageTk
+import threading
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+
+def thumbnail_path(league, team_abbr, size, cache_dir=LOGO_CACHE_DIR):
+    """Get the file path of a team's resized logo."""
+    return os.path.join(cache_dir, league, f"{team_abbr.lower()}-{size}.png")
+
+
+def load_resized(source_path, thumb_path, size):
+    """Load an image resized to size x size, through a thumbnail saved on disk.
+
+    A thumbnail saved by an earlier run is used as long as it is newer than the
+    source image; otherwise the source is resized and the thumbnail saved.
+    """
+    try:
+        if os.path.getmtime(thumb_path) >= os.path.getmtime(source_path):
+            with Image.open(thumb_path) as thumbnail:
+                return thumbnail.copy()
+    except OSError:
+        pass
+
+    with Image.open(source_path) as source_img:
+        thumbnail = source_img.resize((size, size), Image.Resampling.LANCZOS)
+
+    try:
+        with atomic_write(thumb_path, "wb") as file:
+            thumbnail.save(file, format="PNG")
+    except OSError as e:
+        print(f"Unable to save logo thumbnail {thumb_path}: {e}")
+
+    return thumbnail
+
+
+def load_thumbnail(league, team_abbr, team_name, size, cache_dir=LOGO_CACHE_DIR):
+    """Load a team's logo resized to size x size.
+
+    Returns None if the team has no logo.
+    """
+    logo_path = find_logo_path(league, team_abbr, team_name)
+    if logo_path is None:
+        return None
+
+    return load_resized(logo_path, thumbnail_path(league, team_abbr, size, cache_dir), size)
+
+
+def load_asset(name, size, cache_dir=LOGO_CACHE_DIR):
+    """Load an image from assets/ (e.g. 'nba-logo') resized to size x size."""
+    return load_resized(os.path.join(ASSETS_DIR, f"{name}.png"), thumbnail_path("assets", name, size, cache_dir), size)
+
+
+class LogoCache:
+    """Team logos ready to show in Tk, keyed by (league, abbreviation, size).
+
+    Logos are cropped from the league's pre-built atlas when there is one for
+    the size, so a whole grid costs one image open; otherwise each logo's
+    saved thumbnail is used. Up to max_size PhotoImages are kept, least
+    recently used first out, so a screen that has been shown before is rebuilt
+    without decoding or resizing any images. Images got with pin=True are
+    never dropped and do not count towards max_size: Tk blanks an image whose
+    PhotoImage is released, so logos on screens that are kept and shown again
+    must stay alive.
+
+    PhotoImages can only be made on the Tk thread, so warm_league and
+    warm_asset do the decoding and resizing ahead of time from any thread and
+    leave only the PhotoImage for get and get_asset to make.
+    """
+
+    def __init__(self, max_size=LOGO_CACHE_SIZE, cache_dir=LOGO_CACHE_DIR, atlas_dir=ATLAS_DIR):
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.atlas_dir = atlas_dir
+        self.images = OrderedDict()
+        self.pinned = set()
+        self.atlases = {}
+        self.prepared = {}
+        self.stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+
+    def get_atlas(self, league, size):
+        """Get a league's atlas for a tile size, loading it on first use (None if it was not built)."""
+        with self._lock:
+            if (league, size) in self.atlases:
+                return self.atlases[(league, size)]
+
+        atlas = LogoAtlas.load(league, size, self.atlas_dir)
+
+        with self._lock:
+            return self.atlases.setdefault((league, size), atlas)
+
+
+    def warm_league(self, league, size):
+        """Load a league's atlas before its team screen is first shown."""
+        self.get_atlas(league, size)
+
+
+    def warm_asset(self, name, size):
+        """Decode and resize an image from assets/ before it is first shown."""
+        image = load_asset(name, size, self.cache_dir)
+
+        with self._lock:
+            self.prepared[("assets", name, size)] = image
+
+
+    def _lookup(self, key):
+        """Get a kept PhotoImage and mark it most recently used, or None if it is not kept."""
+        if key in self.images:
+            self.stats["hits"] += 1
+            self.images.move_to_end(key)
+            return self.images[key]
+
+        self.stats["misses"] += 1
+        return None
+
+
+    def _remember(self, key, image):
+        """Make a PhotoImage and keep it, dropping the least recently used unpinned images beyond max_size."""
+        photo = ImageTk.PhotoImage(image)
+        self.images[key] = photo
+
+        unpinned = [old_key for old_key in self.images if old_key not in self.pinned]
+        for old_key in unpinned[:max(0, len(unpinned) - self.max_size)]:
+            del self.images[old_key]
+
+        return photo
+
+
+    def get(self, league, team_abbr, team_name, size, pin=False):
+        """Get a team's logo as a PhotoImage, or None if the team has no logo; pin keeps it for good."""
+        key = (league, team_abbr.upper(), size)
+        if pin:
+            self.pinned.add(key)
+
+        photo = self._lookup(key)
+        if photo is not None:
+            return photo
+
+        atlas = self.get_atlas(league, size)
+        logo_img = atlas.tile(team_abbr) if atlas is not None else None
+        if logo_img is None:
+            logo_img = load_thumbnail(league, team_abbr, team_name, size, self.cache_dir)
+        if logo_img is None:
+            return None
+
+        return self._remember(key, logo_img)
+
+
+    def get_asset(self, name, size, pin=False):
+        """Get an image from assets/ (e.g. 'nba-logo') resized to size x size as a PhotoImage; pin keeps it for good."""
+        key = ("assets", name, size)
+        if pin:
+            self.pinned.add(key)
+
+        photo = self._lookup(key)
+        if photo is not None:
+            return photo
+
+        with self._lock:
+            image = self.prepared.pop(key, None)
+        if image is None:
+            image = load_asset(name, size, self.cache_dir)
+
+        return self._remember(key, image)
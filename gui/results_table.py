@@ -0,0 +1,148 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gamechecker.datetime_format import format_game_datetime
+from tkinter import ttk
+import bisect
+
+# The results table's columns: (column id, heading, width in pixels)
+RESULT_COLUMNS = (
+    ("team", "Team", 210),
+    ("opponent", "Opponent", 210),
+    ("location", "Home/Away", 100),
+    ("time", "Date/Time", 200),
+)
+
+# Rows are added to the table RESULTS_CHUNK_SIZE at a time, every RESULTS_CHUNK_MS milliseconds,
+# so a large result set never blocks the Tk thread for long
+RESULTS_CHUNK_SIZE = 100
+RESULTS_CHUNK_MS = 1
+
+
+def game_row(game):
+    """Get the values shown for a game: team, opponent, home/away and start time."""
+    return (
+        game['team'],
+        game['opponent'],
+        'Home' if game['is_home'] else 'Away',
+        format_game_datetime(game.get('start') or game.get('datetime', '')),
+    )
+
+
+def sort_key(game, column):
+    """Get the key a game is sorted by for a column, breaking ties by start time."""
+    chronological = (game.get('date', ''), game.get('datetime', ''))
+
+    if column == "time":
+        return chronological
+    if column == "location":
+        return ('Home' if game['is_home'] else 'Away', chronological)
+
+    return (str(game.get(column) or '').lower(), chronological)
+
+
+class GameResultsTable:
+    """Games shown in a ttk.Treeview, sortable by clicking a column heading.
+
+    Games are kept in ascending order of the sort column, and only the first
+    `shown` of them (in display order) are in the Treeview. The rest are added
+    a chunk at a time from root.after callbacks, so adding or re-sorting
+    thousands of games keeps the window responsive.
+    """
+
+    def __init__(self, parent, root):
+        self.root = root
+        self.games = []
+        self.shown = 0
+        self.sort_column = "time"
+        self.sort_reverse = False
+        self.insert_scheduled = False
+
+        style = ttk.Style(parent)
+        style.configure("Results.Treeview", background="#16213e", fieldbackground="#16213e",
+                        foreground="#eee2dc", font=("Helvetica", 11), rowheight=26)
+        style.configure("Results.Treeview.Heading", font=("Helvetica", 11, "bold"))
+
+        self.tree = ttk.Treeview(parent, columns=[column for column, _, _ in RESULT_COLUMNS],
+                                 show="headings", selectmode="browse", style="Results.Treeview")
+        for column, _, width in RESULT_COLUMNS:
+            self.tree.heading(column, command=lambda column=column: self.sort_by(column))
+            self.tree.column(column, width=width, anchor="w")
+        self.update_headings()
+
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+
+    def __len__(self):
+        return len(self.games)
+
+
+    def display_game(self, index):
+        """Get the game at a position in display order."""
+        return self.games[-1 - index] if self.sort_reverse else self.games[index]
+
+
+    def add_game(self, game):
+        """Add a game at its sorted position.
+
+        If that position is among the rows already shown it is inserted right
+        away; otherwise it is left for insert_pending.
+        """
+        index = bisect.bisect_right(self.games, sort_key(game, self.sort_column),
+                                    key=lambda other: sort_key(other, self.sort_column))
+        self.games.insert(index, game)
+
+        display_index = len(self.games) - 1 - index if self.sort_reverse else index
+        if display_index < self.shown:
+            self.tree.insert("", display_index, values=game_row(game))
+            self.shown += 1
+        else:
+            self.schedule_insert()
+
+
+    def schedule_insert(self):
+        """Add the next chunk of rows shortly, unless that is already scheduled."""
+        if not self.insert_scheduled:
+            self.insert_scheduled = True
+            self.root.after(RESULTS_CHUNK_MS, self.insert_pending)
+
+
+    def insert_pending(self):
+        """Add up to RESULTS_CHUNK_SIZE rows that are not shown yet, scheduling the rest."""
+        self.insert_scheduled = False
+        if not self.tree.winfo_exists():
+            return
+
+        end = min(self.shown + RESULTS_CHUNK_SIZE, len(self.games))
+        for index in range(self.shown, end):
+            self.tree.insert("", "end", values=game_row(self.display_game(index)))
+        self.shown = end
+
+        if self.shown < len(self.games):
+            self.schedule_insert()
+
+
+    def sort_by(self, column):
+        """Sort by a column, reversing the order if it is already sorted by it."""
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column, self.sort_reverse = column, False
+
+        self.games.sort(key=lambda game: sort_key(game, column))
+        self.tree.delete(*self.tree.get_children())
+        self.shown = 0
+        self.update_headings()
+        self.insert_pending()
+
+
+    def update_headings(self):
+        """Show an arrow on the heading of the sort column."""
+        for column, heading, _ in RESULT_COLUMNS:
+            arrow = (" ▼" if self.sort_reverse else " ▲") if column == self.sort_column else ""
+            self.tree.heading(column, text=heading + arrow)
@@ -1,8 +1,10 @@
 from constants import SUPPORTED_LEAGUES, PUSHOVER_USER_KEY, PUSHOVER_API_TOKEN
-from gamechecker.game_checker import game_checker
+from gamechecker.team_registry import team_registry
+from gamechecker.game_checker import build_season_index, game_checker, get_current_date
+from gamechecker.http_client import get_session
 from gui.gui_app import main as gui_main
-import argparse, os
-import requests
+from datetime import datetime, timedelta
+import argparse, os, sys
 
 
 def send_pushover_notification(message):
@@ -20,7 +22,7 @@ def send_pushover_notification(message):
             "title": "Friday Night Bytes",
         }
         
-        response = requests.post(url, data=data)
+        response = get_session().post(url, data=data)
         
         if response.status_code != 200:
             print(f"Pushover API Error (Status {response.status_code}):")
@@ -39,43 +41,93 @@ def send_pushover_notification(message):
         print(f"Error sending Pushover message: {str(e)}")
         return False
 
-def get_preferences(args=None):
-    """ Get user preferences for favorite sport and favorite teams. """
-    if not args or not args.sport:
-        return None
-        
+
+def get_league_keys(sport_arg):
+    """Get the league keys for a comma-separated list of sport numbers, or None if any is not supported."""
     supported_leagues = {
         "1": "nba",
         "2": "nfl",
         "3": "mlb",
     }
 
-    league_key = supported_leagues.get(args.sport)
-    if not league_key or league_key not in SUPPORTED_LEAGUES:
+    league_keys = []
+    for sport_number in [sport.strip() for sport in str(sport_arg).split(",") if sport.strip()]:
+        league_key = supported_leagues.get(sport_number)
+        if not league_key or league_key not in SUPPORTED_LEAGUES:
+            return None
+        if league_key not in league_keys:
+            league_keys.append(league_key)
+
+    return league_keys
+
+
+def get_preferences(args=None):
+    """ Get user preferences for favorite sport(s) and favorite teams.
+
+    --sport accepts a comma-separated list (e.g. 1,3) so teams from several
+    leagues can be checked in a single run.
+    """
+    if not args or not args.sport:
+        return None
+
+    league_keys = get_league_keys(args.sport)
+    if not league_keys:
         print(f"Sport {args.sport} is not supported.")
         return None
-    
-    team_abbreviations = [abbr.lower() for _, abbr in SUPPORTED_LEAGUES[league_key]["teams"]]
-    
-    team_arg = getattr(args, f"{league_key}_teams", None)
-    if not team_arg:
+
+    preferences = {"sport": args.sport}
+
+    for league_key in league_keys:
         league_name = SUPPORTED_LEAGUES[league_key]["name"]
-        print(f"No {league_name} teams specified. Please provide team abbreviations using --{league_key}-teams.")
+        
+        team_arg = getattr(args, f"{league_key}_teams", None)
+        if not team_arg:
+            print(f"No {league_name} teams specified. Please provide team abbreviations using --{league_key}-teams.")
+
+            return None
+            
+        favorite_teams, invalid_teams = team_registry.split_valid(
+            [abbr.strip().lower() for abbr in team_arg.split(",")], league_key
+        )
+        if invalid_teams:
+            print(f"{', '.join(invalid_teams)} {'is' if len(invalid_teams)==1 else 'are'} not valid {league_name} team abbreviation(s).")
+
+            return None
+
+        preferences[f"{league_key}_team"] = favorite_teams
+    
+    return preferences
+
+
+def get_date_range_from_args(args):
+    """Get the (start_date, end_date) to check from --days/--from/--to, or None if they are invalid.
 
+    --from defaults to today and --to defaults to --days days after --from
+    (main rejects --days together with --to).
+    Returns (None, None) when no date flag is given so the weekly default applies.
+    """
+    if args.from_date is None and args.to_date is None and args.days is None:
+        return None, None
+
+    try:
+        start_date = datetime.strptime(args.from_date, "%Y-%m-%d").date() if args.from_date else get_current_date()
+        end_date = datetime.strptime(args.to_date, "%Y-%m-%d").date() if args.to_date else None
+    except ValueError:
+        print("Dates must be in YYYY-MM-DD format (e.g. --from 2025-10-21 --to 2025-11-20).")
         return None
-        
-    favorite_teams = [abbr.strip().lower() for abbr in team_arg.split(",")]
-    invalid_teams = [team for team in favorite_teams if team not in team_abbreviations]
-    if invalid_teams:
-        league_name = SUPPORTED_LEAGUES[league_key]["name"]
-        print(f"{', '.join(invalid_teams)} {'is' if len(invalid_teams)==1 else 'are'} not valid {league_name} team abbreviation(s).")
 
+    if end_date is None:
+        days = args.days if args.days is not None else 7
+        if days < 1:
+            print("--days must be at least 1.")
+            return None
+        end_date = start_date + timedelta(days=days - 1)
+
+    if end_date < start_date:
+        print(f"--to ({end_date}) must not be before --from ({start_date}).")
         return None
-    
-    return {
-        "sport": args.sport,
-        f"{league_key}_team": favorite_teams,
-    }
+
+    return start_date, end_date
 
 
 def display_league_teams(league_key):
@@ -86,7 +138,7 @@ def display_league_teams(league_key):
     league_info = SUPPORTED_LEAGUES[league_key]
     print(f"{league_info['name']} teams:")
     
-    for name, abbr in league_info["teams"]:
+    for name, abbr in team_registry.teams(league_key):
         print(f"{name} ({abbr})")
 
 
@@ -96,14 +148,14 @@ def get_team_input_for_league(league_key):
         return []
     
     league_info = SUPPORTED_LEAGUES[league_key]
-    team_abbreviations = [abbr.lower() for _, abbr in league_info["teams"]]
     
     print("\nYou can pick multiple teams by separating abbreviations with commas (e.g., lal, bos, mia).")
     while True:
         prompt = f"Please type the abbreviation(s) of your favorite {league_info['name']} team(s): "
         favorite_teams_input = input(prompt).lower()
-        favorite_teams = [abbr.strip() for abbr in favorite_teams_input.split(",")]
-        invalid_teams = [team for team in favorite_teams if team not in team_abbreviations]
+        favorite_teams, invalid_teams = team_registry.split_valid(
+            [abbr.strip() for abbr in favorite_teams_input.split(",")], league_key
+        )
 
         if not invalid_teams:
             break
@@ -113,15 +165,41 @@ def get_team_input_for_league(league_key):
     return favorite_teams
 
 
+def build_indexes(league_arg):
+    """Build the season index of each league in a comma-separated list."""
+    league_keys = [league.strip().lower() for league in str(league_arg or "").split(",") if league.strip()]
+    invalid_leagues = [league for league in league_keys if league not in SUPPORTED_LEAGUES]
+
+    if not league_keys or invalid_leagues:
+        print("build-index needs --league with one or more of: " + ", ".join(SUPPORTED_LEAGUES))
+        print("Example: python main.py build-index --league nba")
+        return False
+
+    return all([build_season_index(league_key) is not None for league_key in league_keys])
+
+
 def main(argv=None):
     parser = argparse.ArgumentParser(description="Friday Night Bytes CLI")
-    parser.add_argument("--sport", "-s", help="Favorite sport number (i.e. 1 for NBA, 2 for NFL, 3 for MLB)")
+    parser.add_argument("command", nargs="?", choices=["build-index"], help="build-index: save every game of a league's season for offline lookups")
+    parser.add_argument("--league", help="League(s) for build-index, comma-separated (i.e. nba or nba,nfl)")
+    parser.add_argument("--sport", "-s", help="Favorite sport number(s), comma-separated (i.e. 1 for NBA, 2 for NFL, 3 for MLB, or 1,3)")
     parser.add_argument("--nba-teams", help="Comma-separated NBA team abbreviations (i.e. lal,bos,mia)")
     parser.add_argument("--nfl-teams", help="Comma-separated NFL team abbreviations (i.e. phi,kc,sf)")
     parser.add_argument("--mlb-teams", help="Comma-separated MLB team abbreviations (i.e. lad, nyy, bos)")
+    parser.add_argument("--from", dest="from_date", help="First date to check (YYYY-MM-DD, default today)")
+    # --to sets the last date directly, so it cannot be combined with --days
+    date_span = parser.add_mutually_exclusive_group()
+    date_span.add_argument("--days", type=int, help="Number of days to check, starting today or at --from (default 7)")
+    date_span.add_argument("--to", dest="to_date", help="Last date to check (YYYY-MM-DD), e.g. the end of the season")
+    parser.add_argument("--changes-only", action="store_true", help="Only send games that changed since the last --changes-only run")
     parser.add_argument("--gui", action="store_true", help="Launch the GUI version")
     args = parser.parse_args(argv)
 
+    if args.command == "build-index":
+        if not build_indexes(args.league):
+            sys.exit(1)
+        return
+
     if args.gui:
         try:
             gui_main()
@@ -134,15 +212,24 @@ def main(argv=None):
     using_cli = args.sport or args.nba_teams or args.nfl_teams or args.mlb_teams
     
     if using_cli:
-        team_flags_provided = sum([bool(args.nba_teams), bool(args.nfl_teams), bool(args.mlb_teams)])
-        if team_flags_provided > 1:
-            print("Error: You can only specify teams for one sport at a time.")
-            print("Please choose either --nba-teams, --nfl-teams, or --mlb-teams, but not multiple.")
-            print("\nUsage: python main.py --sport <sport_number> --<league>-teams <team_abbreviations>")
+        selected_leagues = get_league_keys(args.sport) if args.sport else None
+        unselected_teams = [
+            league_key for league_key in SUPPORTED_LEAGUES
+            if selected_leagues and getattr(args, f"{league_key}_teams") and league_key not in selected_leagues
+        ]
+        if unselected_teams:
+            flags = ", ".join(f"--{league_key}-teams" for league_key in unselected_teams)
+            print(f"Error: {flags} provided without selecting that sport with --sport.")
+            print("Please list every sport you are providing teams for (e.g. --sport 1,3).")
+            print("\nUsage: python main.py --sport <sport_number(s)> --<league>-teams <team_abbreviations>")
             print("Example: python main.py --sport 1 --nba-teams lal,bos")
-            print("Example: python main.py --sport 3 --mlb-teams lad,nyy")
+            print("Example: python main.py --sport 1,3 --nba-teams lal --mlb-teams lad")
             return
-        
+
+        date_range = get_date_range_from_args(args)
+        if date_range is None:
+            return
+
         preferences = get_preferences(args)
         if preferences:
             print("Welcome to Friday Night Bytes!")
@@ -151,13 +238,18 @@ def main(argv=None):
             if "nba_team" in preferences and "lal" in preferences["nba_team"]:
                 print("\nBleed purple and gold 💜💛! Laker Nation, stand up!")
             
-            result = game_checker(preferences)
-            send_pushover_notification(str(result))
+            start_date, end_date = date_range
+            result = game_checker(preferences, changes_only=args.changes_only, start_date=start_date, end_date=end_date)
+            if result is None:
+                print("Nothing changed since the last run, so no Pushover notification was sent.")
+            else:
+                send_pushover_notification(str(result))
         else:
             print("When using CLI mode, both --sport and team flags are required.")
             print("Usage: python main.py --sport <sport_number> --<league>-teams <team_abbreviations>")
             print("Example: python main.py --sport 1 --nba-teams lal,bos")
             print("Example: python main.py --sport 3 --mlb-teams lad,nyy")
+            print("Example: python main.py --sport 1,2 --nba-teams lal --nfl-teams kc")
             print("\nSupported sports:")
             for i, (league_key, league_info) in enumerate(SUPPORTED_LEAGUES.items(), 1):
                 print(f"  {i} - {league_info['name']}")
@@ -0,0 +1,203 @@
+from gamechecker.async_game_checker import collect_games_async, game_checker_async
+from gamechecker.schedule_cache import ScheduleCache
+from gamechecker import game_checker, async_game_checker
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import date
+from unittest import mock
+import threading
+import asyncio
+import json
+import pytest
+
+
+def make_event(event_date, home_abbr, away_abbr):
+    """Build a minimal ESPN schedule event."""
+    return {
+        "date": event_date,
+        "competitions": [{
+            "competitors": [
+                {"homeAway": "home", "team": {"abbreviation": home_abbr}},
+                {"homeAway": "away", "team": {"abbreviation": away_abbr}},
+            ]
+        }]
+    }
+
+
+SCHEDULES = {
+    "/basketball/nba/teams/lal/schedule": {"events": [
+        make_event("2025-10-21T02:00Z", "LAL", "GS"),
+        make_event("2025-10-24T02:30Z", "SAC", "LAL"),
+    ]},
+    "/basketball/nba/teams/bos/schedule": {"events": [
+        make_event("2025-10-22T23:30Z", "BOS", "PHI"),
+    ]},
+    "/football/nfl/teams/kc/schedule": {"events": [
+        make_event("2025-10-26T17:00Z", "KC", "WSH"),
+    ]},
+    "/basketball/nba/scoreboard": {"events": [
+        make_event("2025-10-21T02:00Z", "LAL", "GS"),
+        make_event("2025-10-22T23:30Z", "BOS", "PHI"),
+        make_event("2025-10-23T00:00Z", "MIA", "ORL"),
+        make_event("2025-10-24T02:30Z", "SAC", "LAL"),
+    ]},
+}
+
+
+class StandInESPNHandler(BaseHTTPRequestHandler):
+    """Serve canned schedule documents in place of site.api.espn.com."""
+
+    requests_seen = []
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        self.requests_seen.append(path)
+        payload = SCHEDULES.get(path)
+
+        if payload is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def espn_server():
+    """Run the stand-in ESPN server on a free local port."""
+    StandInESPNHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInESPNHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_port}"
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def isolated_cache(tmp_path):
+    """Give both checkers an empty schedule cache."""
+    test_cache = ScheduleCache(cache_dir=str(tmp_path), ttls={"nba": 0, "nfl": 0, "mlb": 0})
+    with mock.patch.object(game_checker, "schedule_cache", test_cache), \
+         mock.patch.object(async_game_checker, "schedule_cache", test_cache):
+        yield test_cache
+
+
+PREFERENCES = {"sport": "1", "nba_team": ["lal", "bos"], "nfl_team": ["kc"]}
+
+
+@pytest.mark.integration
+@mock.patch("gamechecker.async_game_checker.get_current_date", return_value=date(2025, 10, 20))
+def test_collect_games_async_fetches_all_teams(mock_date, espn_server, isolated_cache):
+    """Test that every league and team is fetched and matched against the stand-in server.
+
+    The two NBA teams cost one scoreboard request instead of two team schedules, as in the sync path.
+    """
+    games = asyncio.run(collect_games_async(PREFERENCES, base_url=espn_server))
+
+    assert sorted(StandInESPNHandler.requests_seen) == [
+        "/basketball/nba/scoreboard",
+        "/football/nfl/teams/kc/schedule",
+    ]
+    assert [(game["team_abbr"], game["date"]) for game in games] == [
+        ("LAL", "2025-10-20"),
+        ("BOS", "2025-10-22"),
+        ("LAL", "2025-10-23"),
+        ("KC", "2025-10-26"),
+    ]
+
+
+@pytest.mark.integration
+@mock.patch("gamechecker.async_game_checker.get_current_date", return_value=date(2025, 10, 20))
+@mock.patch("gamechecker.game_checker.get_current_date", return_value=date(2025, 10, 20))
+def test_async_matches_sync_path(mock_sync_date, mock_async_date, espn_server, isolated_cache):
+    """Test that the async checker produces the same game dictionaries and summary as the sync path.
+
+    The sync path uses scoreboard mode for the two NBA teams, so this also checks both fetch modes agree.
+    """
+    async_games = asyncio.run(collect_games_async(PREFERENCES, base_url=espn_server))
+    async_summary = asyncio.run(game_checker_async(PREFERENCES, base_url=espn_server))
+
+    with mock.patch.object(game_checker, "ESPN_API_BASE_URL", espn_server):
+        sync_games = []
+        for league in ("nba", "nfl"):
+            for games_for_date in game_checker.check_games_this_week(PREFERENCES[f"{league}_team"], league).values():
+                sync_games.extend(games_for_date)
+        sync_summary = game_checker.game_checker(PREFERENCES)
+
+    assert "/basketball/nba/scoreboard" in StandInESPNHandler.requests_seen
+    assert async_games == sync_games
+    assert async_summary == sync_summary
+
+
+@pytest.mark.integration
+@mock.patch("gamechecker.game_checker.ESPN_FETCH_STRATEGY", "team")
+def test_async_matches_sync_path_for_a_date_range(espn_server, isolated_cache):
+    """Test that both entry points check the same dates and fetch mode when given a date range."""
+    start_date, end_date = date(2025, 10, 22), date(2025, 10, 26)
+
+    async_games = asyncio.run(collect_games_async(PREFERENCES, base_url=espn_server,
+                                                  start_date=start_date, end_date=end_date))
+    async_summary = asyncio.run(game_checker_async(PREFERENCES, base_url=espn_server,
+                                                   start_date=start_date, end_date=end_date))
+
+    with mock.patch.object(game_checker, "ESPN_API_BASE_URL", espn_server):
+        sync_summary = game_checker.game_checker(PREFERENCES, start_date=start_date, end_date=end_date)
+
+    assert "/basketball/nba/scoreboard" not in StandInESPNHandler.requests_seen
+    assert [(game["team_abbr"], game["date"]) for game in async_games] == [
+        ("BOS", "2025-10-22"),
+        ("LAL", "2025-10-23"),
+        ("KC", "2025-10-26"),
+    ]
+    assert async_summary == sync_summary
+
+
+@pytest.mark.integration
+@mock.patch("gamechecker.game_checker.ESPN_FETCH_STRATEGY", "team")
+def test_cache_access_runs_off_the_event_loop(espn_server, isolated_cache):
+    """Test that schedule cache and season index disk work runs in worker threads."""
+    loop_threads = set()
+    calling_threads = []
+
+    def record(method):
+        def wrapper(*args, **kwargs):
+            calling_threads.append(threading.get_ident())
+            return method(*args, **kwargs)
+        return wrapper
+
+    async def check():
+        loop_threads.add(threading.get_ident())
+        return await collect_games_async({"nfl_team": ["kc"]}, base_url=espn_server,
+                                         start_date=date(2025, 10, 20))
+
+    with mock.patch.object(isolated_cache, "load", record(isolated_cache.load)), \
+         mock.patch.object(isolated_cache, "store", record(isolated_cache.store)), \
+         mock.patch.object(async_game_checker.season_indexes, "get", record(async_game_checker.season_indexes.get)):
+        asyncio.run(check())
+
+    assert len(calling_threads) == 4
+    assert not loop_threads & set(calling_threads)
+
+
+@pytest.mark.unit
+def test_game_checker_async_rejects_reversed_dates():
+    """Test that an end date before the start date is rejected as in game_checker."""
+    with pytest.raises(ValueError):
+        asyncio.run(game_checker_async(PREFERENCES, start_date=date(2025, 10, 26), end_date=date(2025, 10, 20)))
+
+
+@pytest.mark.unit
+def test_game_checker_async_no_preferences():
+    """Test that missing preferences short-circuit without any requests."""
+    assert asyncio.run(game_checker_async(None)) == "No preferences provided."
@@ -0,0 +1,45 @@
+from gamechecker.atomic_write import atomic_write
+from gamechecker.change_detector import ChangeDetector
+from unittest import mock
+import pytest
+
+
+@pytest.mark.unit
+def test_atomic_write_replaces_file(tmp_path):
+    """Test that the file is created, directories included, and then replaced."""
+    path = tmp_path / "state" / "file.json"
+
+    with atomic_write(str(path)) as file:
+        file.write("first")
+    with atomic_write(str(path), "wb") as file:
+        file.write(b"second")
+
+    assert path.read_text() == "second"
+    assert [entry.name for entry in path.parent.iterdir()] == ["file.json"]
+
+
+@pytest.mark.unit
+def test_failed_write_keeps_old_file_and_removes_temp_file(tmp_path):
+    """Test that an error while writing leaves the old file and no temporary file behind."""
+    path = tmp_path / "file.json"
+    path.write_text("old")
+
+    with pytest.raises(ValueError):
+        with atomic_write(str(path)) as file:
+            file.write("partial")
+            raise ValueError("boom")
+
+    assert path.read_text() == "old"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["file.json"]
+
+
+@pytest.mark.unit
+def test_failed_replace_removes_temp_file(tmp_path, capsys):
+    """Test that a write that can not be moved into place is reported and cleaned up."""
+    detector = ChangeDetector(str(tmp_path / "games.json"))
+
+    with mock.patch("gamechecker.atomic_write.os.replace", side_effect=OSError("disk full")):
+        detector.save({})
+
+    assert list(tmp_path.iterdir()) == []
+    assert "Unable to save game state" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+from benchmarks.bench_end_to_end import check_thresholds, isolated_checker, load_thresholds, run_scenario
+from benchmarks.espn_payloads import SEASON_START, make_league_season
+from benchmarks.fixtures import FixtureAdapter, FixtureLibrary
+from constants import SUPPORTED_LEAGUES
+from gamechecker import game_checker
+from gamechecker.game_checker import build_schedule_url, build_scoreboard_url
+from datetime import date, timedelta
+import json
+import pytest
+
+
+@pytest.mark.unit
+def test_fixture_library_serves_schedule_and_scoreboard():
+    """Test that team schedule and league scoreboard URLs are answered from the fixtures."""
+    library = FixtureLibrary()
+
+    schedule = json.loads(library.respond(build_schedule_url('nfl', 'kc')))
+    scoreboard = json.loads(library.respond(build_scoreboard_url('nfl', date(2025, 9, 7), date(2025, 9, 13))))
+
+    assert len(schedule['events']) == 17
+    assert scoreboard['events']
+    assert all('2025-09-07' <= event['date'][:10] <= '2025-09-14' for event in scoreboard['events'])
+    assert library.respond("https://site.api.espn.com/apis/site/v2/sports/football/nfl/news") is None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("league", ["nba", "nfl", "mlb"])
+def test_every_team_is_in_the_season_index_and_scoreboard(league):
+    """Test that the synthetic season gives every team its games, with no event id shared by two games."""
+    library = FixtureLibrary()
+    team_abbrs = {abbr for _, abbr in SUPPORTED_LEAGUES[league]['teams']}
+    season = make_league_season(league)
+    # Scoreboards go by Eastern date, which can be the day before the UTC one
+    first_day, last_day = SEASON_START[league].date() - timedelta(days=1), season[-1][1].date()
+
+    with isolated_checker(FixtureAdapter(library)):
+        season_index = game_checker.build_season_index(league)
+    scoreboard = json.loads(library.respond(build_scoreboard_url(league, first_day, last_day)))
+    scoreboard_teams = {competitor['team']['abbreviation']
+                        for event in scoreboard['events'] for competitor in event['competitions'][0]['competitors']}
+
+    assert len({event_id for event_id, _, _, _ in season}) == len(season)
+    assert set(season_index.teams()) == team_abbrs
+    assert len(season_index.events) == len(season)
+    assert scoreboard_teams == team_abbrs
+    assert len(scoreboard['events']) == len(season)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("league", ["nba", "nfl", "mlb"])
+@pytest.mark.parametrize("team_count", ["1", "all"])
+def test_request_counts_within_thresholds(league, team_count):
+    """Test that game_checker sends no more requests than the benchmark thresholds allow."""
+    result = run_scenario(FixtureLibrary(), league, team_count, repeat=1)
+    limits = load_thresholds()[league][team_count]
+
+    assert result['games'] > 0
+    assert result['requests'] <= limits['max_requests']
+    assert set(result['stages']) == {'fetch', 'parse', 'filter', 'format', 'render'}
+
+
+@pytest.mark.unit
+def test_check_thresholds_reports_regressions():
+    """Test that every exceeded threshold is reported."""
+    thresholds = {'nba': {'5': {'max_ms': 50, 'max_requests': 1, 'max_peak_kib': 1024}}}
+
+    assert check_thresholds('nba', '5', {'ms': 10, 'requests': 1, 'peak_kib': 512}, thresholds) == []
+    assert check_thresholds('nba', '5', {'ms': 80, 'requests': 5, 'peak_kib': 512}, thresholds) == [
+        "NBA 5 team(s): ms 80.0 > 50",
+        "NBA 5 team(s): requests 5.0 > 1",
+    ]
+    assert check_thresholds('mlb', '1', {'ms': 1e6, 'requests': 99, 'peak_kib': 1e6}, thresholds) == []
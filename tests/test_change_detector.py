@@ -0,0 +1,158 @@
+from gamechecker.change_detector import ChangeDetector, build_changes_summary, diff_games, game_key, normalize_game
+from gamechecker import game_checker
+from datetime import date, timedelta
+from unittest import mock
+import pytest
+
+
+TARGET_DATES = [date(2025, 10, 20) + timedelta(days=day_offset) for day_offset in range(7)]
+CHECKED = {("nfl", "KC"), ("nba", "LAL")}
+
+
+def make_game_info(league, team, team_abbr, opponent, event_id, game_date, game_datetime, status="STATUS_SCHEDULED"):
+    """Build a game information dictionary like build_team_games does."""
+    return {
+        'league': league,
+        'team': team,
+        'team_abbr': team_abbr,
+        'opponent': opponent,
+        'opponent_abbr': opponent[:3].upper(),
+        'is_home': True,
+        'date': game_date,
+        'datetime': game_datetime,
+        'event_id': event_id,
+        'status': status,
+    }
+
+
+CHIEFS = make_game_info('nfl', 'Kansas City Chiefs', 'KC', 'Washington Commanders', '401', '2025-10-26', '2025-10-26T17:00Z')
+LAKERS = make_game_info('nba', 'Los Angeles Lakers', 'LAL', 'Golden State Warriors', '501', '2025-10-21', '2025-10-21T02:00Z')
+
+
+def as_state(*games):
+    """Key normalized games the way the change detector stores them."""
+    return {game_key(game): normalize_game(game) for game in games}
+
+
+@pytest.mark.unit
+def test_diff_finds_new_games():
+    """Test that games missing from the last run are reported as new."""
+    changes = diff_games(as_state(LAKERS), as_state(LAKERS, CHIEFS), CHECKED, TARGET_DATES)
+
+    assert [game['team_abbr'] for game in changes['new']] == ['KC']
+    assert not changes['time_changed'] and not changes['postponed'] and not changes['removed']
+
+
+@pytest.mark.unit
+def test_diff_finds_time_changes_and_postponements():
+    """Test that flexed start times and postponed games are reported against the last run."""
+    flexed = dict(CHIEFS, datetime='2025-10-27T00:20Z', date='2025-10-26')
+    postponed = dict(LAKERS, status='STATUS_POSTPONED')
+
+    changes = diff_games(as_state(CHIEFS, LAKERS), as_state(flexed, postponed), CHECKED, TARGET_DATES)
+
+    assert [(old['datetime'], new['datetime']) for old, new in changes['time_changed']] == [
+        ('2025-10-26T17:00Z', '2025-10-27T00:20Z')
+    ]
+    assert [game['team_abbr'] for game in changes['postponed']] == ['LAL']
+    assert not changes['new'] and not changes['removed']
+
+
+@pytest.mark.unit
+def test_diff_only_removes_checked_games_in_range():
+    """Test that games outside the window or from unchecked teams are not reported as removed."""
+    last_week = dict(LAKERS, event_id='499', date='2025-10-18', datetime='2025-10-18T23:00Z')
+
+    changes = diff_games(as_state(CHIEFS, LAKERS, last_week), {}, {("nfl", "KC")}, TARGET_DATES)
+
+    assert [game['team_abbr'] for game in changes['removed']] == ['KC']
+
+
+@pytest.mark.unit
+def test_unchanged_run_has_no_changes():
+    """Test that an identical run produces no changes and no summary."""
+    changes = diff_games(as_state(CHIEFS), as_state(CHIEFS), CHECKED, TARGET_DATES)
+
+    assert build_changes_summary(changes) is None
+
+
+@pytest.mark.unit
+def test_build_changes_summary():
+    """Test that each kind of change gets its own line."""
+    flexed = dict(CHIEFS, datetime='2025-10-27T00:20Z')
+    changes = {'new': [normalize_game(LAKERS)], 'time_changed': [(normalize_game(CHIEFS), normalize_game(flexed))],
+               'postponed': [], 'removed': []}
+
+    assert build_changes_summary(changes) == "\n".join([
+        "Schedule Changes:",
+        "🆕 Los Angeles Lakers vs Golden State Warriors 🏠 10/20/2025 10:00 PM EST",
+        "🕒 Kansas City Chiefs vs Washington Commanders 🏠 10/26/2025 08:20 PM EST (was 10/26/2025 01:00 PM EST)",
+    ])
+
+
+@pytest.mark.unit
+def test_detector_keeps_other_teams_between_runs(tmp_path):
+    """Test that runs for different teams share one state file without clobbering each other."""
+    detector = ChangeDetector(state_path=str(tmp_path / "state" / "last_games.json"))
+
+    assert detector.detect([CHIEFS], {("nfl", "KC")}, TARGET_DATES)['new'] == [normalize_game(CHIEFS)]
+    assert detector.detect([LAKERS], {("nba", "LAL")}, TARGET_DATES)['new'] == [normalize_game(LAKERS)]
+
+    changes = detector.detect([CHIEFS], {("nfl", "KC")}, TARGET_DATES)
+    assert not any(changes.values())
+    assert set(detector.load()) == {game_key(CHIEFS), game_key(LAKERS)}
+
+
+@pytest.mark.unit
+def test_detector_rolling_window_without_changes(tmp_path):
+    """Test that a game entering a rolling window is not reported as new when nothing changed."""
+    detector = ChangeDetector(state_path=str(tmp_path / "last_games.json"))
+    next_game = make_game_info('nfl', 'Kansas City Chiefs', 'KC', 'Denver Broncos', '402', '2025-10-27', '2025-10-28T00:15Z')
+    next_window = [target_date + timedelta(days=1) for target_date in TARGET_DATES]
+
+    detector.detect([CHIEFS], {("nfl", "KC")}, TARGET_DATES)
+    changes = detector.detect([CHIEFS, next_game], {("nfl", "KC")}, next_window)
+
+    assert not any(changes.values())
+    assert detector.load_spans() == {"nfl:KC": ["2025-10-21", "2025-10-27"]}
+    assert set(detector.load()) == {game_key(CHIEFS), game_key(next_game)}
+
+
+@pytest.mark.unit
+def test_diff_reports_new_games_inside_last_checked_dates():
+    """Test that a game added on a date the last run checked is still reported as new."""
+    added = make_game_info('nfl', 'Kansas City Chiefs', 'KC', 'Denver Broncos', '402', '2025-10-23', '2025-10-24T00:15Z')
+    later = make_game_info('nfl', 'Kansas City Chiefs', 'KC', 'Las Vegas Raiders', '403', '2025-11-02', '2025-11-02T21:25Z')
+    spans = {"nfl:KC": ["2025-10-20", "2025-10-26"]}
+
+    changes = diff_games(as_state(CHIEFS), as_state(CHIEFS, added, later), {("nfl", "KC")}, TARGET_DATES, spans)
+
+    assert [game['opponent'] for game in changes['new']] == ['Denver Broncos']
+
+
+@pytest.mark.unit
+def test_detector_ignores_corrupt_state(tmp_path):
+    """Test that an unreadable state file is treated as a first run."""
+    state_path = tmp_path / "last_games.json"
+    state_path.write_text("{not json")
+
+    assert ChangeDetector(state_path=str(state_path)).load() == {}
+
+
+@pytest.mark.unit
+def test_game_checker_changes_only(tmp_path, capsys):
+    """Test that changes-only runs return the changes once and nothing on an identical rerun."""
+    def collect_games(preferences, checked_teams=None, target_dates=None):
+        checked_teams.add(("nfl", "KC"))
+        return [CHIEFS]
+
+    detector = ChangeDetector(state_path=str(tmp_path / "last_games.json"))
+    with mock.patch.object(game_checker, "change_detector", detector), \
+         mock.patch.object(game_checker, "collect_games", side_effect=collect_games), \
+         mock.patch.object(game_checker, "get_current_date", return_value=TARGET_DATES[0]):
+        first = game_checker.game_checker({"nfl_team": ["kc"]}, changes_only=True)
+        second = game_checker.game_checker({"nfl_team": ["kc"]}, changes_only=True)
+
+    assert first.startswith("Schedule Changes:\n🆕 Kansas City Chiefs")
+    assert second is None
+    assert "No schedule changes since the last run" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+from gamechecker.date_parser import DateParser, compile_date_format
+from gamechecker.game_checker import parse_game_date, parse_game_dates
+from datetime import date
+from unittest import mock
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("date_str, league, expected", [
+    ("Wed, Oct 22, 2025", "nba", date(2025, 10, 22)),
+    ("Sun, Sep 7, 2025", "nfl", date(2025, 9, 7)),
+    ("Thursday, Mar 27", "mlb", date(2025, 3, 27)),
+    ("2025-10-22", "nba", date(2025, 10, 22)),
+    ("Wednesday, Oct 22, 2025", "nba", date(2025, 10, 22)),
+    ("October 22, 2025", "nfl", date(2025, 10, 22)),
+    ("10/22/2025", "mlb", date(2025, 10, 22)),
+    ("wed,  OCT 22, 2025", "nba", date(2025, 10, 22)),
+])
+def test_parse_game_date_formats(date_str, league, expected):
+    """Test that every supported format parses the same way strptime would."""
+    with mock.patch("gamechecker.game_checker.get_current_date", return_value=date(2025, 10, 20)):
+        assert parse_game_date(date_str, league) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("date_str", [
+    "",
+    None,
+    "not a date",
+    "Wed, Oct 32, 2025",
+    "Wed, Oct 22, 2025 extra",
+    "Wensday, Oct 22, 2025",
+    "2025-13-01",
+])
+def test_parse_game_date_invalid(date_str):
+    """Test that unparseable strings return None."""
+    assert parse_game_date(date_str, "nba") is None
+
+
+@pytest.mark.unit
+def test_parser_tries_last_successful_format_first():
+    """Test that the format that last worked for a source is remembered and tried first."""
+    parser = DateParser()
+
+    assert parser._candidate_formats("nba")[0] == "%a, %b %d, %Y"
+    assert parser.parse("10/22/2025", "nba", 2025) == date(2025, 10, 22)
+    assert parser.last_formats["nba"] == "%m/%d/%Y"
+    assert parser._candidate_formats("nba")[:2] == ["%m/%d/%Y", "%a, %b %d, %Y"]
+    assert "nfl" not in parser.last_formats
+
+
+@pytest.mark.unit
+def test_parse_game_dates_bulk():
+    """Test that bulk parsing keeps order and parses repeated strings once."""
+    date_strs = ["Thursday, Mar 27", "2025-03-28", "Thursday, Mar 27", "bad"]
+
+    with mock.patch("gamechecker.game_checker.get_current_date", return_value=date(2025, 4, 1)):
+        assert parse_game_dates(date_strs, "mlb") == [date(2025, 3, 27), date(2025, 3, 28), date(2025, 3, 27), None]
+
+    parser = DateParser()
+    with mock.patch.object(parser, "parse", wraps=parser.parse) as mock_parse:
+        parser.parse_many(date_strs, "mlb", 2025)
+    assert mock_parse.call_count == 3
+
+
+@pytest.mark.unit
+def test_compile_date_format_matches_names_case_insensitively():
+    """Test that compiled formats accept any capitalisation and runs of whitespace like strptime."""
+    pattern = compile_date_format("%A, %b %d")
+
+    assert pattern.fullmatch("THURSDAY,   mar 27")
+    assert not pattern.fullmatch("Thu, Mar 27")
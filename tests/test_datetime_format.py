@@ -0,0 +1,70 @@
+from gamechecker.datetime_format import format_game_datetime, format_game_datetimes, get_timezone, _format_start
+from gamechecker.game_checker import build_games_summary
+from gamechecker.models import EASTERN_TZ
+from datetime import datetime, timezone
+from unittest import mock
+import pytest
+
+
+START = datetime(2025, 10, 22, 23, 30, tzinfo=timezone.utc)
+
+GAMES = [
+    {'team': 'Boston Celtics', 'opponent': 'Philadelphia 76ers', 'is_home': True, 'start': START},
+    {'team': 'Kansas City Chiefs', 'opponent': 'Washington Commanders', 'is_home': False,
+     'datetime': '2025-10-26T17:00Z'},
+    {'team': 'Los Angeles Lakers', 'opponent': 'Boston Celtics', 'is_home': False, 'start': START},
+    {'team': 'Miami Heat', 'opponent': 'Orlando Magic', 'is_home': True},
+]
+
+
+@pytest.mark.unit
+def test_format_game_datetimes_in_one_pass():
+    """Test that a whole list of games is formatted in order, with TBD for missing times."""
+    assert format_game_datetimes(GAMES) == [
+        '10/22/2025 07:30 PM EST',
+        '10/26/2025 01:00 PM EST',
+        '10/22/2025 07:30 PM EST',
+        'TBD',
+    ]
+
+
+@pytest.mark.unit
+def test_format_game_datetime_in_target_time_zone():
+    """Test that times are shown in a per-user time zone with that zone's label."""
+    assert format_game_datetime(START, 'America/Los_Angeles') == '10/22/2025 04:30 PM PDT'
+    assert format_game_datetime(START, 'UTC') == '10/22/2025 11:30 PM UTC'
+
+
+@pytest.mark.unit
+def test_format_is_memoized_per_start_and_time_zone():
+    """Test that a repeated start time is formatted only once per time zone."""
+    _format_start.cache_clear()
+
+    format_game_datetimes(GAMES)
+    format_game_datetimes(GAMES)
+    format_game_datetimes(GAMES, 'America/Chicago')
+
+    cache_info = _format_start.cache_info()
+    assert cache_info.misses == 4
+    assert cache_info.hits == 5
+
+
+@pytest.mark.unit
+def test_get_timezone_falls_back_to_eastern(capsys):
+    """Test that time zone objects are reused and unknown names fall back to Eastern time."""
+    assert get_timezone('America/Chicago') is get_timezone('America/Chicago')
+    assert get_timezone(None) is EASTERN_TZ
+    assert get_timezone('Mars/Olympus_Mons') is EASTERN_TZ
+    assert "Unknown time zone 'Mars/Olympus_Mons'" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_summary_reuses_formatted_times():
+    """Test that the summary uses times formatted for the games table instead of formatting again."""
+    displays = format_game_datetimes(GAMES[:1], 'America/Denver')
+
+    with mock.patch('gamechecker.game_checker.format_game_datetimes') as mock_format:
+        summary = build_games_summary(GAMES[:1], "This Week's Games:", displays)
+
+    mock_format.assert_not_called()
+    assert summary == "This Week's Games:\nBoston Celtics vs Philadelphia 76ers 🏠 10/22/2025 05:30 PM MDT"
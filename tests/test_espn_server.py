@@ -0,0 +1,86 @@
+from benchmarks.espn_server import scale_document, start_server
+from gamechecker import game_checker
+from gamechecker.rate_limiter import TokenBucket
+from gamechecker.schedule_cache import ScheduleCache
+from gamechecker.season_index import SeasonIndexStore
+from constants import ESPN_RETRY_ATTEMPTS
+from unittest import mock
+import contextlib
+import requests
+import json
+import pytest
+
+
+@pytest.fixture
+def stand_in(tmp_path):
+    """Start stand-in servers and point the checker at them, with an empty cache and its own rate limiter."""
+    with contextlib.ExitStack() as stack:
+        def start(**options):
+            server = start_server(**options)
+            stack.callback(server.server_close)
+            stack.callback(server.shutdown)
+            stack.enter_context(mock.patch.object(game_checker, "ESPN_API_BASE_URL", server.base_url))
+            return server
+
+        stack.enter_context(mock.patch.object(game_checker, "schedule_cache", ScheduleCache(cache_dir=str(tmp_path), ttls={"nfl": 0})))
+        stack.enter_context(mock.patch.object(game_checker, "season_indexes", SeasonIndexStore(index_dir=str(tmp_path / "index"))))
+        stack.enter_context(mock.patch.object(game_checker, "espn_rate_limiter", TokenBucket(rate=1000, capacity=1000)))
+        yield start
+
+
+@pytest.mark.unit
+def test_scale_document():
+    """Test that scaling repeats every event under a distinct id."""
+    body = json.dumps({"events": [{"id": "1", "date": "2025-10-26T17:00Z"}]}).encode()
+
+    events = json.loads(scale_document(body, 3))["events"]
+
+    assert [event["id"] for event in events] == ["1", "1-1", "1-2"]
+    assert {event["date"] for event in events} == {"2025-10-26T17:00Z"}
+    assert scale_document(body, 1) is body
+
+
+@pytest.mark.integration
+def test_replays_schedule_and_revalidates(stand_in):
+    """Test that schedules are replayed and a stale cache entry is revalidated with a 304."""
+    server = stand_in()
+
+    first = game_checker.get_schedule_from_espn('nfl', 'kc')
+    second = game_checker.get_schedule_from_espn('nfl', 'kc')
+
+    assert len(first) == 17
+    assert second == first
+    assert server.stats["ok"] == 1
+    assert server.stats["not_modified"] == 1
+    assert requests.get(f"{server.base_url}/__stats").json()["requests"] == 2
+
+
+@pytest.mark.integration
+def test_scaled_payload_finds_same_games(stand_in):
+    """Test that a scaled payload is decoded without changing the games found."""
+    stand_in(scale=4)
+
+    schedule = game_checker.get_schedule_from_espn('nfl', 'kc')
+
+    assert len(schedule) == 68
+    assert len({game.eastern_date for game in schedule}) == 17
+
+
+@pytest.mark.integration
+def test_injected_403_is_not_retried(stand_in):
+    """Test that a 403 from the server fails the team without any retries."""
+    server = stand_in(forbid_rate=1.0)
+
+    assert game_checker.get_schedule_from_espn('nfl', 'kc') == []
+    assert server.stats["forbidden"] == 1
+
+
+@pytest.mark.integration
+@mock.patch.dict("gamechecker.retry.retry_stats", {"retries": 0, "give_ups": 0})
+def test_injected_429_is_retried(stand_in):
+    """Test that 429 responses are retried, honoring Retry-After, until the attempts run out."""
+    server = stand_in(throttle_rate=1.0, retry_after=0)
+
+    assert game_checker.get_schedule_from_espn('nfl', 'kc') == []
+    assert server.stats["throttled"] == ESPN_RETRY_ATTEMPTS
+    assert game_checker.get_retry_stats() == {"retries": ESPN_RETRY_ATTEMPTS - 1, "give_ups": 1}
@@ -1,5 +1,24 @@
-from gamechecker.game_checker import display_games
-from datetime import date
+from gamechecker.game_checker import (
+    display_games,
+    check_games_for_dates,
+    check_games_this_week,
+    choose_fetch_strategy,
+    collect_games,
+    fetch_schedules_for_dates,
+    fetch_schedule_payload,
+    fetch_team_schedules,
+    format_check_event,
+    format_game_datetime,
+    iter_games,
+)
+from gamechecker.models import make_game
+from gamechecker.retry import RequestCancelled, RetryPolicy, call_with_retry
+from datetime import date, datetime, timezone
+from unittest import mock
+import functools
+import threading
+import requests
+import time
 import pytest
 
 
@@ -80,4 +99,283 @@ def test_game_display_with_mlb_game():
 def test_game_display_no_games():
     """Test the game display functionality with no games."""
     print("=" * 50)
-    display_games([])
\ No newline at end of file
+    display_games([])
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.get_current_date')
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+def test_check_games_this_week_fetches_each_team_once(mock_schedule, mock_current_date):
+    """Test that a weekly check downloads each team's schedule once and buckets games by Eastern date."""
+    mock_current_date.return_value = date(2025, 10, 20)
+    mock_schedule.return_value = [
+        make_game('nba', 'lal', 'BOS', True, '2025-10-21T02:00Z'),
+        make_game('nba', 'lal', 'GS', False, '2025-10-23T23:30Z'),
+        make_game('nba', 'lal', 'MIA', True, '2025-11-30T23:30Z'),
+    ]
+
+    weekly_games = check_games_this_week(['lal', 'okc'], 'nba')
+
+    assert mock_schedule.call_count == 2
+    assert list(weekly_games.keys()) == [date(2025, 10, 20), date(2025, 10, 23)]
+    assert weekly_games[date(2025, 10, 20)][0]['opponent'] == 'Boston Celtics'
+    assert weekly_games[date(2025, 10, 23)][1]['team_abbr'] == 'OKC'
+    assert weekly_games[date(2025, 10, 23)][1]['is_home'] is False
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+def test_fetch_team_schedules_keeps_input_order(mock_schedule):
+    """Test that concurrent fetches are returned in team order with errors captured per team."""
+    def fake_fetch(league, team_abbr, cancel_event=None):
+        if team_abbr == 'bos':
+            raise ValueError('boom')
+        return [{'team': team_abbr}]
+
+    mock_schedule.side_effect = fake_fetch
+
+    results = fetch_team_schedules('nba', ['lal', 'bos', 'mia'])
+
+    assert [schedule for schedule, _ in results] == [[{'team': 'lal'}], None, [{'team': 'mia'}]]
+    assert isinstance(results[1][1], ValueError)
+
+
+@pytest.mark.unit
+def test_choose_fetch_strategy():
+    """Test that scoreboard mode is only picked when it needs fewer requests than team mode."""
+    assert choose_fetch_strategy(1, 7) == 'team'
+    assert choose_fetch_strategy(2, 7) == 'scoreboard'
+    assert choose_fetch_strategy(2, 14) == 'team'
+    assert choose_fetch_strategy(30, 30) == 'scoreboard'
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+@mock.patch('gamechecker.game_checker.fetch_schedule_payload')
+def test_fetch_schedules_for_dates_scoreboard_mode(mock_payload, mock_team_schedule):
+    """Test that scoreboard mode makes one request and filters the selected teams locally."""
+    def event(event_date, home, away):
+        return {'date': event_date, 'competitions': [{'competitors': [
+            {'homeAway': 'home', 'team': {'abbreviation': home}},
+            {'homeAway': 'away', 'team': {'abbreviation': away}},
+        ]}]}
+
+    mock_payload.return_value = {'events': [
+        event('2025-10-21T23:30Z', 'LAL', 'BOS'),
+        event('2025-10-22T23:30Z', 'MIA', 'NY'),
+        event('2025-10-23T23:30Z', 'DEN', 'BOS'),
+    ]}
+    target_dates = [date(2025, 10, 20 + offset) for offset in range(7)]
+
+    results = fetch_schedules_for_dates('nba', ['lal', 'bos', 'okc'], target_dates)
+
+    assert mock_payload.call_count == 1
+    assert '/basketball/nba/scoreboard?dates=20251020-20251026' in mock_payload.call_args.args[2]
+    mock_team_schedule.assert_not_called()
+
+    lal, bos, okc = [schedule for schedule, _ in results]
+    assert lal == [make_game('nba', 'LAL', 'BOS', True, '2025-10-21T23:30Z')]
+    assert [game.opponent_abbr for game in bos] == ['LAL', 'DEN']
+    assert okc == []
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.fetch_team_schedule', return_value=[])
+@mock.patch('gamechecker.game_checker.fetch_schedule_payload', side_effect=ValueError('boom'))
+def test_fetch_schedules_for_dates_falls_back_to_team_mode(mock_payload, mock_team_schedule):
+    """Test that a failed scoreboard request falls back to per-team schedules."""
+    results = fetch_schedules_for_dates('nba', ['lal', 'bos'], [date(2025, 10, 20)])
+
+    assert results == [([], None), ([], None)]
+    assert mock_team_schedule.call_count == 2
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.get_current_date', return_value=date(2025, 10, 20))
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+def test_collect_games_merges_leagues_chronologically(mock_schedule, mock_current_date):
+    """Test that games from several leagues are merged into one chronological list."""
+    schedules = {
+        ('nba', 'lal'): [make_game('nba', 'lal', 'BOS', True, '2025-10-23T02:00Z')],
+        ('nfl', 'kc'): [make_game('nfl', 'kc', 'DEN', False, '2025-10-21T00:15Z')],
+        ('mlb', 'lad'): [make_game('mlb', 'lad', 'NYY', True, '2025-10-22T23:00Z')],
+    }
+    mock_schedule.side_effect = lambda league, team_abbr, cancel_event=None: schedules[(league, team_abbr)]
+
+    games = collect_games({'sport': '1,2,3', 'nba_team': ['lal'], 'nfl_team': ['kc'], 'mlb_team': ['lad']})
+
+    assert [game['team_abbr'] for game in games] == ['KC', 'LAD', 'LAL']
+
+
+@pytest.mark.unit
+def test_make_game_parses_once_at_ingest():
+    """Test that Game records carry an aware start time and the Eastern date."""
+    game = make_game('nba', 'lal', 'bos', True, '2025-10-22T02:30Z', '401')
+
+    assert game.start == datetime(2025, 10, 22, 2, 30, tzinfo=timezone.utc)
+    assert game.eastern_date == date(2025, 10, 21)
+    assert (game.team_abbr, game.opponent_abbr, game.location) == ('LAL', 'BOS', 'Home')
+    assert game.iso_datetime == '2025-10-22T02:30Z'
+    assert not hasattr(game, '__dict__')
+    assert make_game('nba', 'lal', 'bos', True, 'not a date') is None
+
+
+@pytest.mark.unit
+def test_format_game_datetime_accepts_records_and_strings():
+    """Test that display formatting works from a parsed start time or the raw string."""
+    start = datetime(2025, 10, 22, 23, 30, tzinfo=timezone.utc)
+
+    assert format_game_datetime(start) == '10/22/2025 07:30 PM EST'
+    assert format_game_datetime('2025-10-22T23:30Z') == '10/22/2025 07:30 PM EST'
+    assert format_game_datetime('') == 'TBD'
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+def test_iter_games_yields_each_team_as_it_finishes(mock_schedule):
+    """Test that a fast team's games are yielded while a slow team's fetch is still running."""
+    release_slow_team = threading.Event()
+
+    def fetch(league, team_abbr, cancel_event=None):
+        if team_abbr == 'bos':
+            release_slow_team.wait(5)
+            return []
+        return [make_game('nba', 'lal', 'GS', True, '2025-10-21T02:00Z', '401')]
+
+    mock_schedule.side_effect = fetch
+    target_dates = [date(2025, 10, 20 + offset) for offset in range(7)]
+
+    events = iter_games({'nba_team': ['bos', 'lal', 'abc']}, target_dates)
+
+    first, second, third = next(events), next(events), next(events)
+    assert (first.kind, first.team_abbr) == ('unknown_team', 'abc')
+    assert (second.kind, second.game['team_abbr'], second.game['date']) == ('game', 'LAL', '2025-10-20')
+    assert (third.kind, third.team_abbr, third.game_count) == ('team', 'LAL', 1)
+
+    release_slow_team.set()
+    assert [(event.kind, event.team_abbr, event.game_count) for event in events] == [('team', 'BOS', 0)]
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.fetch_team_schedule', side_effect=ValueError('boom'))
+def test_iter_games_reports_failed_teams(mock_schedule):
+    """Test that a failed fetch becomes an error event instead of stopping the search."""
+    events = list(iter_games({'nfl_team': ['kc']}, [date(2025, 10, 20)]))
+
+    assert [(event.kind, event.team_name) for event in events] == [('error', 'Kansas City Chiefs')]
+    assert str(events[0].error) == 'boom'
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+def test_iter_games_stops_when_cancelled(mock_schedule):
+    """Test that setting the cancel event ends the search without waiting for a slow fetch."""
+    release_slow_team = threading.Event()
+    cancel_event = threading.Event()
+
+    def fetch(league, team_abbr, cancel_event=None):
+        if team_abbr == 'bos':
+            release_slow_team.wait(5)
+        return []
+
+    mock_schedule.side_effect = fetch
+    events = iter_games({'nba_team': ['lal', 'bos']}, [date(2025, 10, 20)], cancel_event=cancel_event)
+
+    assert next(events).team_abbr == 'LAL'
+
+    cancel_event.set()
+    started = time.monotonic()
+    assert list(events) == []
+    assert time.monotonic() - started < 1
+
+    release_slow_team.set()
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.get_session')
+@mock.patch('gamechecker.game_checker.schedule_cache')
+@mock.patch('gamechecker.game_checker.season_indexes')
+def test_cancelled_search_makes_no_further_requests(mock_indexes, mock_cache, mock_session):
+    """Test that fetches still retrying when a search is cancelled send no more requests."""
+    mock_indexes.get.return_value = None
+    mock_cache.load.return_value = None
+    mock_cache.conditional_headers.return_value = {}
+    cancel_event = threading.Event()
+    requests_sent = []
+
+    def get(url, **kwargs):
+        requests_sent.append(url)
+        response = mock.Mock(status_code=503, ok=False, headers={})
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError('503 Error', response=response)
+        return response
+
+    mock_session.return_value.get.side_effect = get
+    fast_retries = RetryPolicy(max_attempts=100, base_delay=0.02, max_delay=0.02, deadline=60)
+
+    with mock.patch('gamechecker.game_checker.call_with_retry', functools.partial(call_with_retry, policy=fast_retries)):
+        events = iter_games({'nba_team': ['lal', 'bos']}, [date(2025, 10, 20)], cancel_event=cancel_event)
+        threading.Timer(0.2, cancel_event.set).start()
+        assert list(events) == []
+
+        sent_at_cancel = len(requests_sent)
+        time.sleep(0.3)
+
+    assert sent_at_cancel > 2
+    assert len(requests_sent) == sent_at_cancel
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.get_session')
+@mock.patch('gamechecker.game_checker.schedule_cache')
+def test_cancelled_download_stops_between_chunks(mock_cache, mock_session):
+    """Test that a body still streaming when the search is cancelled is abandoned and its response closed."""
+    mock_cache.load.return_value = None
+    mock_cache.conditional_headers.return_value = {}
+    cancel_event = threading.Event()
+    chunks_read = []
+
+    def iter_content(chunk_size):
+        for chunk in (b'{"events": [', b'{}, ', b'{}]}'):
+            chunks_read.append(chunk)
+            cancel_event.set()
+            yield chunk
+
+    response = mock_session.return_value.get.return_value
+    response.status_code = 200
+    response.iter_content.side_effect = iter_content
+
+    with pytest.raises(RequestCancelled):
+        fetch_schedule_payload('nba', 'lal', 'https://espn.example/lal', cancel_event)
+
+    assert chunks_read == [b'{"events": [']
+    assert mock_session.return_value.get.call_count == 1
+    response.close.assert_called_once()
+    mock_cache.store.assert_not_called()
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+def test_check_games_for_dates_prints_the_gui_progress_lines(mock_schedule, capsys):
+    """Test that the CLI prints each team with format_check_event, the same lines the GUI shows."""
+    def fetch(league, team_abbr, cancel_event=None):
+        if team_abbr == 'bos':
+            raise ValueError('boom')
+        return [make_game('nba', team_abbr, 'GS', True, '2025-10-21T02:00Z')]
+
+    mock_schedule.side_effect = fetch
+    target_dates = [date(2025, 10, 20), date(2025, 10, 21)]
+
+    games_found = check_games_for_dates(['mia', 'xyz', 'bos', 'lal'], 'nba', target_dates)
+    printed = capsys.readouterr().out.splitlines()
+
+    expected = [format_check_event(event) for event in iter_games({'nba_team': ['mia', 'xyz', 'bos', 'lal']}, target_dates)]
+    assert sorted(line for line in printed if line.startswith('   ')) == sorted(line for line in expected if line)
+    assert [game['team_abbr'] for game in games_found[date(2025, 10, 20)]] == ['MIA', 'LAL']
+    assert games_found[date(2025, 10, 21)] == []
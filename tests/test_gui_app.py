@@ -1,10 +1,15 @@
-from gui.gui_app import FridayNightBytesGUI
+from gui.gui_app import FridayNightBytesGUI, RESULTS_POLL_MS, SPLASH_MAX_MS, SPLASH_MIN_MS, SPLASH_POLL_MS
+from gui.gui_state import load_last_teams, save_last_teams
+from gui.logo_cache import LogoCache
+from gamechecker.models import GameCheckEvent
 from constants import SUPPORTED_LEAGUES
 from unittest.mock import Mock, patch
 import unittest
 import unittest.mock as mock
 import pytest
 import tkinter as tk
+import threading
+import tempfile
 import sys
 import os
 
@@ -30,11 +35,13 @@ class TestFridayNightBytesGUI(unittest.TestCase):
              patch('gui.gui_app.tk.Canvas'), \
              patch('gui.gui_app.ttk.Scrollbar'), \
              patch('gui.gui_app.tk.Text'), \
-             patch('gui.gui_app.Image'), \
-             patch('gui.gui_app.ImageTk'), \
              patch.object(FridayNightBytesGUI, 'show_splash_screen'):
             self.gui = FridayNightBytesGUI()
 
+        state_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(state_dir.cleanup)
+        self.gui.state_path = os.path.join(state_dir.name, "gui_state.json")
+
     @pytest.mark.unit
     def test_init(self):
         """Test GUI initialization."""
@@ -68,25 +75,106 @@ class TestFridayNightBytesGUI(unittest.TestCase):
         mock_widget2.destroy.assert_called_once()
 
     @pytest.mark.unit
+    @patch('gui.gui_app.threading.Thread')
     @patch('gui.gui_app.tk.Frame')
     @patch('gui.gui_app.tk.Label')
-    @patch('os.path.exists')
-    def test_show_splash_screen_with_logo(self, mock_exists, mock_label, mock_frame):
-        """Test splash screen display with logo."""
-        mock_exists.return_value = True
-        
-        with patch('gui.gui_app.Image.open') as mock_image, \
-             patch('gui.gui_app.ImageTk.PhotoImage') as mock_photo:
-            
-            mock_img = Mock()
-            mock_image.return_value = mock_img
-            mock_img.resize.return_value = mock_img
-            
+    def test_show_splash_screen_with_logo(self, mock_label, mock_frame, mock_thread):
+        """Test splash screen display with logo, starting warm-up instead of a fixed wait."""
+        with tempfile.TemporaryDirectory() as cache_dir, \
+             patch('gui.logo_cache.Image.open') as mock_image, \
+             patch('gui.logo_cache.ImageTk.PhotoImage') as mock_photo:
+            self.gui.logo_cache = LogoCache(cache_dir=cache_dir, atlas_dir=cache_dir)
+            mock_img = mock_image.return_value.__enter__.return_value
+
             self.gui.show_splash_screen()
-            
-            mock_image.assert_called()
-            mock_img.resize.assert_called()
-            mock_photo.assert_called()
+
+            mock_img.resize.assert_called_with((500, 500), mock.ANY)
+            self.assertEqual(mock_label.call_args.kwargs["image"], mock_photo.return_value)
+
+        targets = [call.kwargs["target"] for call in mock_thread.call_args_list]
+        self.assertEqual(targets, [self.gui.warm_up, self.gui.prefetch_last_teams])
+        self.assertEqual(mock_thread.return_value.start.call_count, 2)
+        self.mock_root.after.assert_called_with(SPLASH_POLL_MS, self.gui.poll_splash)
+
+    @pytest.mark.unit
+    def test_poll_splash_waits_for_minimum_time(self):
+        """Test that the splash stays up for the minimum time even when warm-up is done."""
+        self.gui.warmup_done = threading.Event()
+        self.gui.warmup_done.set()
+
+        with patch('gui.gui_app.time.monotonic', return_value=100.0), \
+             patch.object(self.gui, 'show_sport_selection') as mock_show:
+            self.gui.splash_started = 100.0 - (SPLASH_MIN_MS - 100) / 1000
+            self.gui.poll_splash()
+            mock_show.assert_not_called()
+            self.mock_root.after.assert_called_with(SPLASH_POLL_MS, self.gui.poll_splash)
+
+            self.gui.splash_started = 100.0 - SPLASH_MIN_MS / 1000
+            self.gui.poll_splash()
+            mock_show.assert_called_once()
+
+    @pytest.mark.unit
+    def test_poll_splash_waits_for_warm_up_until_maximum_time(self):
+        """Test that the splash waits for warm-up, but no longer than the maximum time."""
+        self.gui.warmup_done = threading.Event()
+
+        with patch('gui.gui_app.time.monotonic', return_value=100.0), \
+             patch.object(self.gui, 'show_sport_selection') as mock_show:
+            self.gui.splash_started = 100.0 - (SPLASH_MAX_MS - 100) / 1000
+            self.gui.poll_splash()
+            mock_show.assert_not_called()
+
+            self.gui.splash_started = 100.0 - SPLASH_MAX_MS / 1000
+            self.gui.poll_splash()
+            mock_show.assert_called_once()
+
+    @pytest.mark.unit
+    def test_warm_up_prepares_logos_and_teams(self):
+        """Test that warm-up loads the registry, sport logos and atlases for every league, then signals done."""
+        done = threading.Event()
+
+        with patch.object(self.gui.logo_cache, 'warm_asset') as mock_asset, \
+             patch.object(self.gui.logo_cache, 'warm_league') as mock_league, \
+             patch('gui.gui_app.team_registry') as mock_registry:
+            self.gui.warm_up(done)
+
+        self.assertTrue(done.is_set())
+        mock_asset.assert_has_calls([mock.call(f"{league}-logo", 250) for league in SUPPORTED_LEAGUES])
+        mock_league.assert_has_calls([mock.call(league, 80) for league in SUPPORTED_LEAGUES])
+        mock_registry.teams.assert_has_calls([mock.call(league) for league in SUPPORTED_LEAGUES])
+
+    @pytest.mark.unit
+    def test_warm_up_signals_done_on_error(self):
+        """Test that a failed warm-up still lets the splash screen move on."""
+        done = threading.Event()
+
+        with patch.object(self.gui.logo_cache, 'warm_asset', side_effect=OSError("missing")):
+            self.gui.warm_up(done)
+
+        self.assertTrue(done.is_set())
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.fetch_league_schedules')
+    def test_prefetch_last_teams(self, mock_fetch):
+        """Test that the last search's teams are prefetched, one league at a time, ignoring errors."""
+        save_last_teams({"nba": ["lal", "bos"], "mlb": ["nyy"]}, self.gui.state_path)
+        mock_fetch.side_effect = [RuntimeError("offline"), {}]
+
+        with patch('gui.gui_app.get_week_dates', return_value=["2025-10-17"]):
+            self.gui.prefetch_last_teams()
+
+        mock_fetch.assert_has_calls([
+            mock.call(["lal", "bos"], "nba", ["2025-10-17"]),
+            mock.call(["nyy"], "mlb", ["2025-10-17"]),
+        ], any_order=True)
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.fetch_league_schedules')
+    def test_prefetch_last_teams_without_state(self, mock_fetch):
+        """Test that nothing is fetched before the first search."""
+        self.gui.prefetch_last_teams()
+
+        mock_fetch.assert_not_called()
 
     @pytest.mark.unit
     @patch('gui.gui_app.tk.Frame')
@@ -144,6 +232,105 @@ class TestFridayNightBytesGUI(unittest.TestCase):
             
             mock_show_sport.assert_called_once()
 
+    @pytest.mark.unit
+    @patch('gui.gui_app.tk.Frame')
+    @patch('gui.gui_app.tk.Label')
+    @patch('gui.gui_app.tk.Button')
+    @patch('gui.gui_app.tk.Canvas')
+    @patch('gui.gui_app.ttk.Scrollbar')
+    def test_team_buttons_scroll_their_own_screen(self, mock_scrollbar, mock_canvas, mock_button, mock_label, mock_frame):
+        """Test that every league's team buttons, the first league's included, scroll that league's canvas."""
+        mock_canvas.side_effect = lambda *args, **kwargs: Mock(**{"winfo_width.return_value": 600})
+        mock_frame.side_effect = lambda *args, **kwargs: Mock()
+        mock_button.side_effect = lambda *args, **kwargs: Mock()
+        self.gui.logo_cache = Mock()
+        self.gui.logo_cache.get.return_value = None
+
+        for league in ("nba", "nfl"):
+            self.gui.selected_sport = league
+            self.gui.show_team_selection()
+            canvas = self.gui.team_screens[league]["canvas"]
+
+            for team_btn in self.gui.team_buttons.values():
+                wheel_bindings = [call.args[1] for call in team_btn.bind.call_args_list if call.args[0] == "<MouseWheel>"]
+                self.assertEqual(len(wheel_bindings), 1)
+                canvas.yview_scroll.reset_mock()
+                wheel_bindings[0](Mock(delta=-120))
+                canvas.yview_scroll.assert_called_once_with(1, "units")
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.tk.Frame')
+    @patch('gui.gui_app.tk.Label')
+    @patch('gui.gui_app.tk.Button')
+    @patch('gui.gui_app.tk.Canvas')
+    @patch('gui.gui_app.ttk.Scrollbar')
+    def test_team_screen_is_kept_and_reused(self, mock_scrollbar, mock_canvas, mock_button, mock_label, mock_frame):
+        """Test that a league's team screen is built once, hidden when leaving and shown again without new widgets."""
+        mock_canvas.return_value.winfo_width.return_value = 600
+        mock_frame.side_effect = lambda *args, **kwargs: Mock()
+        mock_button.side_effect = lambda *args, **kwargs: Mock()
+        self.gui.logo_cache = Mock()
+        self.gui.logo_cache.get.return_value = None
+        self.gui.selected_sport = "nba"
+
+        self.gui.show_team_selection()
+        team_screen = self.gui.screens[("teams", "nba")]
+        buttons_built = mock_button.call_count
+        self.assertEqual(len(self.gui.team_buttons), len(SUPPORTED_LEAGUES["nba"]["teams"]))
+
+        self.mock_root.winfo_children.return_value = [team_screen]
+        with patch.object(self.gui, 'create_sport_button'):
+            self.gui.show_sport_selection()
+        team_screen.pack_forget.assert_called_once()
+        team_screen.destroy.assert_not_called()
+
+        self.mock_root.winfo_children.return_value = [team_screen, self.gui.screens["sports"]]
+        with patch.object(self.gui, 'create_sport_button') as mock_create_sport:
+            self.gui.show_sport_selection()
+            self.gui.select_sport("nba")
+            mock_create_sport.assert_not_called()
+
+        self.assertEqual(mock_button.call_count, buttons_built)
+        team_screen.pack.assert_called_with(expand=True, fill="both")
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.tk.Frame')
+    @patch('gui.gui_app.tk.Label')
+    @patch('gui.gui_app.tk.Button')
+    @patch('gui.gui_app.tk.Canvas')
+    @patch('gui.gui_app.ttk.Scrollbar')
+    def test_team_screen_shows_current_selection(self, mock_scrollbar, mock_canvas, mock_button, mock_label, mock_frame):
+        """Test that showing a kept team screen only redraws the buttons whose selection changed."""
+        mock_canvas.return_value.winfo_width.return_value = 600
+        mock_button.side_effect = lambda *args, **kwargs: Mock()
+        self.gui.logo_cache = Mock()
+        self.gui.logo_cache.get.return_value = None
+        self.gui.league_selections = {"nba": ["bos"]}
+        self.gui.selected_sport = "nba"
+
+        self.gui.show_team_selection()
+        button_colors = {call.kwargs.get("text"): call.kwargs.get("bg") for call in mock_button.call_args_list}
+        self.assertEqual(button_colors["Boston Celtics"], "#ac9c7c")
+        self.assertEqual(button_colors["Los Angeles Lakers"], "#ffffff")
+        for team_button in self.gui.team_buttons.values():
+            team_button.config.reset_mock()
+
+        self.gui.league_selections = {"nba": ["lal"]}
+        self.gui.show_team_selection()
+
+        changed = {team_abbr for team_abbr, team_button in self.gui.team_buttons.items() if team_button.config.called}
+        self.assertEqual(changed, {"BOS", "LAL"})
+        self.gui.team_buttons["LAL"].config.assert_called_once_with(bg="#ac9c7c")
+        self.gui.team_buttons["BOS"].config.assert_called_once_with(bg="#ffffff")
+        self.gui.continue_btn.pack.assert_called_with(side="right", padx=20)
+
+        self.gui.toggle_team("LAL")
+        self.gui.league_selections = {}
+        self.gui.show_team_selection()
+        self.gui.team_buttons["LAL"].config.assert_called_with(bg="#ffffff")
+        self.assertEqual(self.gui.team_buttons["LAL"].config.call_count, 2)
+        self.gui.continue_btn.pack_forget.assert_called()
+
     @pytest.mark.unit
     def test_toggle_team_select(self):
         """Test team selection toggle - selecting a team."""
@@ -178,27 +365,46 @@ class TestFridayNightBytesGUI(unittest.TestCase):
     @pytest.mark.unit
     @patch('gui.gui_app.tk.Frame')
     @patch('gui.gui_app.tk.Button')
-    @patch('os.path.exists')
-    def test_create_team_button_with_logo(self, mock_exists, mock_button, mock_frame):
+    def test_create_team_button_with_logo(self, mock_button, mock_frame):
         """Test team button creation with logo."""
-        mock_exists.return_value = True
         self.gui.selected_sport = "nba"
         self.gui.cols_per_row = 4
         self.gui.team_buttons = {}
         
         mock_parent = Mock()
         
-        with patch('gui.gui_app.Image.open') as mock_image, \
-             patch('gui.gui_app.ImageTk.PhotoImage') as mock_photo:
+        with tempfile.TemporaryDirectory() as cache_dir, \
+             patch('gui.logo_cache.Image.open') as mock_image, \
+             patch('gui.logo_cache.ImageTk.PhotoImage') as mock_photo:
+            self.gui.logo_cache = LogoCache(cache_dir=cache_dir, atlas_dir=cache_dir)
             
-            mock_img = Mock()
-            mock_image.return_value = mock_img
-            mock_img.resize.return_value = mock_img
+            mock_img = mock_image.return_value.__enter__.return_value
             
-            self.gui.create_team_button(mock_parent, "Test Team", "TST", 0)
+            self.gui.create_team_button(mock_parent, "Los Angeles Lakers", "LAL", 0)
             
             mock_image.assert_called()
             mock_img.resize.assert_called_with((80, 80), mock.ANY)
+            self.assertEqual(mock_button.call_args.kwargs["image"], mock_photo.return_value)
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.tk.Frame')
+    @patch('gui.gui_app.tk.Button')
+    def test_create_team_button_reuses_logo(self, mock_button, mock_frame):
+        """Test that showing a team again reuses its logo without decoding or resizing."""
+        self.gui.selected_sport = "nba"
+        self.gui.team_buttons = {}
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+             patch('gui.logo_cache.Image.open') as mock_image, \
+             patch('gui.logo_cache.ImageTk.PhotoImage') as mock_photo:
+            self.gui.logo_cache = LogoCache(cache_dir=cache_dir, atlas_dir=cache_dir)
+
+            self.gui.create_team_button(Mock(), "Los Angeles Lakers", "LAL", 0)
+            self.gui.create_team_button(Mock(), "Los Angeles Lakers", "LAL", 0)
+
+            mock_photo.assert_called_once()
+            self.assertEqual(mock_image.call_count, 1)
+            self.assertEqual(self.gui.logo_cache.stats, {"hits": 1, "misses": 1})
 
     @pytest.mark.unit
     @patch('gui.gui_app.messagebox.showwarning')
@@ -218,61 +424,213 @@ class TestFridayNightBytesGUI(unittest.TestCase):
             self.gui.show_games()
             mock_show_sport.assert_called_once()
 
+    def finish_search(self):
+        """Wait for the search worker and show everything it queued."""
+        self.gui.search_thread.join(timeout=5)
+        self.gui.poll_search_results(self.gui.search_id)
+
+    def make_game(self):
+        """Build a game record as iter_games reports it."""
+        return {
+            'league': 'nba', 'team': 'Los Angeles Lakers', 'opponent': 'Boston Celtics', 'is_home': True,
+            'date': '2025-10-22', 'datetime': '2025-10-22T23:30Z',
+        }
+
     @pytest.mark.unit
-    @patch('gui.gui_app.game_checker')
+    @patch('gui.gui_app.iter_games')
     @patch('gui.gui_app.tk.Frame')
     @patch('gui.gui_app.tk.Label')
-    def test_show_games_success(self, mock_label, mock_frame, mock_game_checker):
+    def test_show_games_success(self, mock_label, mock_frame, mock_iter_games):
         """Test successful game display."""
         self.gui.selected_teams = ["lal"]
         self.gui.selected_sport = "nba"
 
-        mock_game_checker.return_value = None
+        mock_iter_games.return_value = []
         
         with patch.object(self.gui, 'show_games_result') as mock_show_result:
             self.gui.show_games()
+            self.finish_search()
             
             expected_preferences = {
                 "sport": "1",
                 "nba_team": ["lal"]
             }
 
-            mock_game_checker.assert_called_with(expected_preferences)
+            mock_iter_games.assert_called_with(expected_preferences, cancel_event=mock.ANY)
+            mock_show_result.assert_called_once_with(searching=True)
+            self.assertEqual(load_last_teams(self.gui.state_path), {"nba": ["lal"]})
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.iter_games')
+    @patch('gui.gui_app.tk.Frame')
+    @patch('gui.gui_app.tk.Label')
+    def test_show_games_multiple_leagues(self, mock_label, mock_frame, mock_iter_games):
+        """Test that selections from several leagues are checked together."""
+        self.gui.league_selections = {"nfl": ["kc"]}
+        self.gui.selected_sport = "nba"
+        self.gui.selected_teams = ["lal"]
+        mock_iter_games.return_value = []
+
+        with patch.object(self.gui, 'show_games_result'):
+            self.gui.show_games()
+            self.finish_search()
+
+        mock_iter_games.assert_called_with({"sport": "1,2", "nba_team": ["lal"], "nfl_team": ["kc"]}, cancel_event=mock.ANY)
+        self.assertEqual(self.gui.search_total, 2)
 
     @pytest.mark.unit
-    @patch('gui.gui_app.game_checker')
+    @patch('gui.gui_app.iter_games')
     @patch('gui.gui_app.messagebox.showerror')
     @patch('gui.gui_app.tk.Frame')
     @patch('gui.gui_app.tk.Label')
-    def test_show_games_error(self, mock_label, mock_frame, mock_error, mock_game_checker):
+    def test_show_games_error(self, mock_label, mock_frame, mock_error, mock_iter_games):
         """Test game display with error."""
         self.gui.selected_teams = ["lal"]
         self.gui.selected_sport = "nba"
 
-        mock_game_checker.side_effect = Exception("Test error")
+        mock_iter_games.side_effect = Exception("Test error")
         
-        with patch.object(self.gui, 'show_team_selection') as mock_show_teams:
+        with patch.object(self.gui, 'show_games_result'), \
+             patch.object(self.gui, 'show_team_selection') as mock_show_teams:
             self.gui.show_games()
+            self.finish_search()
             
             mock_error.assert_called_with("Error", "An error occurred while fetching games: Test error")
             mock_show_teams.assert_called_once()
 
+    @pytest.mark.unit
+    @patch('gui.gui_app.iter_games')
+    def test_show_games_runs_off_the_tk_thread(self, mock_iter_games):
+        """Test that the search runs on a worker thread and results are only shown by polling."""
+        self.gui.selected_teams = ["lal"]
+        self.gui.selected_sport = "nba"
+        search_threads = []
+
+        def events(preferences, cancel_event):
+            search_threads.append(threading.current_thread())
+            yield GameCheckEvent('game', 'nba', 'LAL', 'Los Angeles Lakers', game=self.make_game())
+
+        mock_iter_games.side_effect = events
+
+        with patch.object(self.gui, 'show_games_result'):
+            self.gui.results_table = Mock()
+            self.gui.show_games()
+            self.gui.search_thread.join(timeout=5)
+
+            self.gui.results_table.add_game.assert_not_called()
+            self.mock_root.after.assert_called_with(RESULTS_POLL_MS, self.gui.poll_search_results, self.gui.search_id)
+
+            self.gui.poll_search_results(self.gui.search_id)
+
+        self.assertIsNot(search_threads[0], threading.main_thread())
+        self.gui.results_table.add_game.assert_called_once_with(self.make_game())
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.iter_games')
+    def test_show_games_renders_progressively(self, mock_iter_games):
+        """Test that games go into the results table as they arrive and failed teams are listed below it."""
+        self.gui.selected_teams = ["lal", "bos"]
+        self.gui.selected_sport = "nba"
+        self.gui.progress_label = Mock()
+        self.gui.notes_label = Mock()
+        game = self.make_game()
+
+        def events(preferences, cancel_event):
+            yield GameCheckEvent('game', 'nba', 'LAL', 'Los Angeles Lakers', game=game)
+            yield GameCheckEvent('team', 'nba', 'LAL', 'Los Angeles Lakers', game_count=1)
+            yield GameCheckEvent('error', 'nba', 'BOS', 'Boston Celtics', error=ValueError("boom"))
+
+        mock_iter_games.side_effect = events
+
+        with patch.object(self.gui, 'show_games_result'):
+            self.gui.results_table = Mock()
+            self.gui.show_games()
+            self.finish_search()
+
+        self.gui.results_table.add_game.assert_called_once_with(game)
+        self.assertEqual(self.gui.search_games, [game])
+        notes = self.gui.notes_label.config.call_args.kwargs["text"]
+        self.assertIn("Boston Celtics", notes)
+        self.assertIn("❌ Error", notes)
+        self.assertNotIn("Los Angeles Lakers", notes)
+        self.gui.progress_label.config.assert_called_with(text="Searched 2 teams")
+        self.assertIsNone(self.gui.cancel_event)
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.iter_games')
+    def test_show_games_without_games(self, mock_iter_games):
+        """Test that a search that finds nothing says so on the progress line."""
+        self.gui.selected_teams = ["lal"]
+        self.gui.selected_sport = "nba"
+        self.gui.progress_label = Mock()
+        mock_iter_games.return_value = [GameCheckEvent('team', 'nba', 'LAL', 'Los Angeles Lakers', game_count=0)]
+
+        with patch.object(self.gui, 'show_games_result'):
+            self.gui.show_games()
+            self.finish_search()
+
+        self.gui.progress_label.config.assert_called_with(text="Searched 1 team, no games scheduled")
+
+    @pytest.mark.unit
+    @patch('gui.gui_app.iter_games')
+    def test_cancel_stops_search(self, mock_iter_games):
+        """Test that Cancel stops the worker's search and discards anything it still sends."""
+        self.gui.selected_teams = ["lal", "bos"]
+        self.gui.selected_sport = "nba"
+        self.gui.progress_label = Mock()
+        self.gui.cancel_btn = Mock()
+        closed = []
+
+        def events(preferences, cancel_event):
+            try:
+                yield GameCheckEvent('team', 'nba', 'LAL', 'Los Angeles Lakers', game_count=1)
+                cancel_event.wait(5)
+                yield GameCheckEvent('team', 'nba', 'BOS', 'Boston Celtics', game_count=1)
+            finally:
+                closed.append(cancel_event.is_set())
+
+        mock_iter_games.side_effect = events
+
+        with patch.object(self.gui, 'show_games_result'):
+            self.gui.show_games()
+            search_id = self.gui.search_id
+
+            self.gui.on_cancel_clicked()
+            self.gui.search_thread.join(timeout=5)
+            self.gui.poll_search_results(search_id)
+
+        self.assertEqual(closed, [True])
+        self.assertEqual(self.gui.search_done, 0)
+        self.gui.cancel_btn.pack_forget.assert_called_once()
+        self.gui.progress_label.config.assert_called_with(text="Cancelled after 0 of 2 teams")
+
+    @pytest.mark.unit
+    def test_leaving_results_cancels_search(self):
+        """Test that leaving the results screen cancels the running search."""
+        cancel_event = threading.Event()
+        self.gui.cancel_event = cancel_event
+        search_id = self.gui.search_id
+
+        self.gui.clear_window()
+
+        self.assertTrue(cancel_event.is_set())
+        self.assertNotEqual(self.gui.search_id, search_id)
+
     @pytest.mark.unit
     @patch('gui.gui_app.tk.Frame')
     @patch('gui.gui_app.tk.Button')
     @patch('gui.gui_app.tk.Label')
-    @patch('gui.gui_app.tk.Text')
-    @patch('gui.gui_app.ttk.Scrollbar')
-    def test_show_games_result(self, mock_scrollbar, mock_text, mock_label, mock_button, mock_frame):
+    @patch('gui.gui_app.GameResultsTable')
+    def test_show_games_result(self, mock_table, mock_label, mock_button, mock_frame):
         """Test games result display."""
-        test_output = "Test game output"
-        
-        self.gui.show_games_result(test_output)
-        mock_text.assert_called()
-        
-        text_instance = mock_text.return_value
-        text_instance.insert.assert_called_with("1.0", test_output)
-        text_instance.config.assert_called_with(state="disabled")
+        self.gui.show_games_result()
+
+        mock_table.assert_called_once_with(mock_frame.return_value, self.mock_root)
+        self.assertEqual(self.gui.results_table, mock_table.return_value)
+        self.assertIsNone(self.gui.cancel_btn)
+
+        self.gui.show_games_result(searching=True)
+        self.assertEqual(self.gui.cancel_btn, mock_button.return_value)
 
     @pytest.mark.unit
     def test_run(self):
@@ -340,9 +698,10 @@ class TestFridayNightBytesGUIIntegration(unittest.TestCase):
     @patch('gui.gui_app.tk.Button')
     @patch('gui.gui_app.tk.Canvas')
     @patch('gui.gui_app.ttk.Scrollbar')
-    @patch('gui.gui_app.game_checker')
+    @patch('gui.gui_app.iter_games')
+    @patch('gui.gui_app.save_last_teams')
     @patch.object(FridayNightBytesGUI, 'show_splash_screen')
-    def test_full_workflow_integration(self, mock_splash, mock_game_checker, mock_scrollbar, mock_canvas, mock_button, mock_label, mock_frame, mock_tk):
+    def test_full_workflow_integration(self, mock_splash, mock_save, mock_iter_games, mock_scrollbar, mock_canvas, mock_button, mock_label, mock_frame, mock_tk):
         """Test complete workflow integration."""
         mock_root = Mock()
         mock_root.winfo_children.return_value = []
@@ -352,7 +711,7 @@ class TestFridayNightBytesGUIIntegration(unittest.TestCase):
         mock_root._w = "."
         mock_root.tk = Mock()
         mock_tk.return_value = mock_root
-        mock_game_checker.return_value = None
+        mock_iter_games.return_value = []
         
         mock_canvas_instance = Mock()
         mock_canvas_instance.winfo_width.return_value = 600
@@ -373,13 +732,15 @@ class TestFridayNightBytesGUIIntegration(unittest.TestCase):
         
         with patch.object(gui, 'show_games_result') as mock_result:
             gui.show_games()
+            gui.search_thread.join(timeout=5)
             
             expected_preferences = {
                 "sport": "1",
                 "nba_team": ["lal"]
             }
 
-            mock_game_checker.assert_called_with(expected_preferences)
+            mock_iter_games.assert_called_with(expected_preferences, cancel_event=mock.ANY)
+            mock_save.assert_called_once_with({"nba": ["lal"]}, gui.state_path)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,32 @@
+from gui.gui_state import load_last_teams, save_last_teams
+import json
+import pytest
+
+
+@pytest.mark.unit
+def test_save_and_load_last_teams(tmp_path):
+    """Test that the last search's teams round-trip through the state file."""
+    state_path = str(tmp_path / "state" / "gui_state.json")
+
+    save_last_teams({"nba": ["lal", "bos"], "mlb": ["nyy"]}, state_path)
+
+    assert load_last_teams(state_path) == {"nba": ["lal", "bos"], "mlb": ["nyy"]}
+
+
+@pytest.mark.unit
+def test_load_last_teams_without_state(tmp_path):
+    """Test that a missing or unreadable state file means no teams."""
+    state_path = tmp_path / "gui_state.json"
+    assert load_last_teams(str(state_path)) == {}
+
+    state_path.write_text("{not json")
+    assert load_last_teams(str(state_path)) == {}
+
+
+@pytest.mark.unit
+def test_load_last_teams_ignores_unknown_leagues(tmp_path):
+    """Test that unsupported leagues and empty or malformed team lists are dropped."""
+    state_path = tmp_path / "gui_state.json"
+    state_path.write_text(json.dumps({"teams": {"nhl": ["bos"], "nba": [], "nfl": "kc", "mlb": ["nyy"]}}))
+
+    assert load_last_teams(str(state_path)) == {"mlb": ["nyy"]}
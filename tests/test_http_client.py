@@ -0,0 +1,42 @@
+from gamechecker import http_client
+from unittest import mock
+import pytest
+
+
+@pytest.mark.unit
+def test_create_session_configures_pool_and_headers():
+    """Test that the session pools connections and negotiates gzip."""
+    session = http_client.create_session(pool_connections=2, pool_maxsize=8, connect_timeout=1, read_timeout=3)
+
+    adapter = session.get_adapter("https://site.api.espn.com")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 8
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.headers["Connection"] == "keep-alive"
+    assert session.timeout == (1, 3)
+
+
+@pytest.mark.unit
+@mock.patch("requests.Session.request")
+def test_session_applies_default_timeout(mock_request):
+    """Test that requests without a timeout get the session default."""
+    session = http_client.create_session(connect_timeout=2, read_timeout=4)
+
+    session.get("https://site.api.espn.com")
+    assert mock_request.call_args.kwargs["timeout"] == (2, 4)
+
+    session.get("https://site.api.espn.com", timeout=10)
+    assert mock_request.call_args.kwargs["timeout"] == 10
+
+
+@pytest.mark.unit
+def test_get_session_is_shared():
+    """Test that every caller receives the same pooled session."""
+    http_client.close_session()
+
+    first = http_client.get_session()
+    assert http_client.get_session() is first
+
+    http_client.close_session()
+    assert http_client.get_session() is not first
+    http_client.close_session()
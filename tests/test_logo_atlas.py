@@ -0,0 +1,82 @@
+from gui.logo_atlas import LogoAtlas, build_logo_atlas, find_logo_path
+from gui.logo_cache import LogoCache, load_thumbnail
+from constants import SUPPORTED_LEAGUES
+from PIL import Image, ImageChops
+from unittest import mock
+import json
+import pytest
+
+
+@pytest.mark.unit
+def test_build_logo_atlas(tmp_path):
+    """Test that every team's scaled logo is packed into the atlas at its manifest offset."""
+    image_path, manifest_path = build_logo_atlas('nba', 40, str(tmp_path))
+
+    with open(manifest_path) as file:
+        manifest = json.load(file)
+
+    assert manifest['size'] == 40
+    assert set(manifest['tiles']) == {abbr for _, abbr in SUPPORTED_LEAGUES['nba']['teams']}
+    assert Image.open(image_path).size == (320, 160)
+
+    with Image.open(find_logo_path('nba', 'LAL', 'Los Angeles Lakers')) as logo_img:
+        expected = logo_img.convert("RGBA").resize((40, 40), Image.Resampling.LANCZOS)
+
+    tile = LogoAtlas.load('nba', 40, str(tmp_path)).tile('lal')
+    assert ImageChops.difference(tile, expected).getbbox() is None
+
+
+@pytest.mark.unit
+def test_missing_atlas(tmp_path):
+    """Test that there is no atlas for a size that was not built."""
+    assert LogoAtlas.load('nba', 80, str(tmp_path)) is None
+
+
+@pytest.mark.unit
+def test_logo_cache_loads_league_from_one_file(tmp_path):
+    """Test that a whole team grid is cropped from a single image open."""
+    build_logo_atlas('nfl', 40, str(tmp_path / "atlas"))
+    logo_cache = LogoCache(cache_dir=str(tmp_path / "thumbs"), atlas_dir=str(tmp_path / "atlas"))
+
+    with mock.patch('gui.logo_cache.ImageTk.PhotoImage', side_effect=lambda image: image), \
+         mock.patch.object(Image, 'open', wraps=Image.open) as image_open:
+        tiles = [logo_cache.get('nfl', abbr, name, 40) for name, abbr in SUPPORTED_LEAGUES['nfl']['teams']]
+
+    assert all(tile.size == (40, 40) for tile in tiles)
+    assert image_open.call_count == 1
+
+
+@pytest.mark.unit
+def test_atlas_skips_tiles_of_changed_logos(tmp_path, capsys):
+    """Test that a logo changed since the atlas was built is loaded from its own file instead."""
+    _, manifest_path = build_logo_atlas('nba', 40, str(tmp_path / "atlas"))
+    with open(manifest_path) as file:
+        manifest = json.load(file)
+    manifest['sources']['LAL']['sha256'] = '0' * 64
+    with open(manifest_path, 'w') as file:
+        json.dump(manifest, file)
+
+    atlas = LogoAtlas.load('nba', 40, str(tmp_path / "atlas"))
+
+    assert atlas.tile('lal') is None
+    assert atlas.tile('bos') is not None
+    assert "out of date for 1 team(s)" in capsys.readouterr().out
+
+    logo_cache = LogoCache(cache_dir=str(tmp_path / "thumbs"), atlas_dir=str(tmp_path / "atlas"))
+    with mock.patch('gui.logo_cache.ImageTk.PhotoImage', side_effect=lambda image: image), \
+         mock.patch('gui.logo_cache.load_thumbnail', wraps=load_thumbnail) as thumbnail:
+        assert logo_cache.get('nba', 'lal', 'Los Angeles Lakers', 40).size == (40, 40)
+    thumbnail.assert_called_once()
+
+
+@pytest.mark.unit
+def test_atlas_without_sources_is_not_trusted(tmp_path):
+    """Test that a manifest from before source hashes were recorded yields no tiles."""
+    _, manifest_path = build_logo_atlas('mlb', 40, str(tmp_path))
+    with open(manifest_path) as file:
+        manifest = json.load(file)
+    del manifest['sources']
+    with open(manifest_path, 'w') as file:
+        json.dump(manifest, file)
+
+    assert LogoAtlas.load('mlb', 40, str(tmp_path)).tiles == {}
@@ -0,0 +1,121 @@
+from gui.logo_cache import LogoCache, load_asset, load_thumbnail, thumbnail_path
+from PIL import Image
+from unittest import mock
+import os
+import pytest
+
+
+@pytest.fixture
+def photo_image():
+    """Stand in for ImageTk.PhotoImage, which needs a Tk root."""
+    with mock.patch('gui.logo_cache.ImageTk.PhotoImage', side_effect=lambda image: object()) as mock_photo:
+        yield mock_photo
+
+
+@pytest.mark.unit
+def test_load_thumbnail_saves_and_reuses_thumbnail(tmp_path):
+    """Test that the resized logo is saved and later loaded without resizing again."""
+    thumbnail = load_thumbnail('nba', 'lal', 'Los Angeles Lakers', 80, str(tmp_path))
+
+    assert thumbnail.size == (80, 80)
+    assert os.path.exists(thumbnail_path('nba', 'lal', 80, str(tmp_path)))
+
+    with mock.patch.object(Image.Image, 'resize', side_effect=AssertionError("resized again")):
+        assert load_thumbnail('nba', 'LAL', 'Los Angeles Lakers', 80, str(tmp_path)).size == (80, 80)
+
+
+@pytest.mark.unit
+def test_load_thumbnail_refreshes_outdated_thumbnail(tmp_path):
+    """Test that a thumbnail older than its logo is rebuilt."""
+    path = thumbnail_path('nfl', 'kc', 40, str(tmp_path))
+    os.makedirs(os.path.dirname(path))
+    Image.new("RGBA", (10, 10)).save(path)
+    os.utime(path, (0, 0))
+
+    assert load_thumbnail('nfl', 'kc', 'Kansas City Chiefs', 40, str(tmp_path)).size == (40, 40)
+    assert Image.open(path).size == (40, 40)
+
+
+@pytest.mark.unit
+def test_load_thumbnail_without_logo(tmp_path):
+    """Test that a team without a logo file has no thumbnail."""
+    assert load_thumbnail('nba', 'xyz', 'Nowhere Team', 80, str(tmp_path)) is None
+
+
+@pytest.mark.unit
+def test_logo_cache_reuses_photo_images(tmp_path, photo_image):
+    """Test that a logo is decoded once per league, team and size."""
+    logo_cache = LogoCache(cache_dir=str(tmp_path))
+
+    first = logo_cache.get('nba', 'lal', 'Los Angeles Lakers', 80)
+    second = logo_cache.get('nba', 'LAL', 'Los Angeles Lakers', 80)
+    other_size = logo_cache.get('nba', 'lal', 'Los Angeles Lakers', 40)
+
+    assert first is second
+    assert other_size is not first
+    assert photo_image.call_count == 2
+    assert logo_cache.stats == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.unit
+def test_logo_cache_evicts_least_recently_used(tmp_path, photo_image):
+    """Test that the cache stays within its size, dropping the least recently used logo."""
+    logo_cache = LogoCache(max_size=2, cache_dir=str(tmp_path))
+
+    logo_cache.get('nba', 'lal', 'Los Angeles Lakers', 80)
+    logo_cache.get('nba', 'bos', 'Boston Celtics', 80)
+    logo_cache.get('nba', 'lal', 'Los Angeles Lakers', 80)
+    logo_cache.get('nba', 'gs', 'Golden State Warriors', 80)
+
+    assert list(logo_cache.images) == [('nba', 'LAL', 80), ('nba', 'GS', 80)]
+
+
+@pytest.mark.unit
+def test_logo_cache_never_evicts_pinned_logos(tmp_path, photo_image):
+    """Test that logos pinned by a kept screen stay alive however many other logos are loaded."""
+    logo_cache = LogoCache(max_size=1, cache_dir=str(tmp_path))
+
+    lal = logo_cache.get('nba', 'lal', 'Los Angeles Lakers', 80, pin=True)
+    bos = logo_cache.get('nba', 'bos', 'Boston Celtics', 80, pin=True)
+    logo_cache.get('nba', 'gs', 'Golden State Warriors', 80)
+    logo_cache.get('nba', 'mia', 'Miami Heat', 80)
+
+    assert list(logo_cache.images) == [('nba', 'LAL', 80), ('nba', 'BOS', 80), ('nba', 'MIA', 80)]
+    assert logo_cache.get('nba', 'lal', 'Los Angeles Lakers', 80) is lal
+    assert logo_cache.get('nba', 'bos', 'Boston Celtics', 80) is bos
+
+
+@pytest.mark.unit
+def test_get_asset_reuses_photo_image(tmp_path, photo_image):
+    """Test that an image from assets/ is resized, saved and reused as one PhotoImage."""
+    logo_cache = LogoCache(cache_dir=str(tmp_path))
+
+    first = logo_cache.get_asset('nba-logo', 250)
+
+    assert logo_cache.get_asset('nba-logo', 250) is first
+    assert photo_image.call_args.args[0].size == (250, 250)
+    assert os.path.exists(thumbnail_path('assets', 'nba-logo', 250, str(tmp_path)))
+    assert load_asset('nba-logo', 250, str(tmp_path)).size == (250, 250)
+
+
+@pytest.mark.unit
+def test_warm_asset_leaves_only_the_photo_image(tmp_path, photo_image):
+    """Test that a warmed asset is shown without opening any image on the Tk thread."""
+    logo_cache = LogoCache(cache_dir=str(tmp_path))
+    logo_cache.warm_asset('mlb-logo', 250)
+
+    with mock.patch.object(Image, 'open', side_effect=AssertionError("opened again")):
+        logo_cache.get_asset('mlb-logo', 250)
+
+    photo_image.assert_called_once()
+    assert logo_cache.prepared == {}
+
+
+@pytest.mark.unit
+def test_warm_league_loads_atlas_once(tmp_path):
+    """Test that a warmed league's atlas is reused by the team screen."""
+    logo_cache = LogoCache(cache_dir=str(tmp_path))
+    logo_cache.warm_league('nba', 80)
+
+    with mock.patch('gui.logo_cache.LogoAtlas.load', side_effect=AssertionError("loaded again")):
+        assert logo_cache.get_atlas('nba', 80) is not None
@@ -1,3 +1,4 @@
+from datetime import date
 from unittest import mock
 import sys
 import pytest
@@ -23,6 +24,17 @@ def test_get_preferences_multiple_nba_teams():
     
     preferences = main.get_preferences(args)
     assert preferences == {"sport": "1", "nba_team": ["lal", "bos"]}
+
+
+@pytest.mark.unit
+def test_get_preferences_resolves_aliases_and_names():
+    """Unit test for ESPN aliases and full team names being resolved to ESPN abbreviations."""
+    args = mock.Mock()
+    args.sport = "1"
+    args.nba_teams = "GSW,nyk,Boston Celtics"
+    
+    preferences = main.get_preferences(args)
+    assert preferences == {"sport": "1", "nba_team": ["gs", "ny", "bos"]}
     
 
 @pytest.mark.unit
@@ -172,15 +184,72 @@ def test_main_cli_one_invalid_team(capsys):
 
 
 @pytest.mark.unit
-def test_main_cli_multiple_sports(capsys):
-    """Test that multiple sport team flags are rejected."""
+def test_main_cli_teams_for_unselected_sport(capsys):
+    """Test that team flags for a sport missing from --sport are rejected."""
     test_args = ["--sport", "1", "--nba-teams", "lal", "--mlb-teams", "lad"]
     
     main.main(test_args)
     out = capsys.readouterr().out
     
-    assert "Error: You can only specify teams for one sport at a time." in out
-    assert "Please choose either --nba-teams, --nfl-teams, or --mlb-teams, but not multiple." in out
+    assert "Error: --mlb-teams provided without selecting that sport with --sport." in out
+    assert "Please list every sport you are providing teams for (e.g. --sport 1,3)." in out
+
+
+@pytest.mark.unit
+@mock.patch('main.send_pushover_notification')
+@mock.patch('main.game_checker')
+def test_main_cli_multiple_sports(mock_game_checker, mock_pushover, capsys):
+    """Test that teams from several leagues are checked in one run with one notification."""
+    test_args = ["--sport", "1,3", "--nba-teams", "lal", "--mlb-teams", "lad,nyy"]
+    
+    main.main(test_args)
+    out = capsys.readouterr().out
+    
+    assert "Welcome to Friday Night Bytes!" in out
+    mock_game_checker.assert_called_once_with(
+        {"sport": "1,3", "nba_team": ["lal"], "mlb_team": ["lad", "nyy"]},
+        changes_only=False, start_date=None, end_date=None
+    )
+    mock_pushover.assert_called_once()
+
+
+@pytest.mark.unit
+@mock.patch('main.send_pushover_notification')
+@mock.patch('main.game_checker', return_value=None)
+def test_main_cli_changes_only_without_changes(mock_game_checker, mock_pushover, capsys):
+    """Test that --changes-only skips the notification when nothing changed."""
+    main.main(["--sport", "2", "--nfl-teams", "kc", "--changes-only"])
+    out = capsys.readouterr().out
+
+    mock_game_checker.assert_called_once_with(
+        {"sport": "2", "nfl_team": ["kc"]}, changes_only=True, start_date=None, end_date=None
+    )
+    mock_pushover.assert_not_called()
+    assert "no Pushover notification was sent" in out
+
+
+@pytest.mark.unit
+@mock.patch('main.send_pushover_notification')
+@mock.patch('main.game_checker', return_value="Schedule Changes:\n🆕 Kansas City Chiefs vs Buffalo Bills")
+def test_main_cli_changes_only_sends_changes(mock_game_checker, mock_pushover):
+    """Test that --changes-only sends just the changes summary."""
+    main.main(["--sport", "2", "--nfl-teams", "kc", "--changes-only"])
+
+    mock_pushover.assert_called_once_with("Schedule Changes:\n🆕 Kansas City Chiefs vs Buffalo Bills")
+
+
+@pytest.mark.unit
+def test_get_preferences_multiple_sports_missing_teams(capsys):
+    """Test that every selected sport needs its team flag."""
+    args = mock.Mock()
+    args.sport = "1,2"
+    args.nba_teams = "lal"
+    args.nfl_teams = None
+    
+    preferences = main.get_preferences(args)
+    captured = capsys.readouterr()
+    assert preferences is None
+    assert "No Football (NFL) teams specified" in captured.out
 
 
 @pytest.mark.unit
@@ -216,4 +285,49 @@ def test_get_preferences_unsupported_sport(capsys):
     preferences = main.get_preferences(args)
     captured = capsys.readouterr()
     assert preferences is None
-    assert "Sport 5 is not supported." in captured.out
\ No newline at end of file
+    assert "Sport 5 is not supported." in captured.out
+
+@pytest.mark.unit
+@mock.patch('main.send_pushover_notification')
+@mock.patch('main.game_checker')
+@mock.patch('main.get_current_date', return_value=date(2025, 10, 20))
+@pytest.mark.parametrize("date_args, expected_range", [
+    (["--days", "30"], (date(2025, 10, 20), date(2025, 11, 18))),
+    (["--from", "2025-11-01"], (date(2025, 11, 1), date(2025, 11, 7))),
+    (["--from", "2025-11-01", "--days", "3"], (date(2025, 11, 1), date(2025, 11, 3))),
+    (["--to", "2026-04-12"], (date(2025, 10, 20), date(2026, 4, 12))),
+])
+def test_main_cli_date_range(mock_date, mock_game_checker, mock_pushover, date_args, expected_range):
+    """Test that --days, --from and --to select the dates passed to the game checker."""
+    main.main(["--sport", "1", "--nba-teams", "lal"] + date_args)
+
+    start_date, end_date = expected_range
+    assert mock_game_checker.call_args.kwargs["start_date"] == start_date
+    assert mock_game_checker.call_args.kwargs["end_date"] == end_date
+
+
+@pytest.mark.unit
+@mock.patch('main.game_checker')
+@pytest.mark.parametrize("date_args, message", [
+    (["--from", "11/01/2025"], "Dates must be in YYYY-MM-DD format"),
+    (["--from", "2025-11-10", "--to", "2025-11-01"], "must not be before --from"),
+    (["--days", "0"], "--days must be at least 1."),
+])
+def test_main_cli_invalid_date_range(mock_game_checker, date_args, message, capsys):
+    """Test that invalid date flags are rejected before anything is fetched."""
+    main.main(["--sport", "1", "--nba-teams", "lal"] + date_args)
+
+    assert message in capsys.readouterr().out
+    mock_game_checker.assert_not_called()
+
+
+@pytest.mark.unit
+@mock.patch('main.game_checker')
+def test_main_cli_rejects_days_with_to(mock_game_checker, capsys):
+    """Test that --days cannot be combined with --to, which already sets the last date."""
+    with pytest.raises(SystemExit) as exit_info:
+        main.main(["--sport", "1", "--nba-teams", "lal", "--days", "3", "--to", "2025-11-20"])
+
+    assert exit_info.value.code == 2
+    assert "not allowed with argument" in capsys.readouterr().err
+    mock_game_checker.assert_not_called()
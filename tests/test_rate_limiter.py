@@ -0,0 +1,42 @@
+from gamechecker.rate_limiter import TokenBucket
+from unittest import mock
+import pytest
+
+
+@pytest.mark.unit
+def test_burst_is_served_without_waiting():
+    """Test that requests up to the bucket capacity go out immediately."""
+    bucket = TokenBucket(rate=1, capacity=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+
+@pytest.mark.unit
+def test_penalize_halves_rate_and_reward_recovers():
+    """Test that throttling slows the bucket down and successes speed it back up."""
+    bucket = TokenBucket(rate=8, capacity=1, min_rate=1)
+
+    bucket.penalize()
+    assert bucket.rate == 4
+    bucket.penalize()
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == 1
+
+    for _ in range(20):
+        bucket.reward()
+    assert bucket.rate == 8
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.rate_limiter.time.sleep')
+def test_acquire_sleeps_only_when_empty(mock_sleep):
+    """Test that acquire blocks only once the burst is used up."""
+    bucket = TokenBucket(rate=2, capacity=1)
+
+    bucket.acquire()
+    mock_sleep.assert_not_called()
+
+    bucket.acquire()
+    assert mock_sleep.call_args.args[0] == pytest.approx(0.5, abs=0.01)
@@ -0,0 +1,137 @@
+from gui.results_table import RESULTS_CHUNK_SIZE, GameResultsTable, game_row, sort_key
+from unittest import mock
+import pytest
+
+
+class FakeTree:
+    """Records rows the way ttk.Treeview orders them, without a Tk root."""
+
+    def __init__(self, *args, **kwargs):
+        self.rows = []
+        self.headings = {}
+
+    def insert(self, parent, index, values):
+        self.rows.insert(len(self.rows) if index == "end" else index, values)
+
+    def get_children(self):
+        return list(range(len(self.rows)))
+
+    def delete(self, *items):
+        self.rows = [row for index, row in enumerate(self.rows) if index not in items]
+
+    def heading(self, column, **options):
+        self.headings.setdefault(column, {}).update(options)
+
+    def column(self, column, **options):
+        pass
+
+    def configure(self, **options):
+        pass
+
+    def pack(self, **options):
+        pass
+
+    def yview(self, *args):
+        pass
+
+    def winfo_exists(self):
+        return True
+
+
+@pytest.fixture
+def table():
+    """A results table on a FakeTree whose root.after callbacks run only when flushed."""
+    root = mock.Mock()
+    with mock.patch('gui.results_table.ttk.Treeview', FakeTree), \
+         mock.patch('gui.results_table.ttk.Scrollbar'), \
+         mock.patch('gui.results_table.ttk.Style'):
+        yield GameResultsTable(mock.Mock(), root)
+
+
+def flush(table):
+    """Run the scheduled chunk insertions until every row is shown."""
+    while table.root.after.call_count:
+        callbacks = [call.args[1] for call in table.root.after.call_args_list]
+        table.root.after.reset_mock()
+        for callback in callbacks:
+            callback()
+
+
+def make_game(team, opponent, is_home, day, time="23:30"):
+    return {
+        'league': 'nba', 'team': team, 'opponent': opponent, 'is_home': is_home,
+        'date': f"2025-10-{day}", 'datetime': f"2025-10-{day}T{time}Z",
+    }
+
+
+LAKERS = make_game('Los Angeles Lakers', 'Golden State Warriors', False, 22)
+CELTICS = make_game('Boston Celtics', 'New York Knicks', True, 21)
+HAWKS = make_game('Atlanta Hawks', 'Toronto Raptors', True, 23, "00:00")
+
+
+@pytest.mark.unit
+def test_game_row():
+    """Test that a row shows team, opponent, home/away and the Eastern start time."""
+    assert game_row(LAKERS) == ('Los Angeles Lakers', 'Golden State Warriors', 'Away', '10/22/2025 07:30 PM EST')
+
+
+@pytest.mark.unit
+def test_sort_key_breaks_ties_by_start_time():
+    """Test that games tied on a column are ordered chronologically."""
+    games = [make_game('Atlanta Hawks', 'B', True, 23), make_game('Atlanta Hawks', 'A', True, 21)]
+
+    assert sorted(games, key=lambda game: sort_key(game, 'team')) == games[::-1]
+
+
+@pytest.mark.unit
+def test_games_are_shown_chronologically(table):
+    """Test that games arriving in any order are shown by start time."""
+    for game in (LAKERS, HAWKS, CELTICS):
+        table.add_game(game)
+    flush(table)
+
+    assert [row[0] for row in table.tree.rows] == ['Boston Celtics', 'Los Angeles Lakers', 'Atlanta Hawks']
+    assert len(table) == 3
+
+
+@pytest.mark.unit
+def test_sort_by_column_and_reverse(table):
+    """Test that clicking a heading sorts by it and clicking again reverses the order."""
+    for game in (LAKERS, HAWKS, CELTICS):
+        table.add_game(game)
+    flush(table)
+
+    table.sort_by('team')
+    assert [row[0] for row in table.tree.rows] == ['Atlanta Hawks', 'Boston Celtics', 'Los Angeles Lakers']
+    assert table.tree.headings['team']['text'] == 'Team ▲'
+    assert table.tree.headings['time']['text'] == 'Date/Time'
+
+    table.sort_by('team')
+    assert [row[0] for row in table.tree.rows] == ['Los Angeles Lakers', 'Boston Celtics', 'Atlanta Hawks']
+    assert table.tree.headings['team']['text'] == 'Team ▼'
+
+    table.add_game(make_game('Chicago Bulls', 'Miami Heat', True, 24))
+    flush(table)
+    assert [row[0] for row in table.tree.rows] == ['Los Angeles Lakers', 'Chicago Bulls', 'Boston Celtics', 'Atlanta Hawks']
+
+
+@pytest.mark.unit
+def test_large_result_sets_are_inserted_in_chunks(table):
+    """Test that rows beyond the first chunk are only added from later callbacks."""
+    games = [make_game(f"Team {index:04d}", 'Opponent', True, 22) for index in range(RESULTS_CHUNK_SIZE * 2 + 5)]
+    for game in games:
+        table.add_game(game)
+
+    assert table.tree.rows == []
+    table.root.after.assert_called_once()
+
+    table.insert_pending()
+    assert len(table.tree.rows) == RESULTS_CHUNK_SIZE
+
+    flush(table)
+    assert len(table.tree.rows) == len(games)
+
+    table.sort_by('team')
+    assert len(table.tree.rows) == RESULTS_CHUNK_SIZE
+    flush(table)
+    assert [row[0] for row in table.tree.rows] == [game['team'] for game in games]
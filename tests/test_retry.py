@@ -0,0 +1,110 @@
+from gamechecker.retry import RequestCancelled, RetryPolicy, call_with_retry, get_retry_stats, parse_retry_after
+from gamechecker.game_checker import describe_fetch_error
+from unittest import mock
+import threading
+import requests
+import time
+import pytest
+
+
+def http_error(status_code, retry_after=None):
+    """Build a requests HTTPError carrying a response with the given status."""
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+
+    return requests.exceptions.HTTPError(f"{status_code} Error", response=response)
+
+
+@pytest.mark.unit
+def test_parse_retry_after():
+    """Test that Retry-After accepts seconds and HTTP dates."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.unit
+def test_backoff_is_jittered_and_capped():
+    """Test that the exponential backoff stays within its cap."""
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoff(attempt) <= min(4, 2 ** (attempt - 1))
+
+    assert policy.backoff(5, retry_after=2.5) == 2.5
+
+
+@pytest.mark.unit
+def test_call_with_retry_recovers_from_throttling():
+    """Test that a 429 is retried after the server's Retry-After delay."""
+    func = mock.Mock(side_effect=[http_error(429, retry_after="2"), "schedule"])
+    sleep = mock.Mock()
+    before = get_retry_stats()
+
+    assert call_with_retry(func, RetryPolicy(max_attempts=3, deadline=10), sleep=sleep) == "schedule"
+
+    sleep.assert_called_once_with(2.0)
+    assert get_retry_stats()["retries"] == before["retries"] + 1
+
+
+@pytest.mark.unit
+def test_call_with_retry_does_not_retry_blocked_requests():
+    """Test that a 403 is raised immediately."""
+    func = mock.Mock(side_effect=http_error(403))
+    sleep = mock.Mock()
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        call_with_retry(func, RetryPolicy(), sleep=sleep)
+
+    assert func.call_count == 1
+    sleep.assert_not_called()
+
+
+@pytest.mark.unit
+def test_call_with_retry_gives_up_at_deadline():
+    """Test that a Retry-After past the deadline gives up instead of waiting."""
+    func = mock.Mock(side_effect=http_error(503, retry_after="30"))
+    before = get_retry_stats()
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        call_with_retry(func, RetryPolicy(max_attempts=5, deadline=10), sleep=mock.Mock())
+
+    assert func.call_count == 1
+    assert get_retry_stats()["give_ups"] == before["give_ups"] + 1
+
+
+@pytest.mark.unit
+def test_call_with_retry_stops_after_max_attempts():
+    """Test that connection errors are retried up to the attempt limit."""
+    func = mock.Mock(side_effect=requests.exceptions.ConnectionError("reset"))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        call_with_retry(func, RetryPolicy(max_attempts=3, base_delay=0.01), sleep=mock.Mock())
+
+    assert func.call_count == 3
+
+
+@pytest.mark.unit
+def test_call_with_retry_stops_waiting_when_cancelled():
+    """Test that setting the cancel event ends the wait before a retry instead of sending another request."""
+    func = mock.Mock(side_effect=http_error(503, retry_after="20"))
+    cancel_event = threading.Event()
+    threading.Timer(0.05, cancel_event.set).start()
+
+    started = time.monotonic()
+    with pytest.raises(RequestCancelled):
+        call_with_retry(func, RetryPolicy(max_attempts=5, deadline=60), cancel_event=cancel_event)
+
+    assert time.monotonic() - started < 5
+    assert func.call_count == 1
+
+
+@pytest.mark.unit
+def test_describe_fetch_error_uses_status_codes():
+    """Test that status lines are picked from the response status, not the message text."""
+    assert describe_fetch_error(http_error(429)) == " ⚠️ Rate limit"
+    assert describe_fetch_error(http_error(403)) == " 🚫 Blocked"
+    assert describe_fetch_error(requests.exceptions.ConnectionError("reset")) == " ❌ Network error: reset"
@@ -0,0 +1,163 @@
+from gamechecker.schedule_cache import ScheduleCache
+from gamechecker import game_checker
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest import mock
+import requests
+import pytest
+import json
+
+
+SCHEDULE_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams/lal/schedule"
+SCHEDULE = {"events": [{"id": "401", "date": "2025-10-22T23:30Z", "competitions": [{"competitors": []}]}]}
+
+
+def make_response(status_code, payload=None, headers=None, body=None):
+    """Build a mock requests response, with payload as its JSON body unless a raw body is given."""
+    response = mock.Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.return_value = [body if body is not None else json.dumps(payload).encode()]
+
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Error")
+    else:
+        response.raise_for_status.return_value = None
+
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Swap the shared schedule cache for one rooted in a temporary directory."""
+    test_cache = ScheduleCache(cache_dir=str(tmp_path), ttls={"nba": 3600})
+    with mock.patch.object(game_checker, "schedule_cache", test_cache):
+        yield test_cache
+
+
+@pytest.mark.unit
+def test_store_and_load_round_trip(cache):
+    """Test that stored entries are read back with their validators."""
+    cache.store("nba", "LAL", {"events": []}, {"ETag": '"abc"', "Last-Modified": "Mon, 20 Oct 2025 00:00:00 GMT"})
+
+    entry = cache.load("nba", "lal")
+    assert entry["payload"] == {"events": []}
+    assert cache.is_fresh(entry, "nba")
+    assert cache.conditional_headers(entry) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 20 Oct 2025 00:00:00 GMT",
+    }
+
+
+@pytest.mark.unit
+def test_load_missing_or_corrupt_entry(cache, tmp_path):
+    """Test that missing and corrupt entries are treated as misses."""
+    assert cache.load("nba", "lal") is None
+
+    (tmp_path / "nba").mkdir()
+    (tmp_path / "nba" / "lal.json").write_text("{not json")
+    assert cache.load("nba", "lal") is None
+
+
+@pytest.mark.unit
+@mock.patch("gamechecker.game_checker.get_session")
+def test_fetch_uses_fresh_cache_entry(mock_session, cache):
+    """Test that a second fetch within the TTL makes no request."""
+    mock_session.return_value.get.return_value = make_response(200, SCHEDULE, {"ETag": '"v1"'})
+
+    first = game_checker.fetch_schedule_payload("nba", "lal", SCHEDULE_URL)
+    second = game_checker.fetch_schedule_payload("nba", "lal", SCHEDULE_URL)
+
+    assert first == second == SCHEDULE
+    assert mock_session.return_value.get.call_count == 1
+    assert mock_session.return_value.get.call_args.kwargs["stream"] is True
+    mock_session.return_value.get.return_value.close.assert_called_once()
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] == 1
+
+
+@pytest.mark.unit
+@mock.patch("gamechecker.game_checker.get_session")
+def test_fetch_revalidates_stale_entry(mock_session, cache):
+    """Test that a stale entry is revalidated with its ETag and reused on 304."""
+    cache.ttls["nba"] = 0
+    cache.store("nba", "lal", SCHEDULE, {"ETag": '"v1"'})
+    mock_session.return_value.get.return_value = make_response(304)
+
+    payload = game_checker.fetch_schedule_payload("nba", "lal", SCHEDULE_URL)
+
+    assert payload == SCHEDULE
+    assert mock_session.return_value.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert cache.stats["revalidated"] == 1
+
+
+@pytest.mark.unit
+@mock.patch("gamechecker.game_checker.get_session")
+def test_fetch_falls_back_to_stale_entry_when_blocked(mock_session, cache):
+    """Test that a stale entry is served when ESPN blocks the request."""
+    cache.ttls["nba"] = 0
+    cache.store("nba", "lal", SCHEDULE)
+    mock_session.return_value.get.return_value = make_response(403)
+
+    assert game_checker.fetch_schedule_payload("nba", "lal", SCHEDULE_URL) == SCHEDULE
+    assert cache.stats["stale"] == 1
+
+
+@pytest.mark.unit
+@mock.patch("gamechecker.game_checker.get_session")
+def test_fetch_falls_back_to_stale_entry_on_truncated_body(mock_session, cache):
+    """Test that a body cut off mid-document is treated as a failed request, not a crash."""
+    cache.ttls["nba"] = 0
+    cache.store("nba", "lal", SCHEDULE)
+    mock_session.return_value.get.return_value = make_response(200, body=json.dumps(SCHEDULE).encode()[:40])
+
+    assert game_checker.fetch_schedule_payload("nba", "lal", SCHEDULE_URL) == SCHEDULE
+    assert cache.stats["stale"] == 1
+
+
+@pytest.mark.unit
+@mock.patch("gamechecker.game_checker.get_session")
+@mock.patch.object(game_checker.season_indexes, "get", return_value=None)
+def test_non_json_body_is_reported_not_raised(mock_index, mock_session, cache, capsys):
+    """Test that a 200 response that is not JSON (e.g. an HTML block page) gives an empty schedule."""
+    mock_session.return_value.get.return_value = make_response(200, body=b"<html>Access Denied</html>")
+
+    assert game_checker.get_schedule_from_espn("nba", "lal") == []
+    assert "Error fetching NBA schedule for lal" in capsys.readouterr().out
+    assert cache.load("nba", "lal") is None
+
+
+@pytest.mark.unit
+@mock.patch("gamechecker.game_checker.get_session")
+def test_fetch_raises_without_cache_entry(mock_session, cache):
+    """Test that errors propagate when there is nothing cached to fall back on."""
+    mock_session.return_value.get.return_value = make_response(403)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        game_checker.fetch_schedule_payload("nba", "lal", SCHEDULE_URL)
+
+
+@pytest.mark.unit
+def test_counters_are_thread_safe(cache):
+    """Test that counts from many fetch threads are never lost."""
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(lambda _: cache.count("hits"), range(5000)))
+
+    assert cache.get_stats()["hits"] == 5000
+
+
+@pytest.mark.unit
+@mock.patch("gamechecker.game_checker.get_session")
+@mock.patch("gamechecker.game_checker.get_current_date")
+def test_game_checker_reports_only_its_own_cache_stats(mock_current_date, mock_session, cache, capsys):
+    """Test that each run reports the cache hits and misses of that run, not the total since startup."""
+    mock_current_date.return_value = date(2025, 10, 20)
+    mock_session.return_value.get.return_value = make_response(200, SCHEDULE, {"ETag": '"v1"'})
+    preferences = {"sport": "1", "nba_team": ["lal"]}
+
+    with mock.patch.object(game_checker, "ESPN_FETCH_STRATEGY", "team"):
+        game_checker.game_checker(preferences)
+        assert "📦 Schedule cache: 0 hit(s), 0 revalidated, 1 miss(es), 0 stale" in capsys.readouterr().out
+
+        game_checker.game_checker(preferences)
+        assert "📦 Schedule cache: 1 hit(s), 0 revalidated, 0 miss(es), 0 stale" in capsys.readouterr().out
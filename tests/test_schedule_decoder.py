@@ -0,0 +1,51 @@
+from benchmarks.espn_payloads import make_schedule_payload
+from gamechecker.game_checker import parse_schedule_events
+from gamechecker import schedule_decoder
+import json
+import pytest
+
+
+@pytest.mark.unit
+def test_decode_keeps_only_schedule_fields():
+    """Test that the decoded document is a small subset of the response."""
+    raw = json.dumps(make_schedule_payload("nba", "lal")).encode()
+
+    decoded = schedule_decoder.decode_schedule_payload(raw)
+
+    assert set(decoded) == {"events"}
+    assert len(decoded["events"]) == 82
+    assert len(json.dumps(decoded)) < len(raw) / 5
+    assert set(decoded["events"][0]) == {"id", "date", "competitions"}
+    competitor = decoded["events"][0]["competitions"][0]["competitors"][0]
+    assert competitor == {"homeAway": "home", "team": {"abbreviation": "LAL"}}
+    assert decoded["events"][0]["competitions"][0]["status"]["type"]["name"] == "STATUS_SCHEDULED"
+
+
+@pytest.mark.unit
+def test_decoded_document_parses_like_the_full_document():
+    """Test that parsing the pruned document gives the same games as the full one."""
+    payload = make_schedule_payload("mlb", "lad")
+    decoded = schedule_decoder.decode_schedule_payload(json.dumps(payload))
+
+    assert parse_schedule_events(decoded, "lad", "mlb") == parse_schedule_events(payload, "lad", "mlb")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_stream_decoding_matches_whatever_the_chunk_size(chunk_size):
+    """Test that a body split anywhere, even inside a multi-byte character, decodes the same."""
+    payload = make_schedule_payload("nfl", "kc")
+    payload["team"] = {"displayName": "Kansas City Chiefs ☆", "events": [1, 2]}
+    raw = json.dumps(payload, ensure_ascii=False, indent=1).encode()
+
+    chunks = [raw[start:start + chunk_size] for start in range(0, len(raw), chunk_size)]
+
+    assert schedule_decoder.decode_schedule_stream(chunks) == schedule_decoder.extract_schedule_fields(payload)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("raw", [b"", b'{"events": [{}', b'{"events": [{} {}]}', b'{"code": 400,}', b'{} {}', b"[]", b'{"a": "\xff"}'])
+def test_decode_rejects_malformed_documents(raw):
+    """Test that truncated or malformed bodies raise a ValueError like json.loads."""
+    with pytest.raises(ValueError):
+        schedule_decoder.decode_schedule_payload(raw)
@@ -0,0 +1,100 @@
+from gamechecker.schedule_index import ScheduleIndex
+from gamechecker.game_checker import bucket_schedule_by_date, check_games_in_range, download_team_schedule
+from gamechecker.season_index import SeasonIndex
+from gamechecker.models import make_game
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+import pytest
+
+
+def make_season(days=180, first_day=date(2025, 10, 21)):
+    """Build a season with a game every other day, plus a doubleheader on the first day."""
+    games = []
+    for day_offset in range(0, days, 2):
+        start = datetime.combine(first_day + timedelta(days=day_offset), datetime.min.time(), timezone.utc)
+        games.append(make_game('nba', 'lal', 'BOS', True, (start + timedelta(hours=23)).strftime('%Y-%m-%dT%H:%MZ')))
+
+    games.append(make_game('nba', 'lal', 'GS', False, '2025-10-21T17:00Z'))
+    return list(reversed(games))
+
+
+@pytest.mark.unit
+def test_games_between_is_inclusive_and_sorted():
+    """Test that range queries include both ends and return games in order."""
+    index = ScheduleIndex(make_season())
+
+    games = index.games_between(date(2025, 10, 21), date(2025, 10, 25))
+
+    assert [game.eastern_date for game in games] == [
+        date(2025, 10, 21), date(2025, 10, 21), date(2025, 10, 23), date(2025, 10, 25)
+    ]
+    assert games[0].opponent_abbr == 'GS'
+    assert index.games_between(date(2025, 10, 26), date(2025, 10, 26)) == []
+    assert index.games_between(date(2026, 6, 1), date(2026, 7, 1)) == []
+
+
+@pytest.mark.unit
+def test_first_game_per_date_matches_linear_bucketing():
+    """Test that the index keeps the first game per date, like scanning every game would."""
+    season = make_season()
+    start_date, end_date = date(2025, 10, 21), date(2026, 4, 18)
+
+    games_by_date = ScheduleIndex(season).first_game_per_date(start_date, end_date)
+
+    expected = {}
+    for game in sorted(season, key=lambda game: game.start):
+        if start_date <= game.eastern_date <= end_date:
+            expected.setdefault(game.eastern_date, game)
+    assert games_by_date == expected
+    assert games_by_date[date(2025, 10, 21)].opponent_abbr == 'GS'
+
+
+@pytest.mark.unit
+def test_index_stands_in_for_the_schedule_list():
+    """Test that an index can be iterated, sliced and compared like the list of games it was built from."""
+    season = sorted(make_season(), key=lambda game: (game.eastern_date, game.start))
+    index = ScheduleIndex(reversed(season))
+
+    assert list(index) == season
+    assert index[0] is season[0] and index[-2:] == season[-2:]
+    assert index == season and index == ScheduleIndex(season)
+    assert index != season[1:] and not ScheduleIndex([])
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.fetch_schedule_payload')
+def test_season_index_and_downloads_index_each_schedule_once(mock_payload):
+    """Test that fetched schedules arrive indexed, and that a season index hands out the same index every time."""
+    mock_payload.return_value = {'events': []}
+    season_index = SeasonIndex.from_schedules('nba', [make_season()])
+
+    assert season_index.team_schedule('lal') is season_index.team_schedule('LAL')
+    assert isinstance(season_index.team_schedule('lal'), ScheduleIndex)
+    assert isinstance(download_team_schedule('nba', 'lal'), ScheduleIndex)
+
+    with mock.patch.object(ScheduleIndex, '__init__', side_effect=AssertionError("indexed again")):
+        assert len(bucket_schedule_by_date(season_index.team_schedule('lal'), [date(2025, 10, 21)])) == 1
+
+
+@pytest.mark.unit
+def test_bucket_schedule_by_date_with_gaps():
+    """Test that non-contiguous target dates only keep the dates asked for."""
+    games_by_date = bucket_schedule_by_date(make_season(), [date(2025, 10, 21), date(2025, 10, 27)])
+
+    assert list(games_by_date) == [date(2025, 10, 21), date(2025, 10, 27)]
+    assert bucket_schedule_by_date(make_season(), []) == {}
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.ESPN_FETCH_STRATEGY', 'team')
+@mock.patch('gamechecker.game_checker.fetch_team_schedule')
+def test_check_games_in_range_next_30_days(mock_schedule, capsys):
+    """Test that a 30 day range returns one entry per game day from a single schedule fetch."""
+    mock_schedule.return_value = make_season()
+
+    games_by_date = check_games_in_range(['lal'], 'nba', date(2025, 10, 21), date(2025, 11, 19))
+
+    assert mock_schedule.call_count == 1
+    assert len(games_by_date) == 15
+    assert list(games_by_date) == sorted(games_by_date)
+    assert "October 21 - November 19, 2025" in capsys.readouterr().out
@@ -0,0 +1,205 @@
+from gamechecker.season_index import SeasonIndex, SeasonIndexStore, load_season_index, save_season_index
+from gamechecker import game_checker
+from gamechecker.models import make_game
+from datetime import date
+from unittest import mock
+import main
+import pytest
+import os
+
+
+LAL_SCHEDULE = [
+    make_game('nba', 'lal', 'GS', True, '2025-10-21T02:00Z', '401', 'STATUS_SCHEDULED'),
+    make_game('nba', 'lal', 'SAC', False, '2025-10-24T02:30Z', '402', 'STATUS_SCHEDULED'),
+]
+GS_SCHEDULE = [
+    make_game('nba', 'gs', 'LAL', False, '2025-10-21T02:00Z', '401', 'STATUS_SCHEDULED'),
+    make_game('nba', 'gs', 'DEN', True, '2025-10-23T02:00Z', '403', 'STATUS_POSTPONED'),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Swap the shared season index store for one rooted in a temporary directory."""
+    test_store = SeasonIndexStore(index_dir=str(tmp_path), ttl=3600)
+    with mock.patch.object(game_checker, "season_indexes", test_store):
+        yield test_store
+
+
+@pytest.mark.unit
+def test_from_schedules_keeps_each_game_once():
+    """Test that a game in both teams' schedules is stored once, home team first."""
+    season_index = SeasonIndex.from_schedules('nba', [LAL_SCHEDULE, GS_SCHEDULE])
+
+    assert season_index.events == [
+        ['401', '2025-10-21T02:00Z', 'LAL', 'GS', 'STATUS_SCHEDULED'],
+        ['403', '2025-10-23T02:00Z', 'GS', 'DEN', 'STATUS_POSTPONED'],
+        ['402', '2025-10-24T02:30Z', 'SAC', 'LAL', 'STATUS_SCHEDULED'],
+    ]
+    assert season_index.teams() == ['DEN', 'GS', 'LAL', 'SAC']
+
+
+@pytest.mark.unit
+def test_team_schedule_matches_team_endpoint():
+    """Test that a team's schedule expanded from the index matches its own ESPN schedule."""
+    season_index = SeasonIndex.from_schedules('nba', [LAL_SCHEDULE, GS_SCHEDULE])
+
+    assert season_index.team_schedule('lal') == LAL_SCHEDULE
+    assert season_index.team_schedule('GS') == GS_SCHEDULE
+    assert season_index.team_schedule('sac')[0].opponent_abbr == 'LAL'
+    assert season_index.team_schedule('bos') == []
+
+
+@pytest.mark.unit
+def test_save_and_load_round_trip(tmp_path):
+    """Test that the gzipped index reads back the same events."""
+    season_index = SeasonIndex.from_schedules('nba', [LAL_SCHEDULE, GS_SCHEDULE])
+
+    path = save_season_index(season_index, str(tmp_path))
+    loaded = load_season_index('nba', str(tmp_path))
+
+    assert path.endswith("nba.json.gz")
+    assert loaded.events == season_index.events
+    assert loaded.built_at == season_index.built_at
+    assert load_season_index('nfl', str(tmp_path)) is None
+
+
+@pytest.mark.unit
+def test_store_ignores_expired_index(tmp_path):
+    """Test that an index past its TTL is not served."""
+    save_season_index(SeasonIndex('nba', [], built_at=1), str(tmp_path))
+
+    assert SeasonIndexStore(index_dir=str(tmp_path), ttl=3600).get('nba') is None
+    assert SeasonIndexStore(index_dir=str(tmp_path), ttl=float('inf')).get('nba') is not None
+
+
+@pytest.mark.unit
+def test_store_remembers_missing_index(tmp_path):
+    """Test that a missing index is not looked for on every fetch, only after the recheck interval."""
+    store = SeasonIndexStore(index_dir=str(tmp_path), ttl=3600, recheck_seconds=60)
+
+    with mock.patch('gamechecker.season_index.time.monotonic', return_value=100.0), \
+         mock.patch('gamechecker.season_index.os.path.getmtime', wraps=os.path.getmtime) as mock_getmtime, \
+         mock.patch('gamechecker.season_index.gzip.open') as mock_open:
+        assert store.get('nba') is None
+        assert store.get('nba') is None
+        assert mock_getmtime.call_count == 1
+        mock_open.assert_not_called()
+
+    save_season_index(SeasonIndex('nba', []), str(tmp_path))
+
+    with mock.patch('gamechecker.season_index.time.monotonic', return_value=130.0):
+        assert store.get('nba') is None
+    with mock.patch('gamechecker.season_index.time.monotonic', return_value=161.0):
+        assert store.get('nba') is not None
+
+
+@pytest.mark.unit
+def test_store_rereads_expired_index_only_when_file_changes(tmp_path):
+    """Test that an expired index file is not decompressed again until it is rewritten."""
+    save_season_index(SeasonIndex('nba', [], built_at=1), str(tmp_path))
+    store = SeasonIndexStore(index_dir=str(tmp_path), ttl=3600, recheck_seconds=0)
+
+    assert store.get('nba') is None
+    with mock.patch('gamechecker.season_index.gzip.open') as mock_open:
+        assert store.get('nba') is None
+        mock_open.assert_not_called()
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.download_team_schedule')
+def test_build_season_index(mock_download, store, capsys):
+    """Test that every team is downloaded and the deduplicated index is saved."""
+    mock_download.side_effect = lambda league, team_abbr: {'lal': LAL_SCHEDULE, 'gs': GS_SCHEDULE}.get(team_abbr, [])
+
+    season_index = game_checker.build_season_index('nba')
+
+    assert mock_download.call_count == 30
+    assert len(season_index.events) == 3
+    assert store.get('nba').events == season_index.events
+    output = capsys.readouterr().out
+    assert "No games found for ATL, BOS" in output
+    assert "Saved 3 Basketball (NBA) games" in output
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.download_team_schedule')
+def test_build_season_index_not_saved_when_event_ids_clash(mock_download, store, capsys):
+    """Test that an index missing a game, dropped for reusing another game's event id, is never saved."""
+    den_schedule = [make_game('nba', 'den', 'MIA', True, '2025-10-25T01:00Z', '402', 'STATUS_SCHEDULED')]
+    mock_download.side_effect = lambda league, team_abbr: {'lal': LAL_SCHEDULE, 'den': den_schedule}.get(team_abbr, [])
+
+    assert game_checker.build_season_index('nba') is None
+    assert store.get('nba') is None
+    output = capsys.readouterr().out
+    assert "event id 402 is already used by another game" in output
+    assert "the Basketball (NBA) index was not saved" in output
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.download_team_schedule')
+def test_build_season_index_reports_unwritable_index(mock_download, store, capsys):
+    """Test that a failed write is reported, leaves no temporary file and serves no index."""
+    mock_download.side_effect = lambda league, team_abbr: {'lal': LAL_SCHEDULE, 'gs': GS_SCHEDULE}.get(team_abbr, [])
+
+    with mock.patch('gamechecker.atomic_write.os.replace', side_effect=OSError('disk full')):
+        assert game_checker.build_season_index('nba') is None
+
+    assert os.listdir(store.index_dir) == []
+    assert store.get('nba') is None
+    output = capsys.readouterr().out
+    assert "Unable to save season index" in output
+    assert "The Basketball (NBA) index could not be saved" in output
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.download_team_schedule')
+def test_build_season_index_not_saved_when_a_team_fails(mock_download, store, capsys):
+    """Test that a partial season is never saved."""
+    mock_download.side_effect = lambda league, team_abbr: (_ for _ in ()).throw(ValueError('boom')) if team_abbr == 'kc' else []
+
+    assert game_checker.build_season_index('nfl') is None
+    assert store.get('nfl') is None
+    assert "the Football (NFL) index was not saved" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+@mock.patch('gamechecker.game_checker.fetch_schedule_payload')
+def test_queries_use_index_without_requests(mock_payload, store):
+    """Test that a fresh index answers team and scoreboard lookups with zero network calls."""
+    store.save(SeasonIndex.from_schedules('nba', [LAL_SCHEDULE, GS_SCHEDULE]))
+
+    games_by_date = game_checker.check_games_in_range(['lal', 'gs', 'den'], 'nba', date(2025, 10, 20), date(2025, 10, 26))
+
+    mock_payload.assert_not_called()
+    assert [(game['team_abbr'], game['date']) for games in games_by_date.values() for game in games] == [
+        ('LAL', '2025-10-20'), ('GS', '2025-10-20'), ('GS', '2025-10-22'), ('DEN', '2025-10-22'), ('LAL', '2025-10-23')
+    ]
+
+
+@pytest.mark.unit
+@mock.patch('main.build_season_index')
+def test_main_build_index(mock_build, capsys):
+    """Test that the build-index command builds each listed league."""
+    main.main(["build-index", "--league", "nba,nfl"])
+    assert [call.args[0] for call in mock_build.call_args_list] == ['nba', 'nfl']
+
+    mock_build.reset_mock()
+    with pytest.raises(SystemExit) as exit_info:
+        main.main(["build-index", "--league", "nhl"])
+    assert exit_info.value.code == 1
+    mock_build.assert_not_called()
+    assert "build-index needs --league" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+@mock.patch('main.build_season_index')
+def test_main_build_index_fails_when_a_league_fails(mock_build):
+    """Test that build-index exits with status 1 if any league's index could not be built."""
+    mock_build.side_effect = lambda league_key: None if league_key == 'nfl' else SeasonIndex(league_key, [])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main.main(["build-index", "--league", "nba,nfl"])
+
+    assert exit_info.value.code == 1
+    assert [call.args[0] for call in mock_build.call_args_list] == ['nba', 'nfl']
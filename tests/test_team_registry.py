@@ -0,0 +1,71 @@
+from gamechecker.team_registry import TeamRegistry, team_registry
+from gamechecker.game_checker import get_team_name_from_abbreviation
+from constants import SUPPORTED_LEAGUES
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query, league, expected", [
+    ("lal", "nba", "LAL"),
+    ("LAL", "nba", "LAL"),
+    ("GSW", "nba", "GS"),
+    ("gs", "nba", "GS"),
+    ("nyk", "nba", "NY"),
+    ("Golden State Warriors", "nba", "GS"),
+    ("  kansas city chiefs ", "nfl", "KC"),
+    ("cws", "mlb", "CHW"),
+    ("oak", "mlb", "ATH"),
+])
+def test_resolve(query, league, expected):
+    """Test that abbreviations, aliases and names resolve case-insensitively."""
+    assert team_registry.resolve(query, league) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query, league", [
+    ("abc", "nba"),
+    ("", "nba"),
+    (None, "nba"),
+    ("lal", "nhl"),
+    ("GSW", "mlb"),
+])
+def test_resolve_unknown(query, league):
+    """Test that unknown teams, empty input and unsupported leagues resolve to None."""
+    assert team_registry.resolve(query, league) is None
+    assert not team_registry.is_valid(query, league)
+
+
+@pytest.mark.unit
+def test_every_team_resolves_to_itself():
+    """Test that each supported team's abbreviation and name map back to it."""
+    for league, league_info in SUPPORTED_LEAGUES.items():
+        assert team_registry.teams(league) == tuple(league_info["teams"])
+
+        for name, abbr in league_info["teams"]:
+            assert team_registry.resolve(abbr.lower(), league) == abbr
+            assert team_registry.get_name(name.upper(), league) == name
+
+
+@pytest.mark.unit
+def test_alias_never_shadows_a_real_abbreviation():
+    """Test that a real abbreviation wins over an alias with the same spelling."""
+    registry = TeamRegistry(
+        leagues={"nba": {"name": "NBA", "teams": [("Golden State Warriors", "GS"), ("Sacramento Kings", "SAC")]}},
+        aliases={"nba": {"SAC": "GS"}},
+    )
+
+    assert registry.resolve("sac", "nba") == "SAC"
+
+
+@pytest.mark.unit
+def test_split_valid():
+    """Test that input is split into resolved abbreviations and invalid entries."""
+    assert team_registry.split_valid(["GSW", "abc", "bos"], "nba") == (["gs", "bos"], ["abc"])
+
+
+@pytest.mark.unit
+def test_get_team_name_from_abbreviation_uses_registry():
+    """Test that the game checker lookup accepts ESPN aliases."""
+    assert get_team_name_from_abbreviation("GSW", "nba") == "Golden State Warriors"
+    assert get_team_name_from_abbreviation("abc", "nba") is None
+    assert get_team_name_from_abbreviation("lal", "nhl") is None